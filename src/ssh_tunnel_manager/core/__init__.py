@@ -5,13 +5,66 @@ SSH Tunnel Manager - Core Package
 
 from .models import TunnelConfig
 from .config_manager import ConfigurationManager
+from .config_store import TunnelStore
+from .config_io import ImportReport, ImportFormatError
 from .tunnel_process import TunnelProcess
+from .tunnel_metrics import TunnelMetrics, MetricRollup
 from .monitor import TunnelMonitorThread
+from .tunnel_starter import TunnelStarter
+from .ssh_pool import SSHConnectionPool, PooledSession, get_pool
+from .sftp_transfer import SFTPTransferEngine, TransferStats, TransferCancelled
+from .sftp_benchmark import SFTPBenchmark, SFTPBenchmarkResult
+from .transfer_queue import TransferQueue, TransferJob
+from .transfer_resume import ResumableTransfer, ChecksumMismatch
+from .delta_sync import DeltaUploader, DeltaStats
+from .remote_file_reader import RemoteFileReader, FilePage
+from .ssh_profiles import PerformanceProfile, PROFILES, get_profile
+from .profile_benchmark import ProfileBenchmark, ProfileBenchmarkResult
+from .log_store import LogStore, LogRecord, classify_level
+from .ssh_keys import KeyDiscovery, get_key_discovery
+from .port_probe import PortProber, PortResult
+from .latency_probe import LatencyProber, LatencyStats
 from .constants import *
 
 __all__ = [
     'TunnelConfig',
     'ConfigurationManager', 
+    'TunnelStore',
+    'ImportReport',
+    'ImportFormatError',
     'TunnelProcess',
-    'TunnelMonitorThread'
+    'TunnelMetrics',
+    'MetricRollup',
+    'TunnelMonitorThread',
+    'TunnelStarter',
+    'SSHConnectionPool',
+    'PooledSession',
+    'get_pool',
+    'SFTPTransferEngine',
+    'TransferStats',
+    'TransferCancelled',
+    'SFTPBenchmark',
+    'SFTPBenchmarkResult',
+    'TransferQueue',
+    'TransferJob',
+    'ResumableTransfer',
+    'ChecksumMismatch',
+    'DeltaUploader',
+    'DeltaStats',
+    'RemoteFileReader',
+    'FilePage',
+    'PerformanceProfile',
+    'PROFILES',
+    'get_profile',
+    'ProfileBenchmark',
+    'ProfileBenchmarkResult',
+    'LogStore',
+    'LogRecord',
+    'classify_level',
+    'KeyDiscovery',
+    'get_key_discovery',
+    'PortProber',
+    'PortResult',
+    'LatencyProber',
+    'LatencyStats'
 ]
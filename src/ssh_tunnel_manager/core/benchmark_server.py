@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Benchmark Server Stand-in
+
+Pieces shared by the profile and SFTP benchmarks: an in-process paramiko
+server that stands in for sshd, its host key and credentials, and a relay
+that puts a simulated link (delay and bandwidth cap) in front of it.
+"""
+
+import collections
+import logging
+import socket
+import threading
+import time
+from typing import Optional
+
+import paramiko
+
+BENCHMARK_USERNAME = "benchmark"
+BENCHMARK_PASSWORD = "benchmark"
+_CHUNK = 32 * 1024
+
+# The stand-in's transports see a connection reset at the end of every
+# measurement; keep those out of the application log
+SERVER_LOG = __name__
+logging.getLogger(SERVER_LOG).addHandler(logging.NullHandler())
+logging.getLogger(SERVER_LOG).propagate = False
+
+_host_key: Optional[paramiko.RSAKey] = None
+_host_key_lock = threading.Lock()
+
+
+def server_host_key() -> paramiko.RSAKey:
+    """The stand-in's host key, generated once per process."""
+    global _host_key
+    with _host_key_lock:
+        if _host_key is None:
+            _host_key = paramiko.RSAKey.generate(2048)
+        return _host_key
+
+
+def _close_quietly(channel: paramiko.Channel):
+    # The client may already have torn the transport down
+    try:
+        channel.close()
+    except (OSError, EOFError, paramiko.SSHException):
+        pass
+
+
+class StandInServer(paramiko.ServerInterface):
+    """Accepts the benchmark user and runs 'source <kind>' and 'echo' commands.
+
+    payloads maps each kind a 'source' command may ask for to the bytes it
+    sends over and over until the client closes the channel.
+    """
+
+    def __init__(self, payloads: dict):
+        self.payloads = payloads
+
+    def check_auth_password(self, username, password):
+        if username == BENCHMARK_USERNAME and password == BENCHMARK_PASSWORD:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_channel_request(self, kind, chanid):
+        if kind == 'session':
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel, command):
+        command = command.decode('ascii', 'replace').split()
+        if command[:1] == ['echo']:
+            target = self._echo
+        elif command[:1] == ['source'] and len(command) == 2 and command[1] in self.payloads:
+            target = self._source
+        else:
+            return False
+        threading.Thread(target=target, args=(channel, *command[1:]), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _echo(channel):
+        try:
+            while True:
+                data = channel.recv(_CHUNK)
+                if not data:
+                    break
+                channel.sendall(data)
+        except (OSError, EOFError, paramiko.SSHException):
+            pass
+        finally:
+            _close_quietly(channel)
+
+    def _source(self, channel, kind: str):
+        # Send until the client closes the channel
+        payload = self.payloads[kind]
+        view = memoryview(payload)
+        try:
+            while not channel.closed:
+                for offset in range(0, len(payload), _CHUNK):
+                    channel.sendall(view[offset:offset + _CHUNK])
+        except (OSError, EOFError, paramiko.SSHException):
+            pass
+        finally:
+            _close_quietly(channel)
+
+
+class LinkRelay:
+    """TCP relay adding delay and a bandwidth cap in each direction."""
+
+    def __init__(self, client: socket.socket, server: socket.socket,
+                 one_way_delay: float, rate: float):
+        for source, target in ((client, server), (server, client)):
+            queue = collections.deque()
+            ready = threading.Condition()
+            threading.Thread(target=self._read, args=(source, queue, ready, one_way_delay, rate),
+                             daemon=True).start()
+            threading.Thread(target=self._write, args=(target, queue, ready), daemon=True).start()
+
+    @staticmethod
+    def _read(source, queue, ready, delay: float, rate: float):
+        next_free = time.monotonic()
+        while True:
+            try:
+                data = source.recv(65536)
+            except OSError:
+                data = b''
+            now = time.monotonic()
+            if rate:
+                # Serialisation time on the simulated link
+                next_free = max(next_free, now) + len(data) / rate
+                deliver = next_free + delay
+            else:
+                deliver = now + delay
+            with ready:
+                queue.append((deliver, data))
+                ready.notify()
+            if not data:
+                return
+
+    @staticmethod
+    def _write(target, queue, ready):
+        while True:
+            with ready:
+                while not queue:
+                    ready.wait()
+                deliver, data = queue.popleft()
+            wait = deliver - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                if not data:
+                    target.shutdown(socket.SHUT_WR)
+                    return
+                target.sendall(data)
+            except OSError:
+                return
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Tunnel Import and Export
+
+Reads and writes tunnel inventories in three formats, chosen by file
+extension:
+
+- .json: the export format, {"version": "1.0", "tunnels": {name: {...}}}
+- .jsonl / .ndjson: one tunnel object per line
+- .csv: a header row of TunnelConfig field names, then one tunnel per row
+
+JSON Lines and CSV are processed a record at a time, so a large inventory
+is never held in memory as both text and parsed objects. Every record is
+checked in a single pass and the outcome is collected in an ImportReport
+rather than printed.
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .models import TunnelConfig, SAVED_FIELDS, REQUIRED_FIELDS
+from .config_store import encode_json
+
+FORMAT_JSON = "json"
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+
+_SUFFIX_FORMATS = {'.jsonl': FORMAT_JSONL, '.ndjson': FORMAT_JSONL, '.csv': FORMAT_CSV}
+_INT_FIELDS = frozenset(f.name for f in fields(TunnelConfig) if f.type in (int, 'int'))
+_BOOL_FIELDS = frozenset(f.name for f in fields(TunnelConfig) if f.type in (bool, 'bool'))
+_TRUE_TEXT = frozenset(('1', 'true', 'yes', 'y', 'on'))
+
+# Open-file dialog filter for the supported formats
+FILE_FILTER = "Tunnel Inventories (*.json *.jsonl *.ndjson *.csv);;All Files (*)"
+
+
+class ImportFormatError(ValueError):
+    """The file as a whole could not be read as a tunnel inventory."""
+
+
+def detect_format(path: Path) -> str:
+    """Format for a file, from its extension (JSON by default)."""
+    return _SUFFIX_FORMATS.get(Path(path).suffix.lower(), FORMAT_JSON)
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import."""
+    total: int = 0  # records read
+    imported: List[str] = field(default_factory=list)
+    duplicates: List[str] = field(default_factory=list)  # skipped: name already exists
+    invalid: List[Tuple[str, str]] = field(default_factory=list)  # (record, reason)
+    elapsed: float = 0.0
+
+    @property
+    def skipped(self) -> int:
+        return len(self.duplicates) + len(self.invalid)
+
+    def summary(self) -> str:
+        """One-line result, e.g. for the activity log."""
+        message = f"Imported {len(self.imported)} configurations"
+        if self.skipped:
+            message += f", skipped {self.skipped}"
+            parts = []
+            if self.duplicates:
+                parts.append(f"{len(self.duplicates)} duplicate")
+            if self.invalid:
+                parts.append(f"{len(self.invalid)} invalid")
+            message += f" ({', '.join(parts)})"
+        return message
+
+    def details(self, limit: int = 20) -> str:
+        """Reasons for the first limit invalid records, one per line."""
+        lines = [f"{record}: {reason}" for record, reason in self.invalid[:limit]]
+        if len(self.invalid) > limit:
+            lines.append(f"... and {len(self.invalid) - limit} more")
+        return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------- #
+# Reading
+# ---------------------------------------------------------------------- #
+
+def read_records(path: Path, fmt: Optional[str] = None) -> Iterator[Tuple[str, Optional[dict], str]]:
+    """(record label, data, error) for each record of an inventory file.
+
+    data is None and error says why when a record can't be parsed.
+    Raises ImportFormatError when the file isn't an inventory at all.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt == FORMAT_JSONL:
+        return _read_jsonl(path)
+    if fmt == FORMAT_CSV:
+        return _read_csv(path)
+    return _read_json(path)
+
+
+def _read_json(path: Path) -> Iterator[Tuple[str, Optional[dict], str]]:
+    # A single JSON document; json.load (C parser) is the fastest way in
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("tunnels"), dict):
+        raise ImportFormatError("Invalid configuration file format")
+    return _json_entries(data["tunnels"])
+
+
+def _json_entries(tunnels: dict) -> Iterator[Tuple[str, Optional[dict], str]]:
+    for name, record in tunnels.items():
+        if isinstance(record, dict):
+            yield name, record, ""
+        else:
+            yield name, None, "not an object"
+
+
+def _read_jsonl(path: Path) -> Iterator[Tuple[str, Optional[dict], str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            label = f"line {number}"
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield label, None, f"invalid JSON ({e})"
+                continue
+            if isinstance(record, dict):
+                yield label, record, ""
+            else:
+                yield label, None, "not an object"
+
+
+def _read_csv(path: Path) -> Iterator[Tuple[str, Optional[dict], str]]:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        columns = [name.strip() for name in header]
+        if not REQUIRED_FIELDS.issubset(columns):
+            missing = ", ".join(sorted(REQUIRED_FIELDS.difference(columns)))
+            raise ImportFormatError(f"CSV header is missing columns: {missing}")
+        for number, row in enumerate(reader, 2):
+            if not any(row):
+                continue
+            label = f"row {number}"
+            try:
+                yield label, _csv_record(columns, row), ""
+            except ValueError as e:
+                yield label, None, str(e)
+
+
+def _csv_record(columns: List[str], row: List[str]) -> dict:
+    record = {}
+    for column, value in zip(columns, row):
+        if value == "" and column not in REQUIRED_FIELDS:
+            continue  # empty cell: field default
+        if column in _INT_FIELDS:
+            try:
+                record[column] = int(value)
+            except ValueError:
+                raise ValueError(f"{column} must be a number, got {value!r}")
+        elif column in _BOOL_FIELDS:
+            record[column] = value.strip().lower() in _TRUE_TEXT
+        else:
+            record[column] = value
+    return record
+
+
+def build_configs(records: Iterable[Tuple[str, Optional[dict], str]], existing: Set[str],
+                  overwrite: bool, report: ImportReport, keyed_by_label: bool = False
+                  ) -> Dict[str, TunnelConfig]:
+    """Check records in one pass; returns the configurations to add by name.
+
+    keyed_by_label names each configuration by its record label (the JSON
+    format's object keys) instead of its name field.
+    """
+    accepted: Dict[str, TunnelConfig] = {}
+    for label, data, error in records:
+        report.total += 1
+        if data is None:
+            report.invalid.append((label, error))
+            continue
+        missing = REQUIRED_FIELDS.difference(data)
+        if missing:
+            report.invalid.append((label, f"missing {', '.join(sorted(missing))}"))
+            continue
+        try:
+            config = TunnelConfig.from_dict(data)
+            is_valid, error_msg = config.validate()
+        except (TypeError, ValueError, AttributeError) as e:
+            # Wrong value types, e.g. a port given as text in JSON
+            is_valid, error_msg = False, f"invalid value ({e})"
+        name = label if keyed_by_label else config.name
+        if not is_valid:
+            report.invalid.append((name if keyed_by_label else f"{label} ({data.get('name', '')})", error_msg))
+            continue
+        if name in accepted or (name in existing and not overwrite):
+            report.duplicates.append(name)
+            continue
+        accepted[name] = config
+        report.imported.append(name)
+    return accepted
+
+
+# ---------------------------------------------------------------------- #
+# Writing
+# ---------------------------------------------------------------------- #
+
+def write_configs(path: Path, configs: Dict[str, TunnelConfig], fmt: Optional[str] = None):
+    """Write configurations in the format for the file's extension."""
+    fmt = fmt or detect_format(path)
+    with open(path, 'w', encoding='utf-8', newline='' if fmt == FORMAT_CSV else None) as f:
+        if fmt == FORMAT_JSONL:
+            for config in configs.values():
+                f.write(encode_json(config.to_dict()))
+                f.write("\n")
+        elif fmt == FORMAT_CSV:
+            writer = csv.writer(f)
+            writer.writerow(SAVED_FIELDS)
+            for config in configs.values():
+                writer.writerow([getattr(config, name) for name in SAVED_FIELDS])
+        else:
+            data = {
+                "version": "1.0",
+                "tunnels": {name: config.to_dict() for name, config in configs.items()}
+            }
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def import_file(path: Path, existing: Set[str], overwrite: bool = False,
+                fmt: Optional[str] = None) -> Tuple[Dict[str, TunnelConfig], ImportReport]:
+    """Read and check an inventory file; returns the configurations to add and the report."""
+    started = time.monotonic()
+    fmt = fmt or detect_format(path)
+    report = ImportReport()
+    configs = build_configs(read_records(path, fmt), existing, overwrite, report,
+                            keyed_by_label=fmt == FORMAT_JSON)
+    report.elapsed = time.monotonic() - started
+    return configs, report
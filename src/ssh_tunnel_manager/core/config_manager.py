@@ -3,43 +3,102 @@
 SSH Tunnel Manager - Configuration Management
 """
 
-import json
+import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 from PySide6.QtCore import QSettings
 
 from .models import TunnelConfig
+from .config_store import TunnelStore, default_store_path
+from .config_io import ImportFormatError, ImportReport, import_file, write_configs
 from .constants import ORGANIZATION_NAME, CONFIG_NAME
 
 
 class ConfigurationManager:
-    """Manages tunnel configurations and application settings."""
+    """Manages tunnel configurations and application settings.
     
-    def __init__(self):
+    Tunnels are kept in a TunnelStore (one row per tunnel); changes are
+    tracked per name and only changed tunnels are written. Application
+    settings stay in QSettings.
+    """
+    
+    def __init__(self, store_path: Optional[str] = None):
         self.settings = QSettings(ORGANIZATION_NAME, CONFIG_NAME)
         self.configs: Dict[str, TunnelConfig] = {}
+        try:
+            self.store = TunnelStore(store_path or default_store_path())
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Tunnel database unavailable, changes will not be saved: {e}")
+            self.store = TunnelStore(':memory:')
+        self._dirty: Set[str] = set()  # names to write
+        self._deleted: Set[str] = set()  # names to remove
+        self._batch_depth = 0
     
     def load_configurations(self) -> Dict[str, TunnelConfig]:
-        """Load configurations from settings."""
-        configs_data = self.settings.value("tunnels", {})
-        
-        if isinstance(configs_data, dict):
-            for name, config_dict in configs_data.items():
-                try:
-                    config = TunnelConfig.from_dict(config_dict)
-                    self.configs[name] = config
-                except Exception as e:
-                    print(f"Warning: Failed to load tunnel config '{name}': {e}")
+        """Load configurations from the tunnel store."""
+        self._migrate_settings()
+        for name, config_dict in self.store.load().items():
+            try:
+                config = TunnelConfig.from_dict(config_dict)
+                self.configs[name] = config
+            except Exception as e:
+                print(f"Warning: Failed to load tunnel config '{name}': {e}")
         
         return self.configs
     
-    def save_configurations(self):
-        """Save configurations to settings."""
-        configs_data = {name: config.to_dict() for name, config in self.configs.items()}
-        self.settings.setValue("tunnels", configs_data)
+    def _migrate_settings(self):
+        """Move tunnels saved by older versions (one QSettings value) into the store.
+
+        The QSettings value is only removed once the tunnels are in a
+        file-backed store. With the in-memory fallback they are loaded for
+        this session and the old value stays the saved copy.
+        """
+        configs_data = self.settings.value("tunnels", None)
+        if not isinstance(configs_data, dict):
+            return
+        if self.store.is_empty():
+            try:
+                self.store.write(configs_data)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"Warning: Failed to migrate saved tunnels, keeping the old copy: {e}")
+                return
+        if not self.store.persistent:
+            return
+        self.settings.remove("tunnels")
         self.settings.sync()
     
+    def save_configurations(self):
+        """Write changed configurations to the tunnel store in one transaction."""
+        if not self._dirty and not self._deleted:
+            return
+        changed = {name: self.configs[name].to_dict() for name in self._dirty if name in self.configs}
+        deleted = self._deleted - changed.keys()
+        self.store.write(changed, deleted)
+        self._dirty.clear()
+        self._deleted.clear()
+    
+    @contextmanager
+    def batch(self):
+        """Collect the changes made inside the block into one write."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.save_configurations()
+    
+    def mark_changed(self, name: str):
+        """Record that a configuration was modified in place, and save it."""
+        self._dirty.add(name)
+        self._changed()
+    
+    def _changed(self):
+        if self._batch_depth == 0:
+            self.save_configurations()
+    
     def add_configuration(self, config: TunnelConfig) -> tuple[bool, str]:
         """Add a new tunnel configuration."""
         # Validate configuration
@@ -52,7 +111,7 @@ class ConfigurationManager:
             return False, f"Tunnel name '{config.name}' already exists"
         
         self.configs[config.name] = config
-        self.save_configurations()
+        self.mark_changed(config.name)
         return True, ""
     
     def update_configuration(self, old_name: str, config: TunnelConfig) -> tuple[bool, str]:
@@ -69,16 +128,19 @@ class ConfigurationManager:
         # Remove old config if name changed
         if config.name != old_name and old_name in self.configs:
             del self.configs[old_name]
+            self._deleted.add(old_name)
         
         self.configs[config.name] = config
-        self.save_configurations()
+        self.mark_changed(config.name)
         return True, ""
     
     def delete_configuration(self, name: str) -> bool:
         """Delete a tunnel configuration."""
         if name in self.configs:
             del self.configs[name]
-            self.save_configurations()
+            self._dirty.discard(name)
+            self._deleted.add(name)
+            self._changed()
             return True
         return False
     
@@ -95,68 +157,36 @@ class ConfigurationManager:
         return {name: config for name, config in self.configs.items() if config.auto_start}
     
     def export_configurations(self, file_path: Path) -> tuple[bool, str]:
-        """Export configurations to JSON file."""
+        """Export configurations to a JSON, JSON Lines (.jsonl) or CSV (.csv) file."""
         try:
-            data = {
-                "version": "1.0",
-                "tunnels": {name: config.to_dict() for name, config in self.configs.items()}
-            }
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
+            write_configs(file_path, self.configs)
             return True, f"Exported {len(self.configs)} configurations to {file_path}"
         
         except Exception as e:
             return False, f"Export failed: {str(e)}"
     
     def import_configurations(self, file_path: Path, overwrite: bool = False) -> tuple[bool, str]:
-        """Import configurations from JSON file."""
+        """Import configurations from a JSON, JSON Lines (.jsonl) or CSV (.csv) file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if not isinstance(data, dict) or "tunnels" not in data:
-                return False, "Invalid configuration file format"
-            
-            imported_count = 0
-            skipped_count = 0
-            
-            for name, config_dict in data["tunnels"].items():
-                try:
-                    config = TunnelConfig.from_dict(config_dict)
-                    
-                    # Validate configuration
-                    is_valid, error_msg = config.validate()
-                    if not is_valid:
-                        print(f"Warning: Skipping invalid config '{name}': {error_msg}")
-                        skipped_count += 1
-                        continue
-                    
-                    # Check for duplicates
-                    if name in self.configs and not overwrite:
-                        print(f"Warning: Skipping duplicate config '{name}' (use overwrite=True to replace)")
-                        skipped_count += 1
-                        continue
-                    
-                    self.configs[name] = config
-                    imported_count += 1
-                
-                except Exception as e:
-                    print(f"Warning: Failed to import config '{name}': {e}")
-                    skipped_count += 1
-            
-            if imported_count > 0:
-                self.save_configurations()
-            
-            message = f"Imported {imported_count} configurations"
-            if skipped_count > 0:
-                message += f", skipped {skipped_count}"
-            
-            return True, message
-        
+            report = self.import_report(file_path, overwrite)
+        except ImportFormatError as e:
+            return False, str(e)
         except Exception as e:
             return False, f"Import failed: {str(e)}"
+        return True, report.summary()
+    
+    def import_report(self, file_path: Path, overwrite: bool = False) -> ImportReport:
+        """Import configurations and return what was imported, skipped and why.
+        
+        Raises ImportFormatError (or OSError/ValueError) when the file
+        can't be read as an inventory; nothing is imported then.
+        """
+        configs, report = import_file(file_path, set(self.configs), overwrite)
+        # All imported tunnels are written in one transaction
+        with self.batch():
+            self.configs.update(configs)
+            self._dirty.update(configs)
+        return report
     
     def get_default_ssh_key_path(self) -> Optional[str]:
         """Get the default SSH key path from settings."""
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Tunnel Configuration Store
+
+SQLite table with one row per tunnel, so saving a change writes only the
+tunnels that changed instead of re-serializing every configuration. The
+database runs in WAL mode: a commit appends to the write-ahead log rather
+than rewriting database pages in place, which keeps small edits cheap.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable
+
+from .constants import CONFIG_DB_NAME
+
+# One encoder shared by every row and export record; json.dumps() with
+# options builds a new one per call
+encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def default_store_path() -> str:
+    """Path of the tunnel database in the user's home directory."""
+    return str(Path.home() / CONFIG_DB_NAME)
+
+
+class TunnelStore:
+    """Tunnel configurations (as to_dict() dicts) keyed by name."""
+
+    def __init__(self, path: str):
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints; a crash can lose the
+        # last commit but never corrupts the database
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tunnels (name TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def load(self) -> Dict[str, dict]:
+        """Every stored configuration."""
+        configs = {}
+        for name, data in self._db.execute("SELECT name, data FROM tunnels"):
+            try:
+                configs[name] = json.loads(data)
+            except ValueError as e:
+                print(f"Warning: Failed to read stored tunnel config '{name}': {e}")
+        return configs
+
+    @property
+    def persistent(self) -> bool:
+        """False for an in-memory store, whose contents are lost at exit."""
+        return self.path != ':memory:'
+
+    def is_empty(self) -> bool:
+        return self._db.execute("SELECT 1 FROM tunnels LIMIT 1").fetchone() is None
+
+    def write(self, changed: Dict[str, dict], deleted: Iterable[str] = ()):
+        """Delete and upsert configurations in a single transaction."""
+        with self._db:
+            self._db.executemany("DELETE FROM tunnels WHERE name = ?", ((name,) for name in deleted))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO tunnels (name, data) VALUES (?, ?)",
+                ((name, encode_json(data)) for name, data in changed.items())
+            )
+
+    def close(self):
+        self._db.close()
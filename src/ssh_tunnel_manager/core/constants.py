@@ -32,16 +32,34 @@ APP_NAME = "SSH Tunnel Manager"
 APP_VERSION = "1.0"
 ORGANIZATION_NAME = "SSHTunnelManager"
 CONFIG_NAME = "Config"
+CONFIG_DB_NAME = ".ssh_tunnel_manager/tunnels.db"  # under the user's home directory
 
 # Default ports for services
 DEFAULT_SSH_PORT = 22
 DEFAULT_RTSP_PORT = 554
 DEFAULT_LOCAL_RTSP_PORT = 8554
 
+# SSH key discovery (cached; see core.ssh_keys)
+SSH_DIR_NAME = ".ssh"  # under the user's home directory
+DEFAULT_SSH_KEY_NAMES = ('id_rsa', 'id_ed25519', 'id_ecdsa', 'id_dsa')  # in order of preference
+KEY_RECHECK_INTERVAL = 2.0  # seconds a cached key lookup is trusted before re-checking the disk
+
 # Common service ports for testing
 HTTP_PORTS = [80, 8080, 3000, 5000, 8000, 9000]
 HTTPS_PORTS = [443, 8443]
 RTSP_PORTS = [554, 8554]
+CONNECTION_TEST_TIMEOUT = 3  # seconds per step of a tunnel test (connect, HTTP request, ...)
+CONNECTION_TEST_MAX_WORKERS = 16  # tunnels tested at once by "Test All"
+
+# Port scanner (non-blocking connects; see core.port_probe)
+PORT_PROBE_WINDOW = 256  # connects in flight at once
+PORT_PROBE_MIN_TIMEOUT = 0.25  # seconds; floor for the RTT-based probe timeout
+SCAN_BATCH_INTERVAL = 0.1  # seconds results are collected before being handed to the dialog
+
+# Latency prober (ICMP echo or TCP connect; see core.latency_probe)
+PING_INTERVAL = 1.0  # seconds between rounds
+PING_TIMEOUT = 2.0  # seconds a round waits for replies
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)  # histogram bucket edges, ms
 
 # UI Constants
 CONSOLE_FONT = "Consolas"
@@ -58,13 +76,95 @@ TERMINAL_STYLE = """
     }
 """
 
+# Terminal output is buffered and drawn at most once per interval
+TERMINAL_FLUSH_INTERVAL = 33  # ms (~30 frames per second)
+TERMINAL_MAX_BLOCKS = 5000  # lines kept in the terminal view
+TERMINAL_MAX_PENDING = 256 * 1024  # characters drawn per frame; older output in a burst is skipped
+
+# Activity log store (ring buffer + rotating JSON-lines file)
+LOG_STORE_CAPACITY = 50000  # records kept in memory
+LOG_DIR_NAME = ".ssh_tunnel_manager/logs"  # under the user's home directory
+LOG_FILE_NAME = "activity.jsonl"
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+LOG_SEARCH_DELAY = 150  # ms of typing pause before a search runs
+
 # Timeouts and intervals
 SSH_TIMEOUT = 30
 PROCESS_START_DELAY = 1
 PROCESS_ESTABLISH_DELAY = 2
+PROCESS_READY_TIMEOUT = 30
+PROCESS_READY_POLL_INTERVAL = 0.25
 MONITOR_INTERVAL = 2
+MONITOR_STARTING_INTERVAL = 0.5
+MONITOR_MAX_INTERVAL = 16
+MONITOR_BACKOFF_FACTOR = 2
+MONITOR_MAX_CONCURRENT_PROBES = 16
 INPUT_HIDE_DELAY = 2000
 
+# Tunnel metrics (latency/liveness history; see core.tunnel_metrics)
+METRICS_CONNECT_TIMEOUT = 1.0  # seconds a sample waits for the SSH server or local port
+METRICS_CHECK_REUSE = 1.0  # seconds a health check's result stands in for a sample's check
+# Samples are taken by the monitor's probes, every MONITOR_INTERVAL to
+# MONITOR_MAX_INTERVAL seconds, so most 1 s buckets stay empty and charts
+# join the samples either side of them
+METRICS_ROLLUPS = (  # (rollup, seconds per bucket, buckets kept)
+    ("1s", 1, 120),  # last 2 minutes
+    ("1m", 60, 120),  # last 2 hours
+    ("1h", 3600, 48),  # last 2 days
+)
+DASHBOARD_REFRESH_INTERVAL = 1000  # ms between sparkline repaints while the dashboard shows
+DASHBOARD_MAX_SPARKLINES = 8  # running tunnels charted on the dashboard
+
+# In-process SSH engine (keepalive matches ServerAliveInterval=30)
+ENGINE_KEEPALIVE_INTERVAL = 30
+ENGINE_WORKER_THREADS = 8
+ENGINE_BUFFER_SIZE = 64 * 1024
+ENGINE_WRITE_BUFFER_LIMIT = 256 * 1024  # bytes queued for a slow peer before its source is paused
+ENGINE_WINDOW_POLL_INTERVAL = 0.02  # seconds between sends to a channel with a full window
+
+# SSH connection pool (file transfers, listings, key deployment)
+POOL_IDLE_TIMEOUT = 300
+POOL_HEALTH_CHECK_INTERVAL = 15
+POOL_HEALTH_CHECK_TIMEOUT = 5  # seconds an idle connection has to answer a keepalive
+POOL_REAP_INTERVAL = 30
+POOL_MAX_IDLE_SFTP = 4
+
+# SFTP transfer engine
+SFTP_BLOCK_SIZE = 64 * 1024  # bytes per read request (largest every OpenSSH version serves)
+SFTP_WRITE_BLOCK_SIZE = 128 * 1024  # bytes per pipelined write request
+SFTP_MAX_REQUESTS = 64  # outstanding read requests per file
+SFTP_WINDOW_SIZE = 8 * 1024 * 1024  # SSH channel window for SFTP sessions
+SFTP_PROGRESS_INTERVAL = 0.2
+TRANSFER_PARALLEL_CHANNELS = 4  # SFTP channels used by the transfer queue
+SFTP_VERIFY_CHUNK_SIZE = 8 * 1024 * 1024  # bytes per checksum when resuming/verifying
+SFTP_RESUME_MIN_SIZE = 16 * 1024 * 1024  # smaller files are just sent again
+
+# Remote directory listings (SFTP browser)
+LISTING_BATCH_SIZE = 1000  # entries per batch handed to the view
+LISTING_PAGE_SIZE = 500  # rows the view adds each time it scrolls to the end
+LISTING_CACHE_TTL = 30  # seconds a cached listing is reused when navigating
+LISTING_CACHE_MAX_PATHS = 64
+
+# Remote file viewer (ranged reads through a block cache)
+VIEWER_BLOCK_SIZE = 64 * 1024  # bytes per cached block / read request
+VIEWER_CACHE_BLOCKS = 64  # cached blocks per open file (4 MB)
+VIEWER_PAGE_SIZE = 128 * 1024  # bytes shown per page
+VIEWER_FOLLOW_INTERVAL = 1000  # ms between size checks when following
+VIEWER_FOLLOW_MAX_LINES = 10000  # lines kept on screen when following
+
+# Performance profile benchmark (local SSH server stand-in)
+BENCHMARK_PAYLOAD_SIZE = 32 * 1024 * 1024  # most bytes downloaded per profile
+BENCHMARK_MAX_SECONDS = 4  # throughput measurement stops after this long
+BENCHMARK_ROUND_TRIPS = 40  # small echo messages per profile
+SFTP_BENCHMARK_FILE_SIZE = 24 * 1024 * 1024  # file sent each way by the SFTP benchmark
+
+# Delta-sync uploads (rsync-style block matching)
+DELTA_MIN_FILE_SIZE = 64 * 1024  # smaller files are uploaded in full
+DELTA_MIN_BLOCK_SIZE = 2 * 1024
+DELTA_MAX_BLOCK_SIZE = 64 * 1024
+DELTA_MAX_LITERAL_RATIO = 0.5  # upload in full when more than this much changed
+
 # File extensions
 CONFIG_FILE_EXTENSION = ".json"
 BACKUP_FILE_EXTENSION = ".bak"
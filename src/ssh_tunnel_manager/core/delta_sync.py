@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Delta-Sync Uploads
+
+Uploads a file that already exists on the server by sending only the parts
+that changed, rsync style:
+
+1. The server splits its copy into blocks and reports a rolling (Adler-32)
+   and a strong (BLAKE2b) checksum per block. This runs as a small Python
+   helper over an exec channel.
+2. The local file is scanned with a rolling checksum; every window that
+   matches a remote block becomes a "copy block" instruction, everything
+   else is sent as literal data.
+3. The helper rebuilds the file from the old copy and the instructions into
+   a temporary file, checks its SHA-256 against the local file and renames
+   it over the original.
+
+Servers without python3 fall back to streaming the remote file and hashing
+it locally; blocks that differ at the same offset are then rewritten in
+place over SFTP. That covers in-place edits but not inserted or removed
+data, which shifts every following block.
+"""
+
+import hashlib
+import logging
+import math
+import mmap
+import os
+import shlex
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import paramiko
+
+from .constants import (
+    DELTA_MIN_BLOCK_SIZE, DELTA_MAX_BLOCK_SIZE, DELTA_MIN_FILE_SIZE,
+    DELTA_MAX_LITERAL_RATIO, SSH_TIMEOUT
+)
+from .sftp_transfer import ProgressCallback, SFTPTransferEngine, TransferCancelled, TransferStats
+
+_ADLER_MOD = 65521
+_SIGNATURE = struct.Struct('>I16s')  # Adler-32, BLAKE2b-128
+_LITERAL_CHUNK = 256 * 1024
+
+# Runs on the server: "sig PATH BLOCK" prints block signatures, "patch PATH
+# BLOCK" rebuilds PATH from copy/literal instructions read from stdin.
+_REMOTE_HELPER = r'''
+import hashlib, os, struct, sys, tempfile, zlib
+mode, path, block = sys.argv[1], sys.argv[2], int(sys.argv[3])
+if mode == "sig":
+    out = sys.stdout.buffer
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(block)
+            if len(data) < block:
+                break
+            out.write(struct.pack(">I", zlib.adler32(data)))
+            out.write(hashlib.blake2b(data, digest_size=16).digest())
+    sys.exit(0)
+
+def read(n):
+    data = sys.stdin.buffer.read(n)
+    if len(data) != n:
+        sys.exit("delta stream ended early")
+    return data
+
+fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix="." + os.path.basename(path) + ".")
+digest = hashlib.sha256()
+try:
+    with open(path, "rb") as old, os.fdopen(fd, "wb") as new:
+        while True:
+            op = read(1)
+            if op == b"E":
+                expected = read(32)
+                break
+            if op == b"L":
+                data = read(struct.unpack(">I", read(4))[0])
+                new.write(data)
+                digest.update(data)
+                continue
+            start, count = struct.unpack(">II", read(8))
+            old.seek(start * block)
+            for _ in range(count):
+                data = old.read(block)
+                new.write(data)
+                digest.update(data)
+    if digest.digest() != expected:
+        sys.exit("checksum mismatch after applying delta")
+    os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+    os.replace(tmp, path)
+except BaseException:
+    if os.path.exists(tmp):
+        os.unlink(tmp)
+    raise
+sys.stdout.write("OK\n")
+'''
+
+
+@dataclass
+class DeltaStats(TransferStats):
+    """Outcome of a delta upload; bytes_done counts local bytes processed."""
+    sent_bytes: int = 0  # literal data actually sent
+    matched_bytes: int = 0  # data reused from the remote copy
+    method: str = ""  # 'helper', 'stream' or 'full'
+
+
+def block_size_for(size: int) -> int:
+    """Block size for a file of the given size (square root, like rsync)."""
+    block = int(math.sqrt(size)) // 1024 * 1024
+    return max(DELTA_MIN_BLOCK_SIZE, min(DELTA_MAX_BLOCK_SIZE, block))
+
+
+class _LiteralBudgetExceeded(Exception):
+    """Too little of the file matched for a delta to be worthwhile."""
+
+
+class DeltaUploader:
+    """Send only the changed blocks of files that already exist remotely.
+
+    client is the SSHClient the SFTP session belongs to; it runs the remote
+    helper. Files smaller than DELTA_MIN_FILE_SIZE, files that don't exist
+    remotely yet and files that share too little with the remote copy are
+    uploaded in full with the engine.
+    """
+
+    METHOD_HELPER = "helper"
+    METHOD_STREAM = "stream"
+    METHOD_FULL = "full"
+
+    def __init__(self, engine: Optional[SFTPTransferEngine] = None):
+        self.engine = engine or SFTPTransferEngine()
+        self.logger = logging.getLogger(__name__)
+        # Transports whose server can't run the helper, so it is tried once
+        self._no_helper = set()
+
+    def upload(self, sftp: paramiko.SFTPClient, local_path: str, remote_path: str,
+               client: Optional[paramiko.SSHClient] = None,
+               progress: Optional[ProgressCallback] = None,
+               is_cancelled: Optional[Callable[[], bool]] = None) -> DeltaStats:
+        """Upload local_path over remote_path, sending only what changed."""
+        total = os.path.getsize(local_path)
+        try:
+            remote_size = sftp.stat(remote_path).st_size or 0
+        except IOError:
+            remote_size = 0
+
+        stats = None
+        if total >= DELTA_MIN_FILE_SIZE and remote_size >= DELTA_MIN_FILE_SIZE:
+            block = block_size_for(remote_size)
+            try:
+                stats = self._upload_with_helper(client, local_path, remote_path, block,
+                                                 progress, is_cancelled)
+                if stats is None:
+                    stats = self._upload_in_place(sftp, local_path, remote_path, block,
+                                                  progress, is_cancelled)
+            except _LiteralBudgetExceeded:
+                self.logger.info(f"{local_path} differs too much for a delta upload")
+
+        if stats is None:
+            full = self.engine.upload(sftp, local_path, remote_path, progress, is_cancelled)
+            stats = DeltaStats(total_bytes=total, bytes_done=full.bytes_done,
+                               started=full.started, finished=full.finished,
+                               sent_bytes=full.bytes_done, method=self.METHOD_FULL)
+        else:
+            self.logger.info(
+                f"Delta upload of {local_path}: sent {stats.sent_bytes} of {total} bytes "
+                f"({stats.method})"
+            )
+        return stats
+
+    # ------------------------------------------------------------------ #
+    # Remote helper
+    # ------------------------------------------------------------------ #
+
+    def _helper_command(self, mode: str, remote_path: str, block: int) -> str:
+        return 'python3 -c {} {} {} {}'.format(
+            shlex.quote(_REMOTE_HELPER), mode, shlex.quote(remote_path), block
+        )
+
+    def _upload_with_helper(self, client, local_path: str, remote_path: str, block: int,
+                            progress, is_cancelled) -> Optional[DeltaStats]:
+        """Delta upload through the remote helper; None if it can't run there."""
+        transport = client.get_transport() if client is not None else None
+        if transport is None or id(transport) in self._no_helper:
+            return None
+
+        signatures = self._remote_signatures(client, remote_path, block)
+        if signatures is None:
+            self._no_helper.add(id(transport))
+            return None
+
+        total = os.path.getsize(local_path)
+        stats = DeltaStats(total_bytes=total, method=self.METHOD_HELPER)
+        reporter = self.engine.make_reporter(stats, progress)
+
+        channel = transport.open_session(timeout=SSH_TIMEOUT)
+        try:
+            channel.exec_command(self._helper_command('patch', remote_path, block))
+            with open(local_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                def send_literal(start: int, end: int):
+                    for position in range(start, end, _LITERAL_CHUNK):
+                        piece = data[position:min(end, position + _LITERAL_CHUNK)]
+                        channel.sendall(b'L' + struct.pack('>I', len(piece)) + piece)
+                        stats.sent_bytes += len(piece)
+
+                def send_copy(first_block: int, count: int):
+                    channel.sendall(b'C' + struct.pack('>II', first_block, count))
+                    stats.matched_bytes += count * block
+
+                def advance(position: int):
+                    if is_cancelled and is_cancelled():
+                        raise TransferCancelled()
+                    stats.bytes_done = position
+                    reporter()
+
+                # A file that barely matches gives up before sending much
+                self._match(data, block, signatures, send_literal, send_copy, advance,
+                            int(total * DELTA_MAX_LITERAL_RATIO))
+                channel.sendall(b'E' + hashlib.sha256(data).digest())
+            channel.shutdown_write()
+
+            result = self._read_all(channel)
+            if channel.recv_exit_status() != 0 or not result.startswith(b'OK'):
+                error = self._read_all(channel, stderr=True).decode('utf-8', 'replace').strip()
+                raise IOError(f"Remote delta apply failed: {error.splitlines()[-1] if error else 'unknown error'}")
+        finally:
+            channel.close()
+
+        stats.bytes_done = total
+        stats.finished = time.monotonic()
+        reporter(force=True)
+        return stats
+
+    def _remote_signatures(self, client, remote_path: str, block: int):
+        """{weak: [(block_index, strong), ...]} from the server, or None."""
+        try:
+            _, stdout, _ = client.exec_command(
+                self._helper_command('sig', remote_path, block), timeout=SSH_TIMEOUT
+            )
+            raw = stdout.read()
+            exit_status = stdout.channel.recv_exit_status()
+        except Exception as e:
+            self.logger.debug(f"Remote signature helper failed: {e}")
+            return None
+        if exit_status != 0 or len(raw) % _SIGNATURE.size:
+            self.logger.info("Server cannot run the delta helper; comparing blocks in place")
+            return None
+
+        signatures: Dict[int, List[tuple]] = {}
+        for index, (weak, strong) in enumerate(_SIGNATURE.iter_unpack(raw)):
+            signatures.setdefault(weak, []).append((index, strong))
+        return signatures
+
+    @staticmethod
+    def _read_all(channel: paramiko.Channel, stderr: bool = False) -> bytes:
+        receive = channel.recv_stderr if stderr else channel.recv
+        chunks = []
+        while True:
+            data = receive(65536)
+            if not data:
+                return b''.join(chunks)
+            chunks.append(data)
+
+    @staticmethod
+    def _match(data, block: int, signatures: Dict[int, List[tuple]],
+               send_literal: Callable[[int, int], None],
+               send_copy: Callable[[int, int], None],
+               advance: Callable[[int], None], max_literal: int):
+        """Scan data with a rolling checksum and emit copy/literal instructions.
+
+        The Adler-32 of a fresh window comes from zlib; after a miss the
+        window slides one byte at a time with the rolling update, so the
+        Python-level work is proportional to the changed data. Raises
+        _LiteralBudgetExceeded as soon as more than max_literal bytes
+        would have to be sent.
+        """
+        size = len(data)
+        last_window = size - block  # last offset a whole block starts at
+        literal_start = literal_sent = 0
+        run_first = run_count = 0
+        position = 0
+        a = b = None
+
+        while position <= last_window:
+            if a is None:
+                weak = zlib.adler32(data[position:position + block])
+                a, b = weak & 0xffff, weak >> 16
+            match = None
+            candidates = signatures.get((b << 16) | a)
+            if candidates:
+                strong = hashlib.blake2b(data[position:position + block], digest_size=16).digest()
+                for index, candidate in candidates:
+                    if candidate == strong:
+                        match = index
+                        if index == run_first + run_count:
+                            break  # continues the current run
+
+            if match is not None:
+                if literal_start < position:
+                    if run_count:
+                        send_copy(run_first, run_count)
+                        run_count = 0
+                    send_literal(literal_start, position)
+                    literal_sent += position - literal_start
+                if run_count and match == run_first + run_count:
+                    run_count += 1
+                else:
+                    if run_count:
+                        send_copy(run_first, run_count)
+                    run_first, run_count = match, 1
+                position += block
+                literal_start = position
+                a = None
+                advance(position)
+                continue
+
+            if position >= last_window:
+                break
+            if literal_sent + position - literal_start > max_literal:
+                raise _LiteralBudgetExceeded()
+            # Slide until the weak checksum hits, at most one block at a time
+            # so cancellation and the budget are still checked regularly
+            stop = min(last_window, position + block)
+            while position < stop:
+                outgoing = data[position]
+                incoming = data[position + block]
+                a = (a - outgoing + incoming) % _ADLER_MOD
+                b = (b - block * outgoing + a - 1) % _ADLER_MOD
+                position += 1
+                if ((b << 16) | a) in signatures:
+                    break
+            advance(position)
+
+        if run_count:
+            send_copy(run_first, run_count)
+        if literal_start < size:
+            if literal_sent + size - literal_start > max_literal:
+                raise _LiteralBudgetExceeded()
+            send_literal(literal_start, size)
+
+    # ------------------------------------------------------------------ #
+    # SFTP-only fallback
+    # ------------------------------------------------------------------ #
+
+    def _upload_in_place(self, sftp, local_path: str, remote_path: str, block: int,
+                         progress, is_cancelled) -> DeltaStats:
+        """Stream the remote file, then rewrite the blocks that differ in place."""
+        total = os.path.getsize(local_path)
+        stats = DeltaStats(total_bytes=total, method=self.METHOD_STREAM)
+        reporter = self.engine.make_reporter(stats, progress)
+        remote_size = sftp.stat(remote_path).st_size or 0
+        compared = min(total, remote_size)
+
+        changed = []  # (start, end) ranges to rewrite
+        with open(local_path, 'rb') as local_file:
+            buffered = b''
+            position = 0
+            for data in self.engine.read_range(sftp, remote_path, 0, compared):
+                if is_cancelled and is_cancelled():
+                    raise TransferCancelled()
+                buffered += data
+                while len(buffered) >= block or (buffered and position + len(buffered) == compared):
+                    remote_block, buffered = buffered[:block], buffered[block:]
+                    local_block = local_file.read(len(remote_block))
+                    if local_block != remote_block:
+                        end = position + len(remote_block)
+                        if changed and changed[-1][1] == position:
+                            changed[-1] = (changed[-1][0], end)
+                        else:
+                            changed.append((position, end))
+                    position += len(remote_block)
+                    stats.bytes_done = position
+                    reporter()
+        if total > compared:
+            changed.append((compared, total))
+
+        sent = sum(end - start for start, end in changed)
+        if sent > total * DELTA_MAX_LITERAL_RATIO:
+            raise _LiteralBudgetExceeded()
+
+        with open(local_path, 'rb') as local_file, sftp.open(remote_path, 'r+b') as remote_file:
+            remote_file.MAX_REQUEST_SIZE = self.engine.write_block_size
+            remote_file.set_pipelined(True)
+            for start, end in changed:
+                local_file.seek(start)
+                remote_file.seek(start)
+                position = start
+                while position < end:
+                    if is_cancelled and is_cancelled():
+                        raise TransferCancelled()
+                    piece = local_file.read(min(self.engine.write_block_size, end - position))
+                    remote_file.write(piece)
+                    position += len(piece)
+                    stats.sent_bytes += len(piece)
+        if remote_size != total:
+            sftp.truncate(remote_path, total)
+
+        stats.matched_bytes = total - stats.sent_bytes
+        stats.bytes_done = total
+        stats.finished = time.monotonic()
+        reporter(force=True)
+        return stats
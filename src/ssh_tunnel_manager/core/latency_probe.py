@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Latency Prober
+
+Measures round-trip latency to many hosts at once from inside the process,
+instead of timing a ping subprocess per echo (whose start-up cost ends up
+in the figure). Each round sends one probe to every host and waits for the
+replies on a single selector:
+
+- ICMP echo over an unprivileged datagram socket where the system allows
+  it (Linux with net.ipv4.ping_group_range covering the user, macOS)
+- otherwise a TCP connect to the host's SSH port, timing the handshake
+  (a refusal is an answer too)
+
+Times come from time.perf_counter_ns() taken right around the send and
+receive, so they resolve well below a millisecond. Statistics are kept as
+running sums and histogram counters, so a continuous probe uses constant
+memory.
+"""
+
+import errno
+import os
+import selectors
+import socket
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .constants import DEFAULT_SSH_PORT, PING_INTERVAL, PING_TIMEOUT, LATENCY_BUCKETS
+
+METHOD_AUTO = "auto"
+METHOD_ICMP = "icmp"
+METHOD_TCP = "tcp"
+
+_ICMP_TYPES = {  # family -> (protocol, echo request, echo reply)
+    socket.AF_INET: (socket.IPPROTO_ICMP, 8, 0),
+    socket.AF_INET6: (getattr(socket, 'IPPROTO_ICMPV6', 58), 128, 129),
+}
+_PAYLOAD = b'ssh-tunnel-manager'
+# connect_ex() results meaning "connecting, wait for writability"
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}  # 10035: WSAEWOULDBLOCK
+_REFUSED = {errno.ECONNREFUSED, 10061}  # 10061: WSAECONNREFUSED
+
+
+def parse_target(text: str) -> Tuple[str, int]:
+    """(host, port) from 'host', 'host:port' or '[v6 address]:port'."""
+    text = text.strip()
+    if text.startswith('['):
+        host, _, rest = text[1:].partition(']')
+        port = rest[1:] if rest.startswith(':') else ""
+    elif text.count(':') == 1:
+        host, port = text.split(':')
+    else:
+        host, port = text, ""
+    return host, int(port) if port.isdigit() else DEFAULT_SSH_PORT
+
+
+def echo_packet(family: int, sequence: int, identifier: int = 0) -> bytes:
+    """ICMP echo request; the kernel fills in the identifier (and IPv6 checksum)."""
+    request = _ICMP_TYPES[family][1]
+    header = struct.pack('!BBHHH', request, 0, 0, identifier, sequence)
+    if family == socket.AF_INET:
+        header = struct.pack('!BBHHH', request, 0, _checksum(header + _PAYLOAD), identifier, sequence)
+    return header + _PAYLOAD
+
+
+def parse_echo_reply(family: int, data: bytes) -> Optional[int]:
+    """Sequence number of an echo reply, or None for any other packet."""
+    # macOS hands IPv4 datagram sockets the IP header as well; Linux doesn't
+    if family == socket.AF_INET and len(data) >= 20 and data[0] >> 4 == 4:
+        data = data[(data[0] & 0x0F) * 4:]
+    if len(data) < 8:
+        return None
+    kind, _, _, _, sequence = struct.unpack('!BBHHH', data[:8])
+    return sequence if kind == _ICMP_TYPES[family][2] else None
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b'\0'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _bucket(value: float) -> int:
+    for index, edge in enumerate(LATENCY_BUCKETS):
+        if value < edge:
+            return index
+    return len(LATENCY_BUCKETS)
+
+
+def bucket_labels() -> List[str]:
+    """Labels of the histogram buckets, in order (milliseconds)."""
+    edges = list(LATENCY_BUCKETS)
+    labels = [f"<{edges[0]:g}"]
+    labels.extend(f"{low:g}-{high:g}" for low, high in zip(edges, edges[1:]))
+    labels.append(f">={edges[-1]:g}")
+    return labels
+
+
+@dataclass
+class LatencyStats:
+    """Running latency statistics for one host (times in milliseconds)."""
+    host: str  # as given; 'host:port' when the port isn't the SSH default
+    port: int = DEFAULT_SSH_PORT
+    method: str = ""  # METHOD_ICMP or METHOD_TCP once resolved
+    address: str = ""
+    error: str = ""  # set when the host can't be probed at all
+    sent: int = 0
+    received: int = 0
+    min_rtt: float = 0.0
+    max_rtt: float = 0.0
+    total_rtt: float = 0.0
+    jitter_total: float = 0.0  # sum of differences between consecutive RTTs
+    last_rtt: Optional[float] = None
+    rtt_histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    jitter_histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    @property
+    def lost(self) -> int:
+        return self.sent - self.received
+
+    @property
+    def loss(self) -> float:
+        """Percentage of probes without a reply."""
+        return self.lost / self.sent * 100 if self.sent else 0.0
+
+    @property
+    def avg_rtt(self) -> float:
+        return self.total_rtt / self.received if self.received else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """Mean difference between consecutive RTTs."""
+        return self.jitter_total / (self.received - 1) if self.received > 1 else 0.0
+
+    @property
+    def method_text(self) -> str:
+        return "ICMP" if self.method == METHOD_ICMP else f"TCP port {self.port}"
+
+    def add(self, rtt: Optional[float]):
+        """Record one probe: its RTT, or None when it got no reply."""
+        self.sent += 1
+        if rtt is None:
+            return
+        if not self.received or rtt < self.min_rtt:
+            self.min_rtt = rtt
+        self.max_rtt = max(self.max_rtt, rtt)
+        self.received += 1
+        self.total_rtt += rtt
+        self.rtt_histogram[_bucket(rtt)] += 1
+        if self.last_rtt is not None:
+            difference = abs(rtt - self.last_rtt)
+            self.jitter_total += difference
+            self.jitter_histogram[_bucket(difference)] += 1
+        self.last_rtt = rtt
+
+
+@dataclass
+class _Target:
+    stats: LatencyStats
+    host: str
+    family: int = socket.AF_INET
+    sockaddr: tuple = ()
+
+
+class LatencyProber:
+    """Probes a set of hosts in rounds, one probe per host per round.
+
+    targets are (host, port) pairs; the port is used by the TCP method.
+    method is METHOD_AUTO (ICMP where the system allows unprivileged
+    echo sockets, TCP otherwise), METHOD_ICMP or METHOD_TCP.
+    """
+
+    def __init__(self, targets: Iterable[Tuple[str, int]], timeout: float = PING_TIMEOUT,
+                 method: str = METHOD_AUTO):
+        self.timeout = timeout
+        self.method = method
+        self.stats: Dict[str, LatencyStats] = {}
+        self._targets: List[_Target] = []
+        self._icmp: Dict[int, Optional[socket.socket]] = {}
+        self._sequence = 0
+        self._resolved = False
+        for host, port in targets:
+            label = host if port == DEFAULT_SSH_PORT else f"{host}:{port}"
+            if label not in self.stats:
+                self.stats[label] = LatencyStats(label, port)
+                self._targets.append(_Target(self.stats[label], host))
+
+    def resolve(self):
+        """Look every host up and pick its method; failures are kept in stats.error.
+
+        Hosts that can't be probed are left out of the rounds.
+        """
+        probed = []
+        for target in self._targets:
+            stats = target.stats
+            try:
+                target.family, _, _, _, target.sockaddr = socket.getaddrinfo(
+                    target.host, stats.port, type=socket.SOCK_STREAM)[0]
+            except OSError as e:
+                stats.error = f"cannot resolve: {e}"
+                continue
+            stats.address = target.sockaddr[0]
+            stats.method = METHOD_TCP
+            if self.method != METHOD_TCP and self._icmp_socket(target.family) is not None:
+                stats.method = METHOD_ICMP
+            elif self.method == METHOD_ICMP:
+                stats.error = "ICMP echo sockets are not available to this user"
+                continue
+            probed.append(target)
+        self._targets = probed
+        self._resolved = True
+
+    def probe_round(self) -> List[Tuple[str, Optional[float]]]:
+        """Probe every host once, concurrently; returns (host, RTT in ms or None)."""
+        if not self._resolved:
+            self.resolve()
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        selector = selectors.DefaultSelector()
+        sent_at: Dict[int, int] = {}  # target index -> perf_counter_ns at send
+        rtts: Dict[int, float] = {}
+        echo_waiting: Dict[Tuple[int, str], List[int]] = {}  # (family, address) -> target indexes
+        connecting: Dict[socket.socket, int] = {}
+        for family, sock in self._icmp.items():
+            if sock is not None:
+                selector.register(sock, selectors.EVENT_READ, family)
+        try:
+            for index, target in enumerate(self._targets):
+                if target.stats.method == METHOD_ICMP:
+                    self._send_echo(index, target, sent_at, echo_waiting)
+                else:
+                    self._start_connect(index, target, selector, sent_at, rtts, connecting)
+
+            deadline = time.monotonic() + self.timeout
+            while (echo_waiting or connecting) and time.monotonic() < deadline:
+                for key, _ in selector.select(max(0.0, deadline - time.monotonic())):
+                    if key.data is None:
+                        index = connecting.pop(key.fileobj)
+                        self._finish_connect(index, key.fileobj, selector, sent_at, rtts)
+                    else:
+                        self._receive_echoes(key.fileobj, key.data, sent_at, rtts, echo_waiting)
+        finally:
+            for sock in connecting:
+                selector.unregister(sock)
+                sock.close()
+            selector.close()
+
+        results = []
+        for index, target in enumerate(self._targets):
+            rtt = rtts.get(index)
+            target.stats.add(rtt)
+            results.append((target.stats.host, rtt))
+        return results
+
+    def run(self, count: Optional[int] = None, interval: float = PING_INTERVAL,
+            on_round: Optional[Callable[[List[Tuple[str, Optional[float]]]], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> List[LatencyStats]:
+        """Probe in rounds every interval seconds, count rounds or until cancelled."""
+        rounds = 0
+        try:
+            while count is None or rounds < count:
+                if is_cancelled and is_cancelled():
+                    break
+                started = time.monotonic()
+                results = self.probe_round()
+                rounds += 1
+                if on_round is not None:
+                    on_round(results)
+                if count is not None and rounds >= count:
+                    break
+                # Sleep out the interval, in short steps to notice cancellation
+                while not (is_cancelled and is_cancelled()):
+                    remaining = started + interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(remaining, 0.1))
+        finally:
+            self.close()
+        return list(self.stats.values())
+
+    def close(self):
+        for sock in self._icmp.values():
+            if sock is not None:
+                sock.close()
+        self._icmp = {}
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _icmp_socket(self, family: int) -> Optional[socket.socket]:
+        """The shared echo socket for a family, None if the system refuses one."""
+        if family not in self._icmp:
+            try:
+                sock = socket.socket(family, socket.SOCK_DGRAM, _ICMP_TYPES[family][0])
+                sock.setblocking(False)
+            except (OSError, KeyError):
+                sock = None
+            self._icmp[family] = sock
+        return self._icmp[family]
+
+    def _send_echo(self, index: int, target: _Target, sent_at, echo_waiting):
+        sock = self._icmp_socket(target.family)
+        packet = echo_packet(target.family, self._sequence, os.getpid() & 0xFFFF)
+        try:
+            sent_at[index] = time.perf_counter_ns()
+            sock.sendto(packet, (target.sockaddr[0], 0) + tuple(target.sockaddr[2:]))
+        except OSError:
+            return  # e.g. network unreachable: counts as lost
+        echo_waiting.setdefault((target.family, target.sockaddr[0]), []).append(index)
+
+    def _receive_echoes(self, sock: socket.socket, family: int, sent_at, rtts, echo_waiting):
+        while True:
+            try:
+                data, address = sock.recvfrom(2048)
+            except OSError:
+                return  # drained
+            received = time.perf_counter_ns()
+            # Replies to an earlier, timed-out round carry an old sequence
+            if parse_echo_reply(family, data) != self._sequence:
+                continue
+            for index in echo_waiting.pop((family, address[0]), ()):
+                rtts[index] = (received - sent_at[index]) / 1e6
+
+    def _start_connect(self, index: int, target: _Target, selector, sent_at, rtts, connecting):
+        try:
+            sock = socket.socket(target.family, socket.SOCK_STREAM)
+        except OSError:
+            return
+        sock.setblocking(False)
+        sent_at[index] = time.perf_counter_ns()
+        error = sock.connect_ex(target.sockaddr)
+        if error in _IN_PROGRESS:
+            selector.register(sock, selectors.EVENT_WRITE)
+            connecting[sock] = index
+            return
+        if error == 0 or error in _REFUSED:
+            rtts[index] = (time.perf_counter_ns() - sent_at[index]) / 1e6
+        sock.close()
+
+    @staticmethod
+    def _finish_connect(index: int, sock: socket.socket, selector, sent_at, rtts):
+        finished = time.perf_counter_ns()
+        error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        selector.unregister(sock)
+        sock.close()
+        # Connected or refused: either way the host answered
+        if error == 0 or error in _REFUSED:
+            rtts[index] = (finished - sent_at[index]) / 1e6
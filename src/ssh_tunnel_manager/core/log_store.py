@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Activity Log Store
+
+Structured activity log records (timestamp, level, tunnel, event, message)
+in a fixed-size ring buffer, so memory use and append cost stay flat no
+matter how long the application runs. An inverted index over message
+words, levels and tunnel names lets searches and filters look up matching
+records instead of rescanning every message. The full history can also be
+written to a rotating JSON-lines file.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .constants import (
+    LOG_STORE_CAPACITY, LOG_DIR_NAME, LOG_FILE_NAME, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS
+)
+
+LEVELS = ('info', 'success', 'warning', 'error')
+
+# Checked in order; the first pattern found in a message sets its level
+_LEVEL_PATTERNS = (
+    ('error', re.compile(r'error|failed|failure|exception', re.IGNORECASE)),
+    ('warning', re.compile(r'warn', re.IGNORECASE)),
+    ('success', re.compile(r'success|started|connected|complete', re.IGNORECASE)),
+)
+
+_TOKEN = re.compile(r'\w+')
+
+
+def classify_level(message: str) -> str:
+    """Guess a level from message content, for callers that don't pass one."""
+    for level, pattern in _LEVEL_PATTERNS:
+        if pattern.search(message):
+            return level
+    return 'info'
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of text, in order, as used by the search index."""
+    return _TOKEN.findall(text.lower())
+
+
+def default_log_file() -> str:
+    """Path of the activity log file in the user's home directory."""
+    return str(Path.home() / LOG_DIR_NAME / LOG_FILE_NAME)
+
+
+@dataclass
+class LogRecord:
+    """One activity log entry."""
+    seq: int  # increases by one per record, never reused
+    timestamp: float
+    level: str
+    message: str
+    tunnel: str = ""
+    event: str = ""  # short machine-readable kind, e.g. 'started', 'failed'
+
+    @property
+    def time_text(self) -> str:
+        return time.strftime("%H:%M:%S", time.localtime(self.timestamp))
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+class LogStore:
+    """Bounded, indexed activity log.
+
+    Holds the newest capacity records; appending beyond that drops the
+    oldest. Records are addressed by position (0 = oldest held) or by seq.
+    With log_file, every record is also appended to a JSON-lines file that
+    rotates at LOG_FILE_MAX_BYTES.
+    """
+
+    def __init__(self, capacity: int = LOG_STORE_CAPACITY, log_file: Optional[str] = None):
+        self.capacity = max(1, capacity)
+        self._buffer: List[Optional[LogRecord]] = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self._next_seq = 0
+        # Posting lists of seqs, oldest first, so eviction pops from the left
+        self._words: Dict[str, Deque[int]] = {}
+        self._levels: Dict[str, Deque[int]] = {}
+        self._tunnels: Dict[str, Deque[int]] = {}
+        self._lock = threading.Lock()
+        self._file_handler: Optional[RotatingFileHandler] = None
+        if log_file:
+            self._open_file(log_file)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def first_seq(self) -> int:
+        """seq of the oldest record held."""
+        return self._next_seq - self._count
+
+    @property
+    def next_seq(self) -> int:
+        """seq the next appended record will get."""
+        return self._next_seq
+
+    def append(self, message: str, level: str = "info", tunnel: str = "", event: str = "",
+               timestamp: Optional[float] = None) -> Tuple[LogRecord, int]:
+        """Add a record; returns it and how many old records were dropped."""
+        with self._lock:
+            record = LogRecord(self._next_seq, timestamp or time.time(), level, message, tunnel, event)
+            evicted = 0
+            if self._count == self.capacity:
+                self._unindex(self._buffer[self._start])
+                self._start = (self._start + 1) % self.capacity
+                self._count -= 1
+                evicted = 1
+            self._buffer[(self._start + self._count) % self.capacity] = record
+            self._count += 1
+            self._next_seq += 1
+            self._index(record)
+
+        if self._file_handler is not None:
+            self._file_handler.handle(logging.makeLogRecord({'msg': record.to_json()}))
+        return record, evicted
+
+    def at(self, index: int) -> LogRecord:
+        """Record by position, 0 being the oldest held."""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._buffer[(self._start + index) % self.capacity]
+
+    def get(self, seq: int) -> Optional[LogRecord]:
+        """Record by seq, or None once it has been dropped."""
+        index = seq - self.first_seq
+        return self.at(index) if 0 <= index < self._count else None
+
+    def records(self) -> List[LogRecord]:
+        """Every record held, oldest first."""
+        with self._lock:
+            return [self.at(index) for index in range(self._count)]
+
+    def search(self, text: str = "", levels: Optional[Iterable[str]] = None,
+               tunnel: str = "") -> List[int]:
+        """seqs of the records matching every filter, oldest first.
+
+        Each word of text must match the start of a word in the message,
+        tunnel or event ('conn' finds 'connected'); levels and tunnel
+        restrict by exact value.
+        """
+        terms = tokenize(text)
+        with self._lock:
+            candidates: Optional[set] = None
+            if tunnel:
+                candidates = set(self._tunnels.get(tunnel, ()))
+            if levels is not None:
+                by_level = set()
+                for level in levels:
+                    by_level.update(self._levels.get(level, ()))
+                candidates = by_level if candidates is None else candidates & by_level
+            for term in sorted(set(terms), key=len, reverse=True):
+                # Longest terms first: usually the most selective
+                if candidates is not None and not candidates:
+                    break
+                found = self._lookup(term)
+                candidates = found if candidates is None else candidates & found
+            if candidates is None:
+                return list(range(self.first_seq, self._next_seq))
+            return sorted(candidates)
+
+    @staticmethod
+    def matches(record: LogRecord, terms: Sequence[str], levels: Optional[Iterable[str]] = None,
+                tunnel: str = "") -> bool:
+        """Whether a record passes the filters of search(), given tokenized terms."""
+        if tunnel and record.tunnel != tunnel:
+            return False
+        if levels is not None and record.level not in levels:
+            return False
+        if not terms:
+            return True
+        words = _record_words(record)
+        return all(any(word.startswith(term) for word in words) for term in terms)
+
+    def tunnels(self) -> List[str]:
+        """Names of tunnels that have records held."""
+        with self._lock:
+            return sorted(self._tunnels)
+
+    def clear(self):
+        """Drop every record held (the log file is kept)."""
+        with self._lock:
+            self._buffer = [None] * self.capacity
+            self._start = 0
+            self._count = 0
+            self._words.clear()
+            self._levels.clear()
+            self._tunnels.clear()
+
+    def close(self):
+        """Close the log file."""
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _open_file(self, log_file: str):
+        try:
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            self._file_handler = RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS,
+                encoding='utf-8'
+            )
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Activity log file disabled: {e}")
+
+    def _lookup(self, term: str) -> set:
+        """seqs of records with a word starting with term."""
+        found = set(self._words.get(term, ()))
+        for word, seqs in self._words.items():
+            if word != term and word.startswith(term):
+                found.update(seqs)
+        return found
+
+    def _index(self, record: LogRecord):
+        seq = record.seq
+        for word in _record_words(record):
+            self._words.setdefault(word, deque()).append(seq)
+        self._levels.setdefault(record.level, deque()).append(seq)
+        if record.tunnel:
+            self._tunnels.setdefault(record.tunnel, deque()).append(seq)
+
+    def _unindex(self, record: LogRecord):
+        # The evicted record is the oldest, so it heads each of its posting lists
+        for word in _record_words(record):
+            self._pop_oldest(self._words, word)
+        self._pop_oldest(self._levels, record.level)
+        if record.tunnel:
+            self._pop_oldest(self._tunnels, record.tunnel)
+
+    @staticmethod
+    def _pop_oldest(index: Dict[str, Deque[int]], key: str):
+        postings = index.get(key)
+        if postings:
+            postings.popleft()
+            if not postings:
+                del index[key]
+
+
+def _record_words(record: LogRecord) -> set:
+    return set(tokenize(f"{record.message} {record.tunnel} {record.event}"))
@@ -3,9 +3,13 @@
 SSH Tunnel Manager - Data Models
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, MISSING
+from operator import attrgetter
 from typing import Optional
 
+from .ssh_keys import get_key_discovery
+from .ssh_profiles import PROFILES, PROFILE_DEFAULT, get_profile
+
 
 @dataclass
 class TunnelConfig:
@@ -23,33 +27,28 @@ class TunnelConfig:
     ssh_key_path: str = ""
     ssh_password: str = ""  # Runtime password (not saved to config)
     rtsp_url: str = ""  # Custom RTSP URL (single URL)
+    backend: str = "terminal"  # 'terminal' (ssh client window) or 'embedded' (in-process paramiko)
+    performance_profile: str = PROFILE_DEFAULT  # see core.ssh_profiles.PROFILES
+    
+    # (command fields, key, command) of the last get_ssh_command_args() call;
+    # not annotated, so not a dataclass field and never saved or compared
+    _command_memo = None
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization (excludes password)."""
-        data = asdict(self)
-        # Remove password from serialization for security
-        data.pop('ssh_password', None)
-        return data
+        # All fields are scalars, so no deep copy (as asdict makes) is needed;
+        # the password is left out for security
+        return dict(zip(SAVED_FIELDS, _get_saved_fields(self)))
     
     @classmethod
     def from_dict(cls, data: dict) -> 'TunnelConfig':
         """Create from dictionary."""
-        # Make a copy to avoid modifying the original
-        data = data.copy()
-        
-        # Ensure ssh_password is not loaded from saved config
-        data.pop('ssh_password', None)
-        
-        # Remove any unknown fields that aren't part of the TunnelConfig dataclass
-        # This handles backwards compatibility when fields are removed or renamed
-        import inspect
-        signature = inspect.signature(cls)
-        valid_fields = set(signature.parameters.keys())
-        
-        # Filter out any fields not in the current TunnelConfig definition
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
-        
-        return cls(**filtered_data)
+        if data.keys() <= _LOADABLE_FIELDS:
+            return cls(**data)
+        # Keep only fields of the current TunnelConfig definition; this handles
+        # backwards compatibility when fields are removed or renamed, and
+        # ensures ssh_password is not loaded from saved config
+        return cls(**{k: v for k, v in data.items() if k in _LOADABLE_FIELDS})
     
     def copy(self) -> 'TunnelConfig':
         """Create a copy of this configuration."""
@@ -66,7 +65,9 @@ class TunnelConfig:
             auto_start=self.auto_start,
             ssh_key_path=self.ssh_key_path,
             ssh_password=self.ssh_password,
-            rtsp_url=self.rtsp_url
+            rtsp_url=self.rtsp_url,
+            backend=self.backend,
+            performance_profile=self.performance_profile
         )
     
     def validate(self) -> tuple[bool, str]:
@@ -89,6 +90,12 @@ class TunnelConfig:
         if self.tunnel_type not in ['local', 'remote', 'dynamic']:
             return False, "Invalid tunnel type"
         
+        if self.backend not in ['terminal', 'embedded']:
+            return False, "Invalid tunnel backend"
+        
+        if self.performance_profile not in PROFILES:
+            return False, "Invalid performance profile"
+        
         if self.tunnel_type != 'dynamic':
             if not self.remote_host.strip():
                 return False, "Remote host is required for local/remote tunnels"
@@ -99,70 +106,20 @@ class TunnelConfig:
         return True, ""
     
     def get_ssh_command_args(self) -> list[str]:
-        """Generate SSH command arguments for this tunnel."""
-        import os
-        
-        # Build tunnel argument based on type
-        if self.tunnel_type == 'local':
-            tunnel_arg = f"-L {self.local_port}:{self.remote_host}:{self.remote_port}"
-        elif self.tunnel_type == 'remote':
-            tunnel_arg = f"-R {self.remote_port}:localhost:{self.local_port}"
-        else:  # dynamic
-            tunnel_arg = f"-D {self.local_port}"
-        
-        cmd = [
-            'ssh',
-            '-N',  # Don't execute remote command
-            tunnel_arg,
-            f"{self.ssh_user}@{self.ssh_host}",
-            '-p', str(self.ssh_port),
-            '-o', 'StrictHostKeyChecking=no',
-            '-o', 'UserKnownHostsFile=/dev/null',
-            '-o', 'ServerAliveInterval=30',
-            '-o', 'ServerAliveCountMax=3',
-            '-o', 'TCPKeepAlive=yes',
-            '-o', 'ExitOnForwardFailure=yes',
-            '-o', 'ConnectTimeout=30'
-        ]
-        
-        # Add SSH key - check specified key first, then default locations
-        key_to_use = None
-        
-        if self.ssh_key_path and os.path.exists(self.ssh_key_path):
-            key_to_use = self.ssh_key_path
-        else:
-            # Check for default SSH keys in standard locations
-            from pathlib import Path
-            home = Path.home()
-            default_keys = [
-                home / '.ssh' / 'id_rsa',
-                home / '.ssh' / 'id_ed25519',
-                home / '.ssh' / 'id_ecdsa',
-                home / '.ssh' / 'id_dsa'
-            ]
-            
-            for key_path in default_keys:
-                if key_path.exists():
-                    key_to_use = str(key_path)
-                    break
-        
-        if key_to_use:
-            cmd.extend(['-i', key_to_use])
-            # For key authentication, prefer key-based auth but allow fallback
-            cmd.extend([
-                '-o', 'PreferredAuthentications=publickey,password',
-                '-o', 'BatchMode=no'
-            ])
-        else:
-            # For password authentication, enable interactive mode
-            cmd.extend([
-                '-o', 'BatchMode=no',
-                '-o', 'PasswordAuthentication=yes',
-                '-o', 'PreferredAuthentications=password',
-                '-o', 'NumberOfPasswordPrompts=1'
-            ])
-        
-        return cmd
+        """Generate SSH command arguments for this tunnel.
+
+        The command is rebuilt only when a field it uses or the key file
+        found for them has changed since the last call; key lookups are
+        cached by core.ssh_keys, so calling this for many tunnels does
+        little disk I/O.
+        """
+        key_to_use = get_key_discovery().resolve(self.ssh_key_path)
+        command_fields = _get_command_fields(self)
+        memo = self._command_memo
+        if memo is None or memo[0] != command_fields or memo[1] != key_to_use:
+            memo = (command_fields, key_to_use, _build_ssh_command(command_fields, key_to_use))
+            self._command_memo = memo
+        return list(memo[2])
     
     def get_display_name(self) -> str:
         """Get a display-friendly name for the tunnel."""
@@ -201,3 +158,70 @@ class TunnelConfig:
             f"{base_url}/stream",
             f"{base_url}/"
         ]
+
+
+# Field names, computed once rather than per record
+FIELD_NAMES = tuple(f.name for f in fields(TunnelConfig))
+SAVED_FIELDS = tuple(name for name in FIELD_NAMES if name != 'ssh_password')
+REQUIRED_FIELDS = frozenset(
+    f.name for f in fields(TunnelConfig) if f.default is MISSING and f.default_factory is MISSING
+)
+_LOADABLE_FIELDS = frozenset(SAVED_FIELDS)
+_get_saved_fields = attrgetter(*SAVED_FIELDS)
+
+# Fields the ssh command line is built from
+_COMMAND_FIELDS = (
+    'tunnel_type', 'local_port', 'remote_host', 'remote_port',
+    'ssh_user', 'ssh_host', 'ssh_port', 'performance_profile'
+)
+_get_command_fields = attrgetter(*_COMMAND_FIELDS)
+
+
+def _build_ssh_command(command_fields: tuple, key_to_use: Optional[str]) -> tuple:
+    """ssh command line for a tunnel's command fields and key."""
+    (tunnel_type, local_port, remote_host, remote_port,
+     ssh_user, ssh_host, ssh_port, performance_profile) = command_fields
+    
+    # Build tunnel argument based on type
+    if tunnel_type == 'local':
+        tunnel_arg = f"-L {local_port}:{remote_host}:{remote_port}"
+    elif tunnel_type == 'remote':
+        tunnel_arg = f"-R {remote_port}:localhost:{local_port}"
+    else:  # dynamic
+        tunnel_arg = f"-D {local_port}"
+    
+    cmd = [
+        'ssh',
+        '-N',  # Don't execute remote command
+        tunnel_arg,
+        f"{ssh_user}@{ssh_host}",
+        '-p', str(ssh_port),
+        '-o', 'StrictHostKeyChecking=no',
+        '-o', 'UserKnownHostsFile=/dev/null',
+        '-o', 'ServerAliveInterval=30',
+        '-o', 'ServerAliveCountMax=3',
+        '-o', 'TCPKeepAlive=yes',
+        '-o', 'ExitOnForwardFailure=yes',
+        '-o', 'ConnectTimeout=30'
+    ]
+    
+    # Compression, cipher and QoS settings of the performance profile
+    cmd.extend(get_profile(performance_profile).ssh_options())
+    
+    if key_to_use:
+        cmd.extend(['-i', key_to_use])
+        # For key authentication, prefer key-based auth but allow fallback
+        cmd.extend([
+            '-o', 'PreferredAuthentications=publickey,password',
+            '-o', 'BatchMode=no'
+        ])
+    else:
+        # For password authentication, enable interactive mode
+        cmd.extend([
+            '-o', 'BatchMode=no',
+            '-o', 'PasswordAuthentication=yes',
+            '-o', 'PreferredAuthentications=password',
+            '-o', 'NumberOfPasswordPrompts=1'
+        ])
+    
+    return tuple(cmd)
@@ -3,62 +3,214 @@
 SSH Tunnel Manager - Monitor Thread
 """
 
+import heapq
+import itertools
+import threading
 import time
-from typing import Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from PySide6.QtCore import QThread, Signal
 
 from .tunnel_process import TunnelProcess
-from .constants import MONITOR_INTERVAL
+from .constants import (
+    MONITOR_INTERVAL, MONITOR_STARTING_INTERVAL, MONITOR_MAX_INTERVAL,
+    MONITOR_BACKOFF_FACTOR, MONITOR_MAX_CONCURRENT_PROBES
+)
 
 
 class TunnelMonitorThread(QThread):
-    """Background thread to monitor tunnel status."""
-    
-    status_update = Signal(str, bool)  # tunnel_name, is_running
+    """Background thread to monitor tunnel status.
+
+    Each tunnel has its own next-probe deadline kept in a priority queue.
+    Tunnels that are STARTING are probed quickly, stable tunnels back off
+    exponentially up to MONITOR_MAX_INTERVAL, and any state change resets
+    the interval. Probes run concurrently on a small pool so a slow or dead
+    tunnel never delays the others.
+
+    Signals are only emitted when a tunnel's state actually changes. All
+    changes found in one pass are also delivered together via status_batch
+    so the GUI can apply them with a single refresh.
+    """
+
+    status_update = Signal(str, bool)  # tunnel_name, is_running (on change only)
+    status_batch = Signal(dict)  # {tunnel_name: is_running} for all changes in one pass
     connection_lost = Signal(str)  # tunnel_name when connection is lost
-    
-    def __init__(self, active_tunnels: Dict[str, TunnelProcess]):
+
+    def __init__(self, active_tunnels: Dict[str, TunnelProcess],
+                 max_concurrent_probes: int = MONITOR_MAX_CONCURRENT_PROBES):
         super().__init__()
         self.active_tunnels = active_tunnels
+        self.max_concurrent_probes = max_concurrent_probes
         self.running = True
-    
+
+        self._wake_event = threading.Event()
+        self._schedule: List[Tuple[float, int, str]] = []  # (deadline, seq, name) heap
+        self._sequence = itertools.count()
+        self._deadlines: Dict[str, float] = {}
+        self._intervals: Dict[str, float] = {}
+        self._tunnels: Dict[str, TunnelProcess] = {}
+        self._last_state: Dict[str, Tuple[bool, str]] = {}  # name -> (is_running, status)
+        self._in_flight: Dict[str, Future] = {}
+
     def run(self):
         """Main monitoring loop."""
-        while self.running:
-            for name, tunnel_process in self.active_tunnels.items():
-                try:
-                    # Check if the process is alive
-                    if hasattr(tunnel_process, 'is_alive'):
-                        is_alive = tunnel_process.is_alive()
-                    else:
-                        is_alive = tunnel_process.is_running
-                    
-                    # If tunnel is in STARTING state, try to transition to RUNNING
-                    if (tunnel_process.status == tunnel_process.STATUS_STARTING and 
-                        hasattr(tunnel_process, 'transition_to_running_if_healthy')):
-                        if tunnel_process.transition_to_running_if_healthy():
-                            self.status_update.emit(name, True)
-                            continue
-                    
-                    # Handle connection lost scenarios
-                    was_running = tunnel_process.is_running
-                    current_running = is_alive and (tunnel_process.status == tunnel_process.STATUS_RUNNING)
-                    
-                    if was_running and not current_running:
-                        # Connection was lost
-                        if tunnel_process.connection_lost_count < 10:  # Limit to 10 messages
-                            tunnel_process.connection_lost_count += 1
-                            self.connection_lost.emit(name)
-                    
-                    self.status_update.emit(name, current_running)
-                    
-                except Exception as e:
-                    # In case of any error, assume the tunnel is not running
-                    self.status_update.emit(name, False)
-            
-            time.sleep(MONITOR_INTERVAL)
-    
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_probes,
+            thread_name_prefix="tunnel-probe"
+        )
+        try:
+            while self.running:
+                self._sync_tunnels()
+                self._collect_probe_results()
+                self._dispatch_due_probes(executor)
+
+                # Sleep until the next deadline, a finished probe or wake();
+                # never longer than MONITOR_INTERVAL so new tunnels are noticed.
+                self._wake_event.wait(self._time_until_next_deadline())
+                self._wake_event.clear()
+        finally:
+            executor.shutdown(wait=False)
+
+    def wake(self):
+        """Re-check the tunnel set now (call after starting/stopping tunnels)."""
+        self._wake_event.set()
+
     def stop(self):
         """Stop the monitoring thread."""
         self.running = False
+        self._wake_event.set()
+
+    # ------------------------------------------------------------------ #
+    # Scheduling
+    # ------------------------------------------------------------------ #
+
+    def _sync_tunnels(self):
+        """Reconcile scheduler state against a snapshot of active_tunnels."""
+        # dict.copy() is atomic under the GIL, so the GUI thread can keep
+        # mutating active_tunnels while we work from the snapshot.
+        snapshot = self.active_tunnels.copy()
+
+        for name in list(self._tunnels):
+            if snapshot.get(name) is not self._tunnels[name]:
+                self._forget(name)
+
+        for name, tunnel_process in snapshot.items():
+            if name not in self._tunnels:
+                self._tunnels[name] = tunnel_process
+                self._schedule_probe(name, 0.0, MONITOR_STARTING_INTERVAL)
+            elif (tunnel_process.status == tunnel_process.STATUS_STARTING and
+                  self._intervals.get(name, 0.0) > MONITOR_STARTING_INTERVAL):
+                # Restarted since the last probe: switch back to fast probing
+                self._schedule_probe(name, 0.0, MONITOR_STARTING_INTERVAL)
+
+    def _forget(self, name: str):
+        """Drop all scheduler state for a tunnel."""
+        self._tunnels.pop(name, None)
+        self._deadlines.pop(name, None)
+        self._intervals.pop(name, None)
+        self._last_state.pop(name, None)
+        self._in_flight.pop(name, None)
+
+    def _schedule_probe(self, name: str, delay: float, interval: float):
+        """Set the next probe deadline for a tunnel."""
+        deadline = time.monotonic() + delay
+        self._deadlines[name] = deadline
+        self._intervals[name] = interval
+        heapq.heappush(self._schedule, (deadline, next(self._sequence), name))
+
+    def _time_until_next_deadline(self) -> float:
+        """Seconds until the earliest pending deadline, capped at MONITOR_INTERVAL."""
+        while self._schedule:
+            deadline, _, name = self._schedule[0]
+            if self._deadlines.get(name) != deadline:
+                heapq.heappop(self._schedule)  # stale entry
+                continue
+            return max(0.0, min(deadline - time.monotonic(), MONITOR_INTERVAL))
+        return MONITOR_INTERVAL
+
+    def _dispatch_due_probes(self, executor: ThreadPoolExecutor):
+        """Submit probes for every tunnel whose deadline has passed."""
+        now = time.monotonic()
+        while self._schedule and self._schedule[0][0] <= now:
+            deadline, _, name = heapq.heappop(self._schedule)
+            if self._deadlines.get(name) != deadline:
+                continue
+            del self._deadlines[name]
+            if name in self._in_flight:
+                continue  # rescheduled when the running probe finishes
+
+            future = executor.submit(self._probe, self._tunnels[name])
+            future.add_done_callback(lambda _: self._wake_event.set())
+            self._in_flight[name] = future
+
+    def _collect_probe_results(self):
+        """Handle finished probes, emit state changes and schedule next probes."""
+        changes: Dict[str, bool] = {}
+
+        for name, future in list(self._in_flight.items()):
+            if not future.done():
+                continue
+            del self._in_flight[name]
+
+            try:
+                current_running = future.result()
+            except Exception:
+                # In case of any error, assume the tunnel is not running
+                current_running = False
+
+            tunnel_process = self._tunnels[name]
+            last_state = self._last_state.get(name)
+            was_running = last_state[0] if last_state else False
+            state = (current_running, tunnel_process.status)
+            self._last_state[name] = state
+
+            # A running tunnel that stopped without stop() being called
+            # (stop() clears the process) has lost its connection
+            if was_running and not current_running and tunnel_process.process is not None:
+                if tunnel_process.connection_lost_count < 10:  # Limit to 10 messages
+                    tunnel_process.connection_lost_count += 1
+                    self.connection_lost.emit(name)
+
+            # Status changes without a running change (e.g. STARTING -> ERROR)
+            # still need a UI update
+            if state != last_state:
+                changes[name] = current_running
+                self.status_update.emit(name, current_running)
+
+            if tunnel_process.status == tunnel_process.STATUS_STARTING:
+                interval = MONITOR_STARTING_INTERVAL
+            elif was_running != current_running:
+                interval = MONITOR_INTERVAL
+            else:
+                interval = min(self._intervals.get(name, MONITOR_INTERVAL) * MONITOR_BACKOFF_FACTOR,
+                               MONITOR_MAX_INTERVAL)
+                interval = max(interval, MONITOR_INTERVAL)
+            self._schedule_probe(name, interval, interval)
+
+        if changes:
+            self.status_batch.emit(changes)
+
+    # ------------------------------------------------------------------ #
+    # Probing (runs on the probe pool)
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _probe(tunnel_process: TunnelProcess) -> bool:
+        """Check a single tunnel; returns whether it is up and running."""
+        # Check if the process is alive
+        if hasattr(tunnel_process, 'is_alive'):
+            is_alive = tunnel_process.is_alive()
+        else:
+            is_alive = tunnel_process.is_running
+
+        # If tunnel is in STARTING state, try to transition to RUNNING
+        if (tunnel_process.status == tunnel_process.STATUS_STARTING and
+                hasattr(tunnel_process, 'transition_to_running_if_healthy')):
+            if tunnel_process.transition_to_running_if_healthy():
+                is_alive = True
+
+        is_up = is_alive and tunnel_process.status == tunnel_process.STATUS_RUNNING
+        if hasattr(tunnel_process, 'record_sample'):
+            tunnel_process.record_sample(is_up)
+        return is_up
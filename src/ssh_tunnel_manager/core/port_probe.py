@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Port Probe Engine
+
+Checks which TCP ports of a host accept connections, for diagnosing what a
+tunnel endpoint exposes. All probes run from one thread: non-blocking
+connects are started up to a fixed window, and a selector reports each one
+as it succeeds, is refused or times out, so a scan needs a bounded number
+of sockets and constant memory however many ports it covers.
+
+Every answer from the host (a completed connect or a refusal) is a
+round-trip sample. The timeout for new probes follows those samples the
+way TCP's retransmission timer does (smoothed RTT plus four deviations),
+bounded by PORT_PROBE_MIN_TIMEOUT and the timeout asked for, so silently
+dropped ports on a fast network stop costing the full timeout each.
+"""
+
+import errno
+import heapq
+import itertools
+import selectors
+import socket
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .constants import PORT_PROBE_WINDOW, PORT_PROBE_MIN_TIMEOUT, SCAN_BATCH_INTERVAL
+
+# connect_ex() results meaning "connecting, wait for writability"
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}  # 10035: WSAEWOULDBLOCK
+# Errors that are an answer from the host, so they carry a round-trip sample
+_ANSWERED = {errno.ECONNREFUSED, 10061}  # 10061: WSAECONNREFUSED
+
+# Common service mappings
+SERVICE_NAMES = {
+    21: "FTP", 22: "SSH", 23: "Telnet", 25: "SMTP", 53: "DNS",
+    80: "HTTP", 110: "POP3", 143: "IMAP", 443: "HTTPS", 993: "IMAPS",
+    995: "POP3S", 3389: "RDP", 5432: "PostgreSQL", 3306: "MySQL",
+    1433: "MSSQL", 5900: "VNC", 8080: "HTTP-Alt", 8443: "HTTPS-Alt",
+    554: "RTSP", 1723: "PPTP", 1194: "OpenVPN", 500: "IPSec",
+    4500: "IPSec-NAT", 135: "RPC", 139: "NetBIOS", 445: "SMB",
+    389: "LDAP", 636: "LDAPS", 161: "SNMP", 162: "SNMP-Trap",
+    69: "TFTP", 123: "NTP", 179: "BGP", 515: "LPD", 631: "IPP",
+    587: "SMTP-Sub", 465: "SMTPS"
+}
+
+
+@dataclass
+class PortResult:
+    """Outcome of probing one port."""
+    port: int
+    is_open: bool
+    rtt: Optional[float] = None  # seconds until the host answered; None on timeout or error
+
+    @property
+    def service(self) -> str:
+        return SERVICE_NAMES.get(self.port, "Unknown")
+
+
+class PortProber:
+    """Probes TCP ports of one host with a bounded window of connects.
+
+    timeout is the longest any probe waits; once the host has answered,
+    probes wait only as long as its measured round trips warrant.
+    """
+
+    def __init__(self, host: str, timeout: float = 1.0, window: int = PORT_PROBE_WINDOW):
+        self.host = host
+        self.max_timeout = max(timeout, PORT_PROBE_MIN_TIMEOUT)
+        self.window = max(1, window)
+        self.srtt: Optional[float] = None
+        self.rttvar = 0.0
+        self._family: Optional[int] = None
+        self._address: Optional[tuple] = None
+
+    @property
+    def timeout(self) -> float:
+        """Timeout for the next probe."""
+        if self.srtt is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(PORT_PROBE_MIN_TIMEOUT, self.srtt + 4 * self.rttvar))
+
+    def resolve(self):
+        """Look the host up once for the whole scan (raises OSError)."""
+        family, _, _, _, address = socket.getaddrinfo(self.host, None, type=socket.SOCK_STREAM)[0]
+        self._family, self._address = family, address
+
+    def run(self, ports: Iterable[int],
+            on_result: Optional[Callable[[PortResult], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None,
+            on_batch: Optional[Callable[[List[PortResult]], None]] = None,
+            max_delay: float = SCAN_BATCH_INTERVAL) -> Tuple[int, int]:
+        """Probe ports, calling on_result as each finishes (in completion order).
+
+        on_batch gets the same results grouped: a batch is handed out
+        max_delay seconds after its first result, and the rest at the end.
+        ports is consumed lazily, so a range of any size costs nothing up
+        front. Returns (ports probed, ports open). Raises OSError if the
+        host can't be resolved.
+        """
+        if self._address is None:
+            self.resolve()
+        pending = iter(ports)
+        selector = selectors.DefaultSelector()
+        in_flight: Dict[socket.socket, Tuple[int, float]] = {}  # sock -> (port, started)
+        deadlines = []  # heap of (deadline, tiebreak, sock); finished entries are skipped
+        order = itertools.count()
+        probed = opened = 0
+        retry: Optional[int] = None  # port put back when out of sockets
+        batch: List[PortResult] = []
+        batch_started = 0.0
+
+        def finish(result: PortResult):
+            nonlocal probed, opened, batch_started
+            probed += 1
+            opened += result.is_open
+            if on_result is not None:
+                on_result(result)
+            if on_batch is not None:
+                if not batch:
+                    batch_started = time.monotonic()
+                batch.append(result)
+                flush(time.monotonic())
+
+        def flush(now: float):
+            nonlocal batch
+            if batch and now - batch_started >= max_delay:
+                on_batch(batch)
+                batch = []
+
+        try:
+            while True:
+                if is_cancelled and is_cancelled():
+                    break
+                # Keep the window full
+                while len(in_flight) < self.window:
+                    if retry is not None:
+                        port, retry = retry, None
+                    else:
+                        port = next(pending, None)
+                    if port is None:
+                        break
+                    try:
+                        result = self._connect(port, selector, in_flight, deadlines, order)
+                    except OSError:
+                        # Out of file descriptors: carry on with the sockets we have
+                        if not in_flight:
+                            raise
+                        self.window = len(in_flight)
+                        retry = port
+                        break
+                    if result is not None:
+                        finish(result)
+                if not in_flight:
+                    break  # the window only drains once ports run out
+
+                now = time.monotonic()
+                wait = max(0.0, deadlines[0][0] - now)
+                if batch:
+                    wait = min(wait, max(0.0, batch_started + max_delay - now))
+                # Wake at least every 100 ms to notice cancellation
+                for key, _ in selector.select(min(wait, 0.1)):
+                    finish(self._complete(key.fileobj, selector, in_flight))
+
+                now = time.monotonic()
+                while deadlines and deadlines[0][0] <= now:
+                    sock = heapq.heappop(deadlines)[2]
+                    if sock in in_flight:
+                        port = in_flight[sock][0]
+                        self._close(sock, selector, in_flight)
+                        finish(PortResult(port, False))
+                # Drop entries for probes that already finished
+                while deadlines and deadlines[0][2] not in in_flight:
+                    heapq.heappop(deadlines)
+                flush(now)
+            if batch:
+                on_batch(batch)
+        finally:
+            for sock in list(in_flight):
+                self._close(sock, selector, in_flight)
+            selector.close()
+        return probed, opened
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _connect(self, port: int, selector, in_flight, deadlines, order) -> Optional[PortResult]:
+        """Start a probe; returns its result right away if it didn't need to wait.
+
+        Raises OSError if no socket can be created.
+        """
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        started = time.monotonic()
+        error = sock.connect_ex((self._address[0], port) + tuple(self._address[2:]))
+        if error not in _IN_PROGRESS:
+            sock.close()
+            if error == 0 or error in _ANSWERED:
+                rtt = time.monotonic() - started
+                self._sample(rtt)
+                return PortResult(port, error == 0, rtt)
+            return PortResult(port, False)
+        selector.register(sock, selectors.EVENT_WRITE)
+        in_flight[sock] = (port, started)
+        heapq.heappush(deadlines, (started + self.timeout, next(order), sock))
+        return None
+
+    def _complete(self, sock: socket.socket, selector, in_flight) -> PortResult:
+        """Result of a probe whose connect has finished one way or the other."""
+        port, started = in_flight[sock]
+        rtt = time.monotonic() - started
+        error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        self._close(sock, selector, in_flight)
+        if error == 0 or error in _ANSWERED:
+            self._sample(rtt)
+            return PortResult(port, error == 0, rtt)
+        return PortResult(port, False)
+
+    @staticmethod
+    def _close(sock: socket.socket, selector, in_flight):
+        del in_flight[sock]
+        selector.unregister(sock)
+        sock.close()
+
+    def _sample(self, rtt: float):
+        # RFC 6298 smoothing: alpha = 1/8, beta = 1/4
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += (abs(self.srtt - rtt) - self.rttvar) / 4
+            self.srtt += (rtt - self.srtt) / 8
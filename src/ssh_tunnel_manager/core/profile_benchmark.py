@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Performance Profile Benchmark
+
+Measures each performance profile against an in-process SSH server that
+stands in for sshd, optionally behind a simulated link (round-trip time and
+bandwidth cap), so compression and cipher choices can be compared for a
+kind of link without touching a real server. For every profile it records
+the time to connect and authenticate, download throughput over a session
+channel and the round trip of small interactive messages.
+"""
+
+import os
+import random
+import socket
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+import paramiko
+
+from .constants import (
+    BENCHMARK_PAYLOAD_SIZE, BENCHMARK_MAX_SECONDS, BENCHMARK_ROUND_TRIPS, SSH_TIMEOUT
+)
+from .benchmark_server import (
+    BENCHMARK_PASSWORD, BENCHMARK_USERNAME, SERVER_LOG, LinkRelay, StandInServer, server_host_key
+)
+from .ssh_profiles import PROFILES, get_profile
+
+_CHUNK = 32 * 1024
+_ECHO_SIZE = 64
+
+
+def _text_payload(size: int = 256 * 1024) -> bytes:
+    """Log-like text, about as compressible as typical terminal output."""
+    rng = random.Random(0)
+    words = ["GET", "POST", "/api/v1/items", "200", "404", "INFO", "WARN", "stream",
+             "client", "connected", "frame", "bytes", "session", "timeout", "ok"]
+    lines = []
+    length = 0
+    while length < size:
+        line = (f"2024-01-01 12:{rng.randrange(60):02d}:{rng.randrange(60):02d}."
+                f"{rng.randrange(1000):03d} " + " ".join(rng.choice(words) for _ in range(8))
+                + f" id={rng.randrange(10 ** 6)}\n")
+        lines.append(line)
+        length += len(line)
+    return "".join(lines).encode('ascii')[:size]
+
+
+@dataclass
+class ProfileBenchmarkResult:
+    """Measurements for one profile."""
+    profile: str
+    handshake: float = 0.0  # seconds to connect and authenticate
+    throughput: float = 0.0  # payload bytes per second, server to client
+    round_trip: float = 0.0  # median seconds per small echo message
+    cipher: str = ""  # negotiated cipher
+    compression: str = ""  # negotiated compression
+    error: str = ""
+
+
+class ProfileBenchmark:
+    """Compare performance profiles against a local SSH server stand-in.
+
+    round_trip_time (seconds) and bandwidth (bytes/s, 0 for unlimited)
+    describe the simulated link between client and server. compressible
+    selects log-like text instead of random data for the throughput test.
+    """
+
+    def __init__(self, round_trip_time: float = 0.0, bandwidth: float = 0.0,
+                 compressible: bool = False,
+                 payload_size: int = BENCHMARK_PAYLOAD_SIZE,
+                 max_seconds: float = BENCHMARK_MAX_SECONDS,
+                 round_trips: int = BENCHMARK_ROUND_TRIPS):
+        self.round_trip_time = round_trip_time
+        self.bandwidth = bandwidth
+        self.compressible = compressible
+        self.payload_size = payload_size
+        self.max_seconds = max_seconds
+        self.round_trips = round_trips
+        self._listener: Optional[socket.socket] = None
+        self._closed = threading.Event()
+        self._payloads = {}
+
+    def run(self, profiles: Optional[Iterable[str]] = None,
+            on_result: Optional[Callable[[ProfileBenchmarkResult], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> List[ProfileBenchmarkResult]:
+        """Benchmark profiles (all by default) one after another."""
+        results = []
+        self._start_server()
+        try:
+            for name in profiles or PROFILES:
+                if is_cancelled and is_cancelled():
+                    break
+                result = self.measure(name)
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        finally:
+            self._stop_server()
+        return results
+
+    def measure(self, name: str) -> ProfileBenchmarkResult:
+        """Connect with one profile and run the latency and throughput tests."""
+        result = ProfileBenchmarkResult(name)
+        profile = get_profile(name)
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            started = time.monotonic()
+            client.connect(
+                '127.0.0.1', self._listener.getsockname()[1],
+                BENCHMARK_USERNAME, BENCHMARK_PASSWORD,
+                timeout=SSH_TIMEOUT, allow_agent=False, look_for_keys=False,
+                **profile.connect_kwargs()
+            )
+            transport = client.get_transport()
+            profile.tune_transport(transport)
+            result.handshake = time.monotonic() - started
+            result.cipher = transport.local_cipher or ""
+            result.compression = transport.local_compression or ""
+
+            result.round_trip = self._measure_round_trip(transport)
+            result.throughput = self._measure_throughput(transport)
+        except Exception as e:
+            result.error = str(e)
+        finally:
+            client.close()
+        return result
+
+    @staticmethod
+    def fastest(results: List[ProfileBenchmarkResult], by: str = 'throughput') -> Optional[str]:
+        """Name of the best profile by 'throughput' or 'round_trip'."""
+        usable = [r for r in results if not r.error]
+        if not usable:
+            return None
+        if by == 'round_trip':
+            return min(usable, key=lambda r: r.round_trip).profile
+        return max(usable, key=lambda r: r.throughput).profile
+
+    # ------------------------------------------------------------------ #
+    # Measurements
+    # ------------------------------------------------------------------ #
+
+    def _measure_round_trip(self, transport: paramiko.Transport) -> float:
+        channel = transport.open_session(timeout=SSH_TIMEOUT)
+        try:
+            channel.settimeout(SSH_TIMEOUT)
+            channel.exec_command('echo')
+            message = os.urandom(_ECHO_SIZE)
+            times = []
+            for _ in range(self.round_trips):
+                started = time.monotonic()
+                channel.sendall(message)
+                received = 0
+                while received < len(message):
+                    data = channel.recv(len(message) - received)
+                    if not data:
+                        raise EOFError("Echo channel closed")
+                    received += len(data)
+                times.append(time.monotonic() - started)
+            return statistics.median(times)
+        finally:
+            channel.close()
+
+    def _measure_throughput(self, transport: paramiko.Transport) -> float:
+        channel = transport.open_session(timeout=SSH_TIMEOUT)
+        try:
+            channel.settimeout(SSH_TIMEOUT)
+            channel.exec_command('source ' + ('text' if self.compressible else 'random'))
+            received = 0
+            started = time.monotonic()
+            deadline = started + self.max_seconds
+            while received < self.payload_size and time.monotonic() < deadline:
+                data = channel.recv(_CHUNK)
+                if not data:
+                    break
+                received += len(data)
+            elapsed = time.monotonic() - started
+            return received / elapsed if elapsed > 0 else 0.0
+        finally:
+            channel.close()
+
+    # ------------------------------------------------------------------ #
+    # Stand-in server
+    # ------------------------------------------------------------------ #
+
+    def _start_server(self):
+        self._payloads = {'text': _text_payload(), 'random': os.urandom(256 * 1024)}
+        self._closed.clear()
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(('127.0.0.1', 0))
+        self._listener.listen()
+        threading.Thread(target=self._accept_loop, name="benchmark-sshd", daemon=True).start()
+
+    def _stop_server(self):
+        self._closed.set()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def _accept_loop(self):
+        listener = self._listener
+        while not self._closed.is_set():
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            if self.round_trip_time or self.bandwidth:
+                # Route the connection through the simulated link
+                inner, outer = socket.socketpair()
+                LinkRelay(conn, outer, self.round_trip_time / 2, self.bandwidth)
+                conn = inner
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket):
+        transport = paramiko.Transport(conn)
+        transport.set_log_channel(SERVER_LOG)
+        transport.add_server_key(server_host_key())
+        # Let clients that ask for compression get it
+        transport.use_compression(True)
+        try:
+            transport.start_server(server=StandInServer(self._payloads))
+            # Hold accepted channels: paramiko closes a channel once it is
+            # garbage collected, before the exec request can arrive
+            channels = []
+            while transport.is_active() and not self._closed.is_set():
+                channel = transport.accept(1)
+                channels = [c for c in channels if not c.closed]
+                if channel is not None:
+                    channels.append(channel)
+        except Exception:
+            pass
+        finally:
+            transport.close()
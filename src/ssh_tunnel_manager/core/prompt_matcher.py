@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Prompt Matcher
+
+Finds password, confirmation and error phrases in ssh output as it streams
+in. Every phrase of every kind is compiled into a single pattern, so each
+chunk of output is scanned once no matter how many phrases there are, and
+the end of each chunk is carried into the next scan so a prompt split
+across two reads is still found (and reported once). Chunks are lowercased
+before scanning, which is several times faster than a case-insensitive
+pattern.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Set
+
+
+class PromptMatcher:
+    """Streaming matcher for named groups of phrases.
+
+    phrases maps a kind (e.g. 'password') to the phrases that signal it.
+    feed() returns the kinds found in a chunk of output, each with the
+    stream offset where its last match ends; comparing that with
+    line_start tells whether a prompt is on the unfinished last line,
+    where a program waits for input.
+    """
+
+    def __init__(self, phrases: Dict[str, Iterable[str]]):
+        by_phrase: Dict[str, Set[str]] = {}
+        for kind, items in phrases.items():
+            for phrase in items:
+                by_phrase.setdefault(phrase.lower(), set()).add(kind)
+        # A match of a longer phrase also counts for every phrase inside it,
+        # as if each phrase had been searched for on its own
+        self._kinds: Dict[str, FrozenSet[str]] = {
+            phrase: frozenset().union(*(kinds for other, kinds in by_phrase.items() if other in phrase))
+            for phrase in by_phrase
+        }
+        # Longest first, so the alternation prefers the most specific phrase
+        ordered = sorted(by_phrase, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, ordered)))
+        self._carry = max((len(phrase) for phrase in ordered), default=1) - 1
+        self._tail = ""
+        self.position = 0  # characters fed so far
+        self.line_start = 0  # offset just after the last newline fed
+
+    def feed(self, text: str) -> Dict[str, int]:
+        """Kinds whose phrases end in this chunk, with the stream offset of the last end."""
+        text = text.lower()
+        window = self._tail + text
+        scanned = len(self._tail)
+        base = self.position - scanned  # stream offset of window[0]
+        found: Dict[str, int] = {}
+        for match in self._pattern.finditer(window):
+            # Matches ending inside the carried tail were reported last time
+            if match.end() > scanned:
+                for kind in self._kinds[match.group()]:
+                    found[kind] = base + match.end()
+        newline = text.rfind('\n')
+        if newline >= 0:
+            self.line_start = self.position + newline + 1
+        self.position += len(text)
+        self._tail = window[-self._carry:] if self._carry else ""
+        return found
+
+    def reset(self):
+        """Start a new stream."""
+        self._tail = ""
+        self.position = 0
+        self.line_start = 0
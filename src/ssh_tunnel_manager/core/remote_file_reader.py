@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Ranged Remote File Reads
+
+Random access to a remote file for the file viewer. Only the byte ranges
+being looked at are fetched: reads are split into fixed-size blocks, the
+missing blocks of a range are requested together with readv (so they are
+pipelined), and recently used blocks are kept in a bounded LRU cache.
+Memory use therefore stays constant however large the file is, and a
+growing file can be followed by re-checking its size.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict
+
+import paramiko
+
+from .constants import VIEWER_BLOCK_SIZE, VIEWER_CACHE_BLOCKS
+
+
+@dataclass
+class FilePage:
+    """A range of a remote file, trimmed to whole lines."""
+    start: int
+    end: int
+    size: int  # file size when the page was read
+    data: bytes
+
+    @property
+    def at_start(self) -> bool:
+        return self.start == 0
+
+    @property
+    def at_end(self) -> bool:
+        return self.end >= self.size
+
+    @property
+    def text(self) -> str:
+        return self.data.decode('utf-8', errors='replace')
+
+
+class RemoteFileReader:
+    """Block-cached random access to a remote file.
+
+    The file is opened once and read through ranged requests. A reader may
+    be used from several threads.
+    """
+
+    def __init__(self, sftp: paramiko.SFTPClient, path: str,
+                 block_size: int = VIEWER_BLOCK_SIZE, cache_blocks: int = VIEWER_CACHE_BLOCKS):
+        self.sftp = sftp
+        self.path = path
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self.size = 0
+        self._file = None
+        self._blocks: 'OrderedDict[int, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+        with self._lock:
+            self._open()
+
+    def refresh(self) -> int:
+        """Re-check the file size and return it.
+
+        A file that shrank (truncated or rotated) is opened again and the
+        cache is dropped; when it grew, only the formerly last block, which
+        was partial, is dropped.
+        """
+        with self._lock:
+            size = self.sftp.stat(self.path).st_size or 0
+            if size < self.size:
+                self._open()
+            elif size > self.size:
+                self._blocks.pop(self.size // self.block_size, None)
+                self.size = size
+            return self.size
+
+    def read(self, start: int, end: int) -> bytes:
+        """Bytes [start, end) of the file, clamped to its known size."""
+        with self._lock:
+            return self._read(start, end)
+
+    def page(self, start: int, end: int) -> FilePage:
+        """Bytes [start, end) trimmed to whole lines.
+
+        A line cut off at start is skipped and one cut off at end is left
+        for the next page, unless the range holds no line break at all.
+        The end of the file always ends a page.
+        """
+        with self._lock:
+            start = max(0, min(start, self.size))
+            end = max(start, min(end, self.size))
+            # One byte before start tells whether start begins a line
+            lead = 1 if start > 0 else 0
+            data = self._read(start - lead, end)
+            if lead:
+                if data[:1] != b'\n':
+                    cut = data.find(b'\n', 1)
+                    if cut != -1:
+                        data, start = data[cut + 1:], start + cut
+                    else:
+                        data = data[1:]
+                else:
+                    data = data[1:]
+            if start + len(data) < self.size:
+                cut = data.rfind(b'\n')
+                if cut != -1:
+                    data = data[:cut + 1]
+            return FilePage(start, start + len(data), self.size, data)
+
+    def tail(self, length: int) -> FilePage:
+        """The last whole lines of the file, about length bytes."""
+        size = self.refresh()
+        return self.page(size - length, size)
+
+    def close(self):
+        """Close the remote file and drop the cache."""
+        with self._lock:
+            self._blocks.clear()
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+                self._file = None
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _open(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+        self._blocks.clear()
+        self._file = self.sftp.open(self.path, 'rb')
+        self.size = self._file.stat().st_size or 0
+
+    def _read(self, start: int, end: int) -> bytes:
+        start, end = max(0, start), min(end, self.size)
+        if start >= end:
+            return b''
+
+        block_size = self.block_size
+        first, last = start // block_size, (end - 1) // block_size
+        blocks: Dict[int, bytes] = {}
+        missing = []
+        for index in range(first, last + 1):
+            cached = self._blocks.get(index)
+            if cached is None:
+                missing.append(index)
+            else:
+                self._blocks.move_to_end(index)
+                blocks[index] = cached
+
+        if missing:
+            # One readv for all missing blocks keeps the requests in flight together
+            requests = [
+                (index * block_size, min(block_size, self.size - index * block_size))
+                for index in missing
+            ]
+            for index, data in zip(missing, self._file.readv(requests)):
+                blocks[index] = data
+                self._blocks[index] = data
+            while len(self._blocks) > self.cache_blocks:
+                self._blocks.popitem(last=False)
+
+        data = b''.join(blocks[index] for index in range(first, last + 1))
+        offset = start - first * block_size
+        return data[offset:offset + end - start]
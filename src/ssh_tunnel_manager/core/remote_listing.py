@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Remote Directory Listings
+
+Streaming directory listings and a per-path attribute cache for the SFTP
+browsers. Listings are read with listdir_iter, which keeps several READDIR
+requests in flight and yields entries as they arrive, and are handed out
+in batches so a view can show the first entries of a huge directory while
+the rest is still loading.
+"""
+
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import paramiko
+
+from .constants import LISTING_BATCH_SIZE, LISTING_CACHE_TTL, LISTING_CACHE_MAX_PATHS
+
+
+def entry_sort_key(entry: paramiko.SFTPAttributes) -> Tuple[bool, str]:
+    """Sort key putting directories first, then case-insensitive by name."""
+    return (not stat.S_ISDIR(entry.st_mode or 0), entry.filename.lower())
+
+
+def iter_listing_batches(sftp: paramiko.SFTPClient, path: str,
+                         batch_size: int = LISTING_BATCH_SIZE,
+                         max_delay: float = 0.1,
+                         is_cancelled: Optional[Callable[[], bool]] = None
+                         ) -> Iterator[List[paramiko.SFTPAttributes]]:
+    """Yield a directory's entries in batches as they arrive from the server.
+
+    A batch is handed out once it holds batch_size entries or max_delay
+    seconds after its first entry, whichever comes first.
+    """
+    batch: List[paramiko.SFTPAttributes] = []
+    batch_started = 0.0
+    for entry in sftp.listdir_iter(path):
+        if is_cancelled and is_cancelled():
+            return
+        if not batch:
+            batch_started = time.monotonic()
+        batch.append(entry)
+        if len(batch) >= batch_size or time.monotonic() - batch_started >= max_delay:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ListingCache:
+    """Directory listings by path, expiring after ttl seconds.
+
+    Holds at most max_paths listings; the least recently used one is
+    dropped first.
+    """
+
+    def __init__(self, ttl: float = LISTING_CACHE_TTL, max_paths: int = LISTING_CACHE_MAX_PATHS):
+        self.ttl = ttl
+        self.max_paths = max_paths
+        self._entries: 'OrderedDict[str, Tuple[float, List[paramiko.SFTPAttributes]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[List[paramiko.SFTPAttributes]]:
+        """Cached entries for path, or None if missing or expired."""
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is None:
+                return None
+            stored, entries = cached
+            if time.monotonic() - stored > self.ttl:
+                del self._entries[path]
+                return None
+            self._entries.move_to_end(path)
+            return entries
+
+    def put(self, path: str, entries: List[paramiko.SFTPAttributes]):
+        """Store a complete listing for path."""
+        with self._lock:
+            self._entries[path] = (time.monotonic(), entries)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_paths:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: Optional[str] = None):
+        """Forget one path, or every path when none is given."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
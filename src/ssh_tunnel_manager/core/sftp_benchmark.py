@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - SFTP Transfer Benchmark
+
+Measures SFTPTransferEngine downloads and uploads against an in-process
+SFTP server that serves a temporary directory, behind the same simulated
+link (round-trip time and bandwidth cap) as the profile benchmark. Running
+it with e.g. a 100 ms RTT shows how close the pipelined engine gets to the
+link rate, and how block size and the number of outstanding requests move
+that figure, without a real server.
+"""
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+import paramiko
+
+from .constants import SFTP_BENCHMARK_FILE_SIZE, SFTP_WINDOW_SIZE, SSH_TIMEOUT
+from .benchmark_server import (
+    BENCHMARK_PASSWORD, BENCHMARK_USERNAME, SERVER_LOG, LinkRelay, StandInServer, server_host_key
+)
+from .sftp_transfer import SFTPTransferEngine
+
+_SOURCE_NAME = "source.bin"
+_COPY_NAME = "copy.bin"
+
+
+class _LocalHandle(paramiko.SFTPHandle):
+    """Open file of the stand-in; paramiko reads and writes readfile/writefile."""
+
+    def stat(self):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+
+class _LocalSFTPServer(paramiko.SFTPServerInterface):
+    """Serves the files under root, enough for the transfer engine."""
+
+    def __init__(self, server, root: str, *args, **kwargs):
+        super().__init__(server, *args, **kwargs)
+        self.root = root
+
+    def _local(self, path) -> str:
+        if isinstance(path, bytes):
+            path = path.decode('utf-8')
+        return os.path.join(self.root, self.canonicalize(path).lstrip('/'))
+
+    def open(self, path, flags, attr):
+        if flags & os.O_WRONLY:
+            mode = 'ab' if flags & os.O_APPEND else 'wb'
+        elif flags & os.O_RDWR:
+            mode = 'a+b' if flags & os.O_APPEND else 'r+b'
+        else:
+            mode = 'rb'
+        try:
+            fd = os.open(self._local(path), flags | getattr(os, 'O_BINARY', 0), 0o600)
+            file = os.fdopen(fd, mode)
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        handle = _LocalHandle(flags)
+        handle.filename = path
+        handle.readfile = file
+        handle.writefile = file
+        return handle
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._local(path)))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    def lstat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.lstat(self._local(path)))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    def remove(self, path):
+        try:
+            os.remove(self._local(path))
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        return paramiko.SFTP_OK
+
+
+@dataclass
+class SFTPBenchmarkResult:
+    """One transfer of the benchmark file."""
+    operation: str  # 'download' or 'upload'
+    block_size: int  # bytes per request (write_block_size for uploads)
+    max_requests: int
+    size: int = 0  # bytes transferred
+    seconds: float = 0.0
+    throughput: float = 0.0  # bytes per second
+    link_fraction: float = 0.0  # throughput / bandwidth; 0 when the link is not capped
+    error: str = ""
+
+
+class SFTPBenchmark:
+    """Time transfer engine settings against a local SFTP server stand-in.
+
+    round_trip_time (seconds) and bandwidth (bytes/s, 0 for unlimited)
+    describe the simulated link between client and server; file_size is
+    the size of the random file sent each way.
+    """
+
+    def __init__(self, round_trip_time: float = 0.0, bandwidth: float = 0.0,
+                 file_size: int = SFTP_BENCHMARK_FILE_SIZE):
+        self.round_trip_time = round_trip_time
+        self.bandwidth = bandwidth
+        self.file_size = file_size
+        self._listener: Optional[socket.socket] = None
+        self._closed = threading.Event()
+        self._workspace: Optional[tempfile.TemporaryDirectory] = None
+
+    def run(self, engines: Optional[Iterable[SFTPTransferEngine]] = None,
+            on_result: Optional[Callable[[SFTPBenchmarkResult], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> List[SFTPBenchmarkResult]:
+        """Download and upload the file with each engine (the default settings if none)."""
+        results = []
+        self._start_server()
+        try:
+            for engine in engines or [SFTPTransferEngine()]:
+                for operation in ('download', 'upload'):
+                    if is_cancelled and is_cancelled():
+                        return results
+                    result = self.measure(engine, operation)
+                    results.append(result)
+                    if on_result is not None:
+                        on_result(result)
+        finally:
+            self._stop_server()
+        return results
+
+    def measure(self, engine: SFTPTransferEngine, operation: str) -> SFTPBenchmarkResult:
+        """Connect on a fresh link and time one download or upload."""
+        block_size = engine.block_size if operation == 'download' else engine.write_block_size
+        result = SFTPBenchmarkResult(operation, block_size, engine.max_requests)
+        remote_dir = os.path.join(self._workspace.name, 'remote')
+        local_dir = os.path.join(self._workspace.name, 'local')
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(
+                '127.0.0.1', self._listener.getsockname()[1],
+                BENCHMARK_USERNAME, BENCHMARK_PASSWORD,
+                timeout=SSH_TIMEOUT, allow_agent=False, look_for_keys=False
+            )
+            # Same channel window as pooled SFTP sessions
+            sftp = paramiko.SFTPClient.from_transport(
+                client.get_transport(), window_size=SFTP_WINDOW_SIZE
+            )
+            started = time.monotonic()
+            if operation == 'download':
+                stats = engine.download(sftp, _SOURCE_NAME, os.path.join(local_dir, _COPY_NAME))
+            else:
+                stats = engine.upload(sftp, os.path.join(local_dir, _SOURCE_NAME), _COPY_NAME)
+            result.seconds = time.monotonic() - started
+            result.size = stats.bytes_done
+            result.throughput = result.size / result.seconds if result.seconds > 0 else 0.0
+            if self.bandwidth:
+                result.link_fraction = result.throughput / self.bandwidth
+            sftp.close()
+        except Exception as e:
+            result.error = str(e)
+        finally:
+            client.close()
+            # Start every transfer from the same files
+            for directory in (remote_dir, local_dir):
+                copy = os.path.join(directory, _COPY_NAME)
+                if os.path.exists(copy):
+                    os.remove(copy)
+        return result
+
+    # ------------------------------------------------------------------ #
+    # Stand-in server
+    # ------------------------------------------------------------------ #
+
+    def _start_server(self):
+        self._workspace = tempfile.TemporaryDirectory(prefix="sftp-benchmark-")
+        for name in ('remote', 'local'):
+            os.mkdir(os.path.join(self._workspace.name, name))
+        # Random data, so neither side gains from compression
+        with open(os.path.join(self._workspace.name, 'remote', _SOURCE_NAME), 'wb') as f:
+            remaining = self.file_size
+            while remaining > 0:
+                remaining -= f.write(os.urandom(min(remaining, 1024 * 1024)))
+        # Uploads send the same bytes back
+        shutil.copyfile(os.path.join(self._workspace.name, 'remote', _SOURCE_NAME),
+                        os.path.join(self._workspace.name, 'local', _SOURCE_NAME))
+
+        self._closed.clear()
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(('127.0.0.1', 0))
+        self._listener.listen()
+        threading.Thread(target=self._accept_loop, name="benchmark-sftpd", daemon=True).start()
+
+    def _stop_server(self):
+        self._closed.set()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        if self._workspace is not None:
+            self._workspace.cleanup()
+            self._workspace = None
+
+    def _accept_loop(self):
+        listener = self._listener
+        while not self._closed.is_set():
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            if self.round_trip_time or self.bandwidth:
+                # Route the connection through the simulated link
+                inner, outer = socket.socketpair()
+                LinkRelay(conn, outer, self.round_trip_time / 2, self.bandwidth)
+                conn = inner
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn: socket.socket):
+        transport = paramiko.Transport(conn)
+        transport.set_log_channel(SERVER_LOG)
+        transport.add_server_key(server_host_key())
+        transport.set_subsystem_handler(
+            'sftp', paramiko.SFTPServer, _LocalSFTPServer,
+            os.path.join(self._workspace.name, 'remote')
+        )
+        try:
+            transport.start_server(server=StandInServer({}))
+            # Hold the SFTP channel until the client is done with it
+            channels = []
+            while transport.is_active() and not self._closed.is_set():
+                channel = transport.accept(1)
+                if channel is not None:
+                    channels.append(channel)
+        except Exception:
+            pass
+        finally:
+            transport.close()
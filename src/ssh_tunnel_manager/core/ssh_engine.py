@@ -0,0 +1,781 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - In-Process SSH Transport Engine
+
+Runs local, remote and dynamic (SOCKS) forwards over paramiko transports
+inside the manager process, instead of one terminal window plus ssh client
+per tunnel. All forwarded connections are serviced by a single selector
+thread; a small worker pool handles the blocking parts (channel opens,
+SOCKS handshakes, connecting to local targets).
+
+Tunnels to the same ssh_user@ssh_host:ssh_port with the same performance
+profile and credentials share one authenticated transport, so only the
+first of them pays for TCP connect, key exchange and authentication;
+later forwards are just new channels on it.
+"""
+
+import hashlib
+import os
+import socket
+import struct
+import selectors
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import paramiko
+
+from .models import TunnelConfig
+from .ssh_profiles import get_profile
+from .constants import (
+    SSH_TIMEOUT, ENGINE_KEEPALIVE_INTERVAL, ENGINE_WORKER_THREADS, ENGINE_BUFFER_SIZE,
+    ENGINE_WRITE_BUFFER_LIMIT, ENGINE_WINDOW_POLL_INTERVAL
+)
+
+# (user, host, port, profile, key file, password hash)
+ConnectionKey = Tuple[str, str, int, str, str, str]
+
+
+class EmbeddedTunnelHandle:
+    """Popen-like handle for a tunnel running inside SSHTransportEngine.
+
+    TunnelProcess and the monitor only need poll/terminate/kill/wait, so an
+    embedded tunnel can be used anywhere a subprocess.Popen is expected.
+    """
+
+    def __init__(self, engine: 'SSHTransportEngine', config: TunnelConfig):
+        self.engine = engine
+        self.config = config
+        self.pid = os.getpid()
+        self.returncode: Optional[int] = None
+        self.error = ""
+        self.connection: Optional['_SharedConnection'] = None
+        self.listener: Optional[socket.socket] = None
+        self.remote_forward_port: Optional[int] = None  # remote port this tunnel registered
+        self.remote_handler = None  # its entry in connection.remote_handlers
+        self.remote_forwarded = False  # the server granted the forward
+        self.connections: set = set()
+        self._closed = threading.Event()
+
+    @property
+    def transport(self) -> Optional[paramiko.Transport]:
+        """The (possibly shared) SSH transport carrying this tunnel's forwards."""
+        return self.connection.transport if self.connection else None
+
+    def poll(self) -> Optional[int]:
+        """Return None while the tunnel is up, otherwise its exit code."""
+        if self.returncode is None and self.connection is not None:
+            transport = self.transport
+            if transport is None or not transport.is_active():
+                self._fail("SSH connection lost")
+        return self.returncode
+
+    def terminate(self):
+        """Close the tunnel's forwards and SSH connection."""
+        self.engine.close_tunnel(self)
+
+    kill = terminate
+
+    def round_trip(self, timeout: float) -> Optional[float]:
+        """Seconds until the server answers a keepalive request; None on failure.
+
+        Servers answer keepalive@openssh.com (a failure reply is fine) from
+        the SSH connection itself, without opening a channel (which would
+        count against MaxSessions) or touching a forward's target, so this
+        times the tunnel's link to the server. Like the pool's health check,
+        the request waits on a helper thread, as global_request has no
+        timeout of its own.
+        """
+        connection = self.connection
+        transport = self.transport
+        if transport is None or not transport.is_active():
+            return None
+        if not connection.request_lock.acquire(timeout=timeout):
+            return None
+        answered = threading.Event()
+
+        def request():
+            try:
+                transport.global_request("keepalive@openssh.com", wait=True)
+            except Exception:
+                return
+            finally:
+                connection.request_lock.release()
+            answered.set()
+
+        started = time.perf_counter()
+        threading.Thread(target=request, name="ssh-engine-round-trip", daemon=True).start()
+        if not answered.wait(timeout) or not transport.is_active():
+            return None
+        return time.perf_counter() - started
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Wait until the tunnel has been closed."""
+        self._closed.wait(timeout)
+        return self.returncode
+
+    def _fail(self, message: str, return_code: int = 255):
+        """Record a failure and tear the tunnel down."""
+        if self.returncode is None:
+            self.error = message
+            self.returncode = return_code
+        self.engine.close_tunnel(self)
+
+
+class _SharedConnection:
+    """An authenticated SSH connection shared by all tunnels to one endpoint."""
+
+    def __init__(self, key: ConnectionKey):
+        self.key = key
+        self.client: Optional[paramiko.SSHClient] = None
+        self.error: Optional[Exception] = None
+        self.refs = 0
+        self.ready = threading.Event()
+        self.remote_handlers: Dict[int, object] = {}
+        # paramiko tracks the reply of one global request at a time
+        self.request_lock = threading.Lock()
+
+    @property
+    def transport(self) -> Optional[paramiko.Transport]:
+        return self.client.get_transport() if self.client else None
+
+    def is_usable(self) -> bool:
+        """False once connecting failed or the transport has died."""
+        if self.error is not None:
+            return False
+        if not self.ready.is_set():
+            return True  # Still connecting
+        transport = self.transport
+        return transport is not None and transport.is_active()
+
+    def dispatch_remote(self, channel, origin, server):
+        """Route an incoming forwarded-tcpip channel to the tunnel owning its port.
+
+        paramiko keeps a single port-forward handler per transport, so all
+        remote forwards on a shared transport go through here.
+        """
+        handler = self.remote_handlers.get(server[1])
+        if handler is None:
+            channel.close()
+            return
+        handler(channel, origin, server)
+
+
+class _Endpoint:
+    """One side of a relayed connection: a local socket or an SSH channel."""
+
+    def __init__(self, fileobj, is_channel: bool):
+        self.fileobj = fileobj
+        self.is_channel = is_channel
+        self.peer: Optional['_Endpoint'] = None
+        self.relay: Optional['_Relay'] = None
+        self.outgoing = bytearray()  # read from the peer, not yet written here
+        self.eof = False  # nothing more to read from this side
+        self.write_shut = False  # the peer's EOF has been passed on to this side
+        self.events = 0  # selector events currently registered
+
+
+class _Relay:
+    """A local socket and an SSH channel copied to each other."""
+
+    def __init__(self, handle: EmbeddedTunnelHandle, local, channel):
+        self.handle = handle
+        self.local = _Endpoint(local, False)
+        self.channel = _Endpoint(channel, True)
+        self.local.peer, self.channel.peer = self.channel, self.local
+        self.local.relay = self.channel.relay = self
+        self.closed = False
+
+
+class _ForwardPump:
+    """Single selector thread copying data between paired sockets/channels.
+
+    Both ends of a pair are non-blocking, so a slow peer never stalls the
+    thread. Data a peer can't take yet waits in that endpoint's outgoing
+    buffer; while the buffer holds ENGINE_WRITE_BUFFER_LIMIT bytes or more
+    the other side isn't read, which pushes back on the sender. Sockets are
+    watched for writability; a channel has no writable event, so channels
+    with queued data are retried every ENGINE_WINDOW_POLL_INTERVAL until
+    the remote window opens.
+
+    EOF is passed on as a half-close (shutdown(SHUT_WR) on a socket,
+    shutdown_write() on a channel) once the data before it has been
+    written, so the other direction keeps flowing; a pair is closed when
+    both directions have finished.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._pending = deque()
+        self._endpoints: Dict[object, _Endpoint] = {}  # socket or channel -> endpoint
+        self._blocked_channels: set = set()  # channel endpoints with data queued
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(target=self._run, name="ssh-engine-pump", daemon=True)
+        self._thread.start()
+
+    def add_listener(self, listener: socket.socket, on_accept):
+        """Call on_accept(conn) on the pump thread for each accepted connection."""
+        self._submit(('listen', listener, on_accept))
+
+    def add_pair(self, handle: EmbeddedTunnelHandle, local, channel):
+        """Start relaying between a local socket and an SSH channel."""
+        handle.connections.add((local, channel))
+        self._submit(('pair', handle, local, channel))
+
+    def remove(self, fileobj):
+        """Stop watching a listener, or close the pair one end belongs to."""
+        self._submit(('remove', fileobj))
+
+    def _submit(self, command):
+        self._pending.append(command)
+        try:
+            self._wake_writer.send(b'\0')
+        except OSError:
+            pass
+
+    def _run(self):
+        while True:
+            timeout = ENGINE_WINDOW_POLL_INTERVAL if self._blocked_channels else None
+            for key, mask in self._selector.select(timeout):
+                if key.data is None:
+                    self._drain_wakeups()
+                    self._apply_pending()
+                elif key.data[0] == 'listen':
+                    self._accept(key.fileobj, key.data[1])
+                else:
+                    endpoint = key.data[1]
+                    if mask & selectors.EVENT_WRITE:
+                        self._flush(endpoint)
+                    if mask & selectors.EVENT_READ and not endpoint.relay.closed:
+                        self._read(endpoint)
+            for endpoint in list(self._blocked_channels):
+                self._flush(endpoint)
+
+    def _drain_wakeups(self):
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _apply_pending(self):
+        while self._pending:
+            command = self._pending.popleft()
+            if command[0] == 'listen':
+                _, listener, on_accept = command
+                try:
+                    self._selector.register(listener, selectors.EVENT_READ, ('listen', on_accept))
+                except (KeyError, ValueError, OSError):
+                    pass
+            elif command[0] == 'pair':
+                _, handle, local, channel = command
+                relay = _Relay(handle, local, channel)
+                self._endpoints[local] = relay.local
+                self._endpoints[channel] = relay.channel
+                try:
+                    local.setblocking(False)
+                    channel.setblocking(False)
+                except OSError:
+                    self._close_relay(relay)
+                    continue
+                self._update(relay.local)
+                self._update(relay.channel)
+            else:
+                endpoint = self._endpoints.get(command[1])
+                if endpoint is not None:
+                    self._close_relay(endpoint.relay)
+                    continue
+                try:
+                    self._selector.unregister(command[1])
+                except (KeyError, ValueError):
+                    pass
+
+    def _accept(self, listener: socket.socket, on_accept):
+        try:
+            conn, _ = listener.accept()
+        except OSError:
+            return
+        # The forward handlers (SOCKS handshake etc.) use blocking I/O on a
+        # worker; the pump switches the socket to non-blocking once paired.
+        # Accepted sockets inherit non-blocking mode on some platforms.
+        conn.setblocking(True)
+        on_accept(conn)
+
+    def _read(self, endpoint: _Endpoint):
+        """Move what's available on endpoint into its peer's outgoing buffer."""
+        try:
+            data = endpoint.fileobj.recv(ENGINE_BUFFER_SIZE)
+        except (BlockingIOError, socket.timeout):
+            return
+        except (OSError, EOFError, paramiko.SSHException):
+            self._close_relay(endpoint.relay)
+            return
+        if not data:
+            endpoint.eof = True
+            if endpoint.is_channel and endpoint.fileobj.closed:
+                # The server closed the channel outright; nothing more can be sent
+                self._close_relay(endpoint.relay)
+                return
+            # Pass the EOF on once everything read so far has been delivered
+            self._flush(endpoint.peer)
+            return
+        endpoint.peer.outgoing += data
+        self._flush(endpoint.peer)
+
+    def _flush(self, endpoint: _Endpoint):
+        """Write as much of endpoint's outgoing buffer as it takes without blocking."""
+        if endpoint.relay.closed:
+            self._blocked_channels.discard(endpoint)
+            return
+        if endpoint.outgoing:
+            try:
+                if endpoint.is_channel:
+                    # Channel.send() needs bytes; send_ready() means the window is open
+                    sent = (endpoint.fileobj.send(bytes(endpoint.outgoing[:ENGINE_BUFFER_SIZE]))
+                            if endpoint.fileobj.send_ready() else 0)
+                else:
+                    sent = endpoint.fileobj.send(endpoint.outgoing)
+            except (BlockingIOError, socket.timeout):
+                sent = 0
+            except (OSError, EOFError, paramiko.SSHException):
+                self._close_relay(endpoint.relay)
+                return
+            del endpoint.outgoing[:sent]
+        if endpoint.is_channel and endpoint.outgoing:
+            self._blocked_channels.add(endpoint)
+        else:
+            self._blocked_channels.discard(endpoint)
+        if not endpoint.outgoing and endpoint.peer.eof and not endpoint.write_shut:
+            self._shutdown_write(endpoint)
+            if endpoint.relay.closed:
+                return
+        self._update(endpoint)
+        self._update(endpoint.peer)
+
+    def _update(self, endpoint: _Endpoint):
+        """Watch for reads unless the peer is backed up, and for writes while data is queued."""
+        events = 0
+        if not endpoint.eof and len(endpoint.peer.outgoing) < ENGINE_WRITE_BUFFER_LIMIT:
+            events |= selectors.EVENT_READ
+        if endpoint.outgoing and not endpoint.is_channel:
+            events |= selectors.EVENT_WRITE
+        if events == endpoint.events or endpoint.relay.closed:
+            return
+        try:
+            if not endpoint.events:
+                self._selector.register(endpoint.fileobj, events, ('relay', endpoint))
+            elif not events:
+                self._selector.unregister(endpoint.fileobj)
+            else:
+                self._selector.modify(endpoint.fileobj, events, ('relay', endpoint))
+        except (KeyError, ValueError, OSError):
+            self._close_relay(endpoint.relay)
+            return
+        endpoint.events = events
+
+    def _shutdown_write(self, endpoint: _Endpoint):
+        """Send EOF to endpoint; close the pair if the other direction is done too."""
+        endpoint.write_shut = True
+        try:
+            if endpoint.is_channel:
+                endpoint.fileobj.shutdown_write()
+            else:
+                endpoint.fileobj.shutdown(socket.SHUT_WR)
+        except (OSError, EOFError, paramiko.SSHException):
+            self._close_relay(endpoint.relay)
+            return
+        if endpoint.peer.write_shut:
+            self._close_relay(endpoint.relay)
+
+    def _close_relay(self, relay: _Relay):
+        if relay.closed:
+            return
+        relay.closed = True
+        for endpoint in (relay.local, relay.channel):
+            if endpoint.events:
+                try:
+                    self._selector.unregister(endpoint.fileobj)
+                except (KeyError, ValueError):
+                    pass
+                endpoint.events = 0
+            self._blocked_channels.discard(endpoint)
+            self._endpoints.pop(endpoint.fileobj, None)
+            try:
+                endpoint.fileobj.close()
+            except Exception:
+                pass
+        relay.handle.connections.discard((relay.local.fileobj, relay.channel.fileobj))
+
+
+class SSHTransportEngine:
+    """Runs tunnels over paramiko transports inside the manager process."""
+
+    def __init__(self, worker_threads: int = ENGINE_WORKER_THREADS):
+        self._pump = _ForwardPump()
+        self._workers = ThreadPoolExecutor(max_workers=worker_threads,
+                                           thread_name_prefix="ssh-engine")
+        self._lock = threading.Lock()
+        self._handles: Dict[int, EmbeddedTunnelHandle] = {}
+        self._connections: Dict[ConnectionKey, _SharedConnection] = {}
+
+    def open_tunnel(self, config: TunnelConfig) -> EmbeddedTunnelHandle:
+        """Start a tunnel; connection and authentication happen in the background."""
+        handle = EmbeddedTunnelHandle(self, config)
+        with self._lock:
+            self._handles[id(handle)] = handle
+        self._workers.submit(self._establish, handle)
+        return handle
+
+    def close_tunnel(self, handle: EmbeddedTunnelHandle):
+        """Tear down a tunnel's listener, forwarded connections and transport."""
+        with self._lock:
+            if self._handles.pop(id(handle), None) is None:
+                return
+
+        if handle.listener is not None:
+            self._pump.remove(handle.listener)
+            try:
+                handle.listener.close()
+            except OSError:
+                pass
+
+        transport = handle.transport
+        if transport is not None and handle.remote_forward_port is not None:
+            # Only touch the port this tunnel owns; another tunnel may forward it
+            with self._lock:
+                handlers = handle.connection.remote_handlers
+                if handlers.get(handle.remote_forward_port) is handle.remote_handler:
+                    del handlers[handle.remote_forward_port]
+        if transport is not None and handle.remote_forwarded:
+            try:
+                # Transport.cancel_port_forward() also clears the transport-wide
+                # handler, which would break other remote forwards sharing it
+                with handle.connection.request_lock:
+                    transport.global_request(
+                        "cancel-tcpip-forward", ('', handle.remote_forward_port), wait=True
+                    )
+            except Exception:
+                pass
+
+        for local, channel in list(handle.connections):
+            self._pump.remove(local)
+            self._pump.remove(channel)
+            for endpoint in (local, channel):
+                try:
+                    endpoint.close()
+                except Exception:
+                    pass
+        handle.connections.clear()
+
+        if handle.connection is not None:
+            self._release_connection(handle.connection)
+        if handle.returncode is None:
+            handle.returncode = 0
+        handle._closed.set()
+
+    def active_tunnel_count(self) -> int:
+        """Number of tunnels currently managed by the engine."""
+        with self._lock:
+            return len(self._handles)
+
+    def connection_count(self) -> int:
+        """Number of distinct SSH connections carrying those tunnels."""
+        with self._lock:
+            return len(self._connections)
+
+    # ------------------------------------------------------------------ #
+    # Shared connections
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _connection_key(config: TunnelConfig) -> ConnectionKey:
+        """Tunnels share a transport only if they also authenticate the same way.
+
+        Passwords only enter the key as a hash.
+        """
+        password = ""
+        if config.ssh_password:
+            password = hashlib.sha256(config.ssh_password.encode('utf-8')).hexdigest()
+        return (config.ssh_user, config.ssh_host.lower(), config.ssh_port,
+                config.performance_profile, config.ssh_key_path or "", password)
+
+    def _acquire_connection(self, config: TunnelConfig) -> _SharedConnection:
+        """Get the shared connection for a tunnel's endpoint, connecting if needed."""
+        key = self._connection_key(config)
+        with self._lock:
+            shared = self._connections.get(key)
+            is_owner = shared is None or not shared.is_usable()
+            if is_owner:
+                shared = _SharedConnection(key)
+                self._connections[key] = shared
+            shared.refs += 1
+
+        if is_owner:
+            try:
+                shared.client = self._connect(config)
+            except Exception as e:
+                shared.error = e
+                self._release_connection(shared)
+                raise
+            finally:
+                shared.ready.set()
+        else:
+            # Another tunnel is already connecting to this endpoint
+            if not shared.ready.wait(SSH_TIMEOUT * 2):
+                self._release_connection(shared)
+                raise paramiko.SSHException("Timed out waiting for shared SSH connection")
+            if shared.error is not None:
+                self._release_connection(shared)
+                raise shared.error
+        return shared
+
+    def _release_connection(self, shared: _SharedConnection):
+        """Drop a reference; the connection closes when its last tunnel stops."""
+        with self._lock:
+            shared.refs -= 1
+            if shared.refs > 0:
+                return
+            if self._connections.get(shared.key) is shared:
+                del self._connections[shared.key]
+        if shared.client is not None:
+            shared.client.close()
+
+    # ------------------------------------------------------------------ #
+    # Connection setup (worker pool)
+    # ------------------------------------------------------------------ #
+
+    def _establish(self, handle: EmbeddedTunnelHandle):
+        config = handle.config
+        try:
+            connection = self._acquire_connection(config)
+            with self._lock:
+                # close_tunnel() only cleans up what it finds on the handle
+                stopped = id(handle) not in self._handles
+                if not stopped:
+                    handle.connection = connection
+            if stopped:
+                # Stopped while we were connecting
+                self._release_connection(connection)
+                return
+
+            if config.tunnel_type == 'local':
+                self._start_listener(handle, self._forward_local)
+            elif config.tunnel_type == 'dynamic':
+                self._start_listener(handle, self._forward_socks)
+            else:
+                handler = handle.remote_handler = self._remote_handler(handle)
+                with self._lock:
+                    if id(handle) not in self._handles:
+                        return
+                    port_taken = config.remote_port in connection.remote_handlers
+                    if not port_taken:
+                        # Register before requesting so no early connection is dropped
+                        connection.remote_handlers[config.remote_port] = handler
+                        handle.remote_forward_port = config.remote_port
+                if port_taken:
+                    handle._fail(f"Remote port {config.remote_port} is already forwarded "
+                                 f"by another tunnel on this SSH connection")
+                    return
+                with connection.request_lock:
+                    port = handle.transport.request_port_forward(
+                        '', config.remote_port, handler=connection.dispatch_remote
+                    )
+                with self._lock:
+                    stopped = id(handle) not in self._handles
+                    if not stopped:
+                        if port != config.remote_port:
+                            # Port 0: the server picked one
+                            del connection.remote_handlers[config.remote_port]
+                            connection.remote_handlers[port] = handler
+                        handle.remote_forward_port = port
+                        handle.remote_forwarded = True
+                if stopped:
+                    # close_tunnel() ran during the request and didn't cancel it
+                    with connection.request_lock:
+                        handle.transport.global_request(
+                            "cancel-tcpip-forward", ('', port), wait=True
+                        )
+        except paramiko.AuthenticationException as e:
+            handle._fail(f"SSH authentication failed: {e}")
+        except (OSError, paramiko.SSHException) as e:
+            handle._fail(f"SSH connection failed: {e}")
+        except Exception as e:
+            handle._fail(f"Embedded tunnel failed: {e}")
+
+    @staticmethod
+    def _connect(config: TunnelConfig) -> paramiko.SSHClient:
+        """Open and authenticate an SSH connection for a tunnel."""
+        client = paramiko.SSHClient()
+        # Matches StrictHostKeyChecking=no used for the ssh client backend
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        connect_params = {
+            'hostname': config.ssh_host,
+            'port': config.ssh_port,
+            'username': config.ssh_user,
+            'timeout': SSH_TIMEOUT,
+            'banner_timeout': SSH_TIMEOUT,
+            'auth_timeout': SSH_TIMEOUT,
+        }
+        if config.ssh_key_path and Path(config.ssh_key_path).exists():
+            connect_params['key_filename'] = config.ssh_key_path
+        if config.ssh_password:
+            connect_params['password'] = config.ssh_password
+
+        profile = get_profile(config.performance_profile)
+        connect_params.update(profile.connect_kwargs())
+        client.connect(**connect_params)
+        transport = client.get_transport()
+        transport.set_keepalive(ENGINE_KEEPALIVE_INTERVAL)
+        profile.tune_transport(transport)
+        return client
+
+    def _start_listener(self, handle: EmbeddedTunnelHandle, forward):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(('127.0.0.1', handle.config.local_port))
+        listener.listen(128)
+        listener.setblocking(False)
+        with self._lock:
+            stopped = id(handle) not in self._handles
+            if not stopped:
+                handle.listener = listener
+        if stopped:
+            # close_tunnel() has already run and won't see this listener
+            listener.close()
+            return
+        self._pump.add_listener(
+            listener, lambda conn: self._workers.submit(forward, handle, conn)
+        )
+
+    def _forward_local(self, handle: EmbeddedTunnelHandle, conn: socket.socket):
+        """-L: open a direct-tcpip channel to remote_host:remote_port."""
+        config = handle.config
+        try:
+            channel = handle.transport.open_channel(
+                'direct-tcpip', (config.remote_host, config.remote_port), conn.getpeername()
+            )
+        except Exception:
+            conn.close()
+            return
+        self._pump.add_pair(handle, conn, channel)
+
+    def _remote_handler(self, handle: EmbeddedTunnelHandle):
+        """-R: connect each incoming channel to localhost:local_port."""
+        def handler(channel, origin, server):
+            def connect():
+                try:
+                    conn = socket.create_connection(('localhost', handle.config.local_port),
+                                                    timeout=SSH_TIMEOUT)
+                except OSError:
+                    channel.close()
+                    return
+                self._pump.add_pair(handle, conn, channel)
+            self._workers.submit(connect)
+        return handler
+
+    def _forward_socks(self, handle: EmbeddedTunnelHandle, conn: socket.socket):
+        """-D: minimal SOCKS4/4a/5 (no auth, CONNECT only) over direct-tcpip."""
+        conn.settimeout(SSH_TIMEOUT)
+        try:
+            version = _recv_exact(conn, 1)[0]
+            if version == 5:
+                destination, reply = _socks5_handshake(conn)
+            elif version == 4:
+                destination, reply = _socks4_handshake(conn)
+            else:
+                raise ValueError("Unsupported SOCKS version")
+
+            try:
+                channel = handle.transport.open_channel(
+                    'direct-tcpip', destination, conn.getpeername()
+                )
+            except Exception:
+                conn.sendall(reply(False))
+                raise
+            conn.sendall(reply(True))
+        except Exception:
+            conn.close()
+            return
+        conn.settimeout(None)
+        self._pump.add_pair(handle, conn, channel)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = b''
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("SOCKS client closed the connection")
+        data += chunk
+    return data
+
+
+def _socks5_handshake(conn: socket.socket):
+    method_count = _recv_exact(conn, 1)[0]
+    methods = _recv_exact(conn, method_count)
+    if 0 not in methods:
+        conn.sendall(b'\x05\xff')
+        raise ValueError("SOCKS5 client requires authentication")
+    conn.sendall(b'\x05\x00')
+
+    version, command, _, address_type = _recv_exact(conn, 4)
+    if version != 5 or command != 1:
+        conn.sendall(b'\x05\x07\x00\x01' + b'\0' * 6)
+        raise ValueError("Only SOCKS5 CONNECT is supported")
+    if address_type == 1:
+        host = socket.inet_ntoa(_recv_exact(conn, 4))
+    elif address_type == 3:
+        host = _recv_exact(conn, _recv_exact(conn, 1)[0]).decode('idna')
+    elif address_type == 4:
+        host = socket.inet_ntop(socket.AF_INET6, _recv_exact(conn, 16))
+    else:
+        raise ValueError("Unsupported SOCKS5 address type")
+    port = struct.unpack('!H', _recv_exact(conn, 2))[0]
+
+    def reply(success: bool) -> bytes:
+        return b'\x05' + (b'\x00' if success else b'\x05') + b'\x00\x01' + b'\0' * 6
+    return (host, port), reply
+
+
+def _socks4_handshake(conn: socket.socket):
+    command = _recv_exact(conn, 1)[0]
+    port = struct.unpack('!H', _recv_exact(conn, 2))[0]
+    address = _recv_exact(conn, 4)
+
+    def read_string() -> bytes:
+        data = b''
+        while not data.endswith(b'\0'):
+            data += _recv_exact(conn, 1)
+        return data[:-1]
+
+    read_string()  # user id
+    if address[:3] == b'\0\0\0' and address[3] != 0:
+        host = read_string().decode('idna')  # SOCKS4a
+    else:
+        host = socket.inet_ntoa(address)
+    if command != 1:
+        conn.sendall(b'\x00\x5b' + b'\0' * 6)
+        raise ValueError("Only SOCKS4 CONNECT is supported")
+
+    def reply(success: bool) -> bytes:
+        return b'\x00' + (b'\x5a' if success else b'\x5b') + b'\0' * 6
+    return (host, port), reply
+
+
+_engine: Optional[SSHTransportEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> SSHTransportEngine:
+    """Get the process-wide transport engine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = SSHTransportEngine()
+        return _engine
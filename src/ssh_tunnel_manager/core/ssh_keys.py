@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - SSH Key Discovery
+
+Finds the key file an ssh command line should use without touching the
+disk for every tunnel. The default key (the first of id_rsa, id_ed25519,
+id_ecdsa and id_dsa found in ~/.ssh) is looked up once and kept until
+~/.ssh changes: adding, removing or renaming a file there changes the
+directory's modification time, which is checked at most once per
+KEY_RECHECK_INTERVAL. Whether an explicitly configured key file exists is
+cached for the same interval, so starting or rebuilding thousands of
+tunnels costs a handful of stat calls instead of several per tunnel.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .constants import SSH_DIR_NAME, DEFAULT_SSH_KEY_NAMES, KEY_RECHECK_INTERVAL
+
+
+def default_ssh_dir() -> Path:
+    """The user's ~/.ssh directory."""
+    return Path.home() / SSH_DIR_NAME
+
+
+class KeyDiscovery:
+    """Cached key file lookups for one ssh directory."""
+
+    def __init__(self, ssh_dir: Optional[Path] = None,
+                 recheck_interval: float = KEY_RECHECK_INTERVAL):
+        self.ssh_dir = Path(ssh_dir) if ssh_dir else default_ssh_dir()
+        self.recheck_interval = recheck_interval
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None  # monotonic time of the last directory stat
+        self._dir_mtime: Optional[int] = None  # mtime_ns seen then, -1 when missing
+        self._default_key: Optional[str] = None
+        self._exists: Dict[str, bool] = {}  # explicit key path -> exists
+
+    def default_key(self) -> Optional[str]:
+        """Path of the first default key present in the ssh directory."""
+        with self._lock:
+            self._refresh()
+            return self._default_key
+
+    def key_exists(self, path: str) -> bool:
+        """Whether a key file exists, as of at most recheck_interval ago."""
+        if not path:
+            return False
+        with self._lock:
+            self._refresh()
+            exists = self._exists.get(path)
+            if exists is None:
+                exists = self._exists[path] = os.path.exists(path)
+            return exists
+
+    def resolve(self, key_path: str = "") -> Optional[str]:
+        """Key ssh should use: key_path if it exists, else the default key."""
+        if self.key_exists(key_path):
+            return key_path
+        return self.default_key()
+
+    def invalidate(self):
+        """Forget every cached lookup, e.g. when a watcher reports a change."""
+        with self._lock:
+            self._checked_at = None
+            self._dir_mtime = None
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _refresh(self):
+        """Re-check the disk if the cached lookups are due (lock held)."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.recheck_interval:
+            return
+        self._checked_at = now
+        # Explicit key paths may live anywhere, so they are simply re-checked
+        self._exists.clear()
+        try:
+            mtime = self.ssh_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        if mtime == self._dir_mtime:
+            return
+        self._dir_mtime = mtime
+        self._default_key = None
+        if mtime != -1:
+            for name in DEFAULT_SSH_KEY_NAMES:
+                key_path = self.ssh_dir / name
+                if key_path.exists():
+                    self._default_key = str(key_path)
+                    break
+
+
+_discovery: Optional[KeyDiscovery] = None
+_discovery_lock = threading.Lock()
+
+
+def get_key_discovery() -> KeyDiscovery:
+    """Get the process-wide key discovery for ~/.ssh, creating it on first use."""
+    global _discovery
+    with _discovery_lock:
+        if _discovery is None:
+            _discovery = KeyDiscovery()
+        return _discovery
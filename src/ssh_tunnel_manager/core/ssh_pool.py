@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - SSH Connection Pool
+
+Keeps authenticated paramiko connections around between file transfers,
+directory listings, key deployment and multi-hop browsing, so back-to-back
+operations against the same server skip TCP connect, key exchange and
+authentication.
+
+Connections are keyed by (host, port, user, auth). Each borrower gets its
+own PooledSession; sessions on the same connection share the transport and
+each gets a separate SFTP channel, which is kept open for the next borrower
+when the session is released. Idle connections are closed after
+POOL_IDLE_TIMEOUT, and connections that have been idle for a while are
+probed before they are handed out again.
+"""
+
+import hashlib
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import paramiko
+
+from .constants import (
+    SSH_TIMEOUT, ENGINE_KEEPALIVE_INTERVAL, POOL_IDLE_TIMEOUT,
+    POOL_HEALTH_CHECK_INTERVAL, POOL_HEALTH_CHECK_TIMEOUT, POOL_REAP_INTERVAL,
+    POOL_MAX_IDLE_SFTP, SFTP_WINDOW_SIZE
+)
+from .ssh_profiles import PROFILE_DEFAULT, get_profile
+
+PoolKey = Tuple[str, int, str, str, str, Optional[tuple]]
+
+
+class _PooledConnection:
+    """One authenticated SSH connection and its idle SFTP channels."""
+
+    def __init__(self, key: PoolKey, via: Optional['PooledSession'] = None):
+        self.key = key
+        self.via = via  # jump host session, held for as long as this connection lives
+        self.client: Optional[paramiko.SSHClient] = None
+        self.ready = threading.Event()
+        self.error: Optional[Exception] = None
+        self.refs = 0
+        self.idle_sftp: List[paramiko.SFTPClient] = []
+        self.sftp_window_size = SFTP_WINDOW_SIZE
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        self.closed = False
+
+    @property
+    def transport(self) -> Optional[paramiko.Transport]:
+        return self.client.get_transport() if self.client else None
+
+    def is_usable(self) -> bool:
+        """True while connecting or while the transport is still up."""
+        if self.closed or self.error is not None:
+            return False
+        if not self.ready.is_set():
+            return True
+        transport = self.transport
+        return transport is not None and transport.is_active()
+
+    def check_health(self, timeout: float = POOL_HEALTH_CHECK_TIMEOUT) -> bool:
+        """Make sure the peer still answers, with a keepalive request round trip.
+
+        Servers reply to keepalive@openssh.com (a failure reply is fine); a
+        dead or half-open peer never does, so the connection counts as
+        unhealthy once timeout seconds pass without an answer. paramiko's
+        global_request has no timeout of its own, so it waits on a helper
+        thread, which ends when the answer comes or the transport closes.
+        """
+        transport = self.transport
+        if transport is None or not transport.is_active():
+            return False
+        answered = threading.Event()
+
+        def request():
+            try:
+                transport.global_request("keepalive@openssh.com", wait=True)
+            except Exception:
+                return
+            answered.set()
+
+        threading.Thread(target=request, name="pool-health-check", daemon=True).start()
+        if not answered.wait(timeout):
+            return False
+        self.last_checked = time.monotonic()
+        return self.is_usable()
+
+    def close(self):
+        self.closed = True
+        for sftp in self.idle_sftp:
+            try:
+                sftp.close()
+            except Exception:
+                pass
+        self.idle_sftp.clear()
+        if self.client is not None:
+            self.client.close()
+        if self.via is not None:
+            self.via.release()
+            self.via = None
+
+
+class PooledSession:
+    """A borrowed connection from SSHConnectionPool.
+
+    Use client for exec_command/open_channel and sftp() for file operations.
+    Call release() (or use SSHConnectionPool.session()) when done; the
+    connection and its SFTP channel stay open for the next borrower.
+    """
+
+    def __init__(self, pool: 'SSHConnectionPool', connection: _PooledConnection):
+        self.pool = pool
+        self.connection = connection
+        self._sftp: Optional[paramiko.SFTPClient] = None
+        self._released = False
+
+    @property
+    def client(self) -> paramiko.SSHClient:
+        return self.connection.client
+
+    @property
+    def transport(self) -> Optional[paramiko.Transport]:
+        return self.connection.transport
+
+    def sftp(self) -> paramiko.SFTPClient:
+        """SFTP client for this session, reusing an idle channel if there is one."""
+        if self._sftp is None:
+            self._sftp = self.pool._take_sftp(self.connection)
+        return self._sftp
+
+    def release(self):
+        """Return the session to the pool."""
+        if not self._released:
+            self._released = True
+            self.pool._release(self, self._sftp)
+            self._sftp = None
+
+
+class SSHConnectionPool:
+    """Process-wide pool of authenticated SSH connections."""
+
+    def __init__(self, idle_timeout: float = POOL_IDLE_TIMEOUT,
+                 health_check_interval: float = POOL_HEALTH_CHECK_INTERVAL):
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._connections: Dict[PoolKey, _PooledConnection] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+
+    @staticmethod
+    def make_key(hostname: str, port: int = 22, username: str = "",
+                 password: Optional[str] = None, key_filename: Optional[str] = None,
+                 via: Optional['PooledSession'] = None,
+                 profile: Optional[str] = None) -> PoolKey:
+        """Pool key for a set of connection parameters.
+
+        Passwords only enter the key as a hash.
+        """
+        if password:
+            auth = "password:" + hashlib.sha256(password.encode('utf-8')).hexdigest()
+        elif key_filename:
+            auth = "key:" + key_filename
+        else:
+            auth = "default"
+        via_key = via.connection.key if via is not None else None
+        return (hostname.lower(), int(port), username, auth, profile or PROFILE_DEFAULT, via_key)
+
+    def acquire(self, hostname: str, port: int = 22, username: str = "",
+                password: Optional[str] = None, key_filename: Optional[str] = None,
+                via: Optional['PooledSession'] = None,
+                timeout: float = SSH_TIMEOUT,
+                profile: Optional[str] = None) -> PooledSession:
+        """Borrow a session, connecting only if no usable connection exists.
+
+        With via, the connection is made through a direct-tcpip channel on
+        that (jump host) session instead of a direct TCP connection. profile
+        names the performance profile (core.ssh_profiles) to connect with.
+        """
+        key = self.make_key(hostname, port, username, password, key_filename, via, profile)
+        stale = []
+        checked = None  # connection already health-checked by this call
+        while True:
+            with self._lock:
+                connection = self._connections.get(key)
+                needs_check = (
+                    connection is not None and connection is not checked
+                    and connection.ready.is_set() and connection.refs == 0
+                    and time.monotonic() - connection.last_checked > self.health_check_interval
+                )
+                if needs_check:
+                    # Hold a reference so the reaper leaves it alone during the check
+                    connection.refs += 1
+                else:
+                    if connection is None or not connection.is_usable():
+                        if connection is not None:
+                            stale.append(connection)
+                        connection = _PooledConnection(key)
+                        self._connections[key] = connection
+                        is_owner = True
+                    else:
+                        is_owner = False
+                    connection.refs += 1
+                    connection.last_used = time.monotonic()
+                    break
+            # Idle for a while: make sure it still works before handing it out.
+            # This waits for a network round trip, so it runs outside the
+            # pool-wide lock.
+            healthy = connection.check_health()
+            checked = connection
+            with self._lock:
+                connection.refs -= 1
+                if not healthy:
+                    connection.closed = True
+        for old in stale:
+            self._close_connection(old)
+        self._ensure_reaper()
+
+        if is_owner:
+            try:
+                connection.client = self._connect(
+                    hostname, port, username, password, key_filename, via, timeout, profile
+                )
+                connection.sftp_window_size = get_profile(profile).window_size or SFTP_WINDOW_SIZE
+                if via is not None:
+                    # The hop connection keeps the jump host borrowed
+                    connection.via = self.acquire_shared(via)
+            except Exception as e:
+                connection.error = e
+                self._drop(connection)
+                raise
+            finally:
+                connection.ready.set()
+        else:
+            # Another borrower is already connecting to this server
+            if not connection.ready.wait(timeout * 2):
+                self._drop(connection)
+                raise paramiko.SSHException("Timed out waiting for pooled SSH connection")
+            if connection.error is not None:
+                self._drop(connection)
+                raise connection.error
+
+        return PooledSession(self, connection)
+
+    def acquire_shared(self, session: PooledSession) -> PooledSession:
+        """Borrow another session on the same connection as an existing one."""
+        with self._lock:
+            session.connection.refs += 1
+        return PooledSession(self, session.connection)
+
+    @contextmanager
+    def session(self, hostname: str, port: int = 22, username: str = "",
+                password: Optional[str] = None, key_filename: Optional[str] = None,
+                via: Optional['PooledSession'] = None,
+                timeout: float = SSH_TIMEOUT,
+                profile: Optional[str] = None) -> Iterator[PooledSession]:
+        """Context manager around acquire()/release()."""
+        session = self.acquire(hostname, port, username, password, key_filename, via, timeout, profile)
+        try:
+            yield session
+        finally:
+            session.release()
+
+    def connection_count(self) -> int:
+        """Number of open pooled connections."""
+        with self._lock:
+            return len(self._connections)
+
+    def evict_idle(self) -> int:
+        """Close connections nobody has used for idle_timeout; returns how many."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                connection for connection in self._connections.values()
+                if connection.refs == 0 and connection.ready.is_set()
+                and (now - connection.last_used > self.idle_timeout or not connection.is_usable())
+            ]
+            for connection in expired:
+                del self._connections[connection.key]
+        for connection in expired:
+            self._close_connection(connection)
+        return len(expired)
+
+    def close_all(self):
+        """Close every pooled connection (borrowed sessions stop working)."""
+        self._reaper_stop.set()
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for connection in connections:
+            self._close_connection(connection)
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _connect(hostname: str, port: int, username: str, password: Optional[str],
+                 key_filename: Optional[str], via: Optional[PooledSession],
+                 timeout: float, profile: Optional[str] = None) -> paramiko.SSHClient:
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+
+        connect_params = {
+            'hostname': hostname,
+            'port': port,
+            'username': username,
+            'timeout': timeout,
+            'banner_timeout': timeout,
+            'auth_timeout': timeout,
+        }
+        if password:
+            connect_params['password'] = password
+        if key_filename:
+            connect_params['key_filename'] = key_filename
+        if via is not None:
+            connect_params['sock'] = via.transport.open_channel(
+                'direct-tcpip', (hostname, port), ('127.0.0.1', 0), timeout=timeout
+            )
+
+        performance = get_profile(profile)
+        connect_params.update(performance.connect_kwargs())
+        client.connect(**connect_params)
+        transport = client.get_transport()
+        transport.set_keepalive(ENGINE_KEEPALIVE_INTERVAL)
+        performance.tune_transport(transport)
+        if via is None:
+            # Many small SFTP requests from parallel channels: don't let
+            # Nagle hold them back waiting for delayed ACKs
+            transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return client
+
+    def _take_sftp(self, connection: _PooledConnection) -> paramiko.SFTPClient:
+        with self._lock:
+            while connection.idle_sftp:
+                sftp = connection.idle_sftp.pop()
+                if not sftp.get_channel().closed:
+                    return sftp
+        # A large channel window keeps pipelined transfers from stalling
+        # on window updates over high-latency links
+        return paramiko.SFTPClient.from_transport(
+            connection.transport, window_size=connection.sftp_window_size
+        )
+
+    def _release(self, session: PooledSession, sftp: Optional[paramiko.SFTPClient]):
+        connection = session.connection
+        close_sftp = sftp is not None
+        with self._lock:
+            connection.refs -= 1
+            connection.last_used = time.monotonic()
+            if (sftp is not None and not sftp.get_channel().closed and connection.is_usable()
+                    and len(connection.idle_sftp) < POOL_MAX_IDLE_SFTP):
+                # Back to the start directory so the next borrower sees a fresh session
+                sftp.chdir(None)
+                connection.idle_sftp.append(sftp)
+                close_sftp = False
+            drop = connection.refs == 0 and not connection.is_usable()
+            if drop and self._connections.get(connection.key) is connection:
+                del self._connections[connection.key]
+        if close_sftp:
+            try:
+                sftp.close()
+            except Exception:
+                pass
+        if drop:
+            self._close_connection(connection)
+
+    def _drop(self, connection: _PooledConnection):
+        """Release a reference taken in acquire() that never became a session."""
+        with self._lock:
+            connection.refs -= 1
+            if connection.refs > 0:
+                return
+            if self._connections.get(connection.key) is connection:
+                del self._connections[connection.key]
+        self._close_connection(connection)
+
+    @staticmethod
+    def _close_connection(connection: _PooledConnection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _ensure_reaper(self):
+        """Start the idle-eviction thread on first use."""
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper_stop.clear()
+            self._reaper = threading.Thread(
+                target=self._reap_loop, name="ssh-pool-reaper", daemon=True
+            )
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._reaper_stop.wait(POOL_REAP_INTERVAL):
+            self.evict_idle()
+
+
+_pool: Optional[SSHConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> SSHConnectionPool:
+    """Get the process-wide connection pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SSHConnectionPool()
+        return _pool
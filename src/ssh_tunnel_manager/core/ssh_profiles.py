@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - SSH Performance Profiles
+
+Named sets of transport settings for tunnels and SFTP sessions: compression,
+cipher and MAC preference, IP type of service, rekey limit and channel
+window size. The same profile is turned into ssh client options for the
+terminal backend and applied to paramiko transports for embedded tunnels
+and pooled SFTP connections.
+
+Cipher preference depends on the CPU: with AES instructions AES-GCM is the
+fastest authenticated cipher, without them chacha20-poly1305 is. Profiles
+only reorder algorithms, never remove them: paramiko's lists are
+reordered in place, and the ssh client gets the preferred ciphers and MACs
+with the '^' prefix, which moves them to the front of its defaults
+(OpenSSH 7.9 or later), so every algorithm the server might need is still
+offered.
+"""
+
+import functools
+import inspect
+import platform
+import socket
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import paramiko
+
+PROFILE_DEFAULT = "default"
+PROFILE_INTERACTIVE = "interactive"
+PROFILE_BULK = "bulk"
+PROFILE_CONSTRAINED = "constrained"
+
+_AES_GCM = ('aes128-gcm@openssh.com', 'aes256-gcm@openssh.com')
+_CHACHA = ('chacha20-poly1305@openssh.com',)
+_AES_CTR = ('aes128-ctr', 'aes192-ctr', 'aes256-ctr')
+
+# IP_TOS values matching OpenSSH's IPQoS keywords
+_IP_TOS = {'lowdelay': 0x10, 'throughput': 0x08}
+
+
+@functools.lru_cache(maxsize=None)
+def aes_accelerated() -> bool:
+    """Whether the CPU has AES instructions (AES-NI / ARMv8 crypto).
+
+    Only Linux exposes the CPU flags cheaply; elsewhere every supported
+    64-bit CPU has them.
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/cpuinfo') as f:
+                for line in f:
+                    if line.startswith(('flags', 'Features')):
+                        return 'aes' in line.split(':', 1)[1].split()
+        except OSError:
+            pass
+    return platform.machine().lower() in ('x86_64', 'amd64', 'arm64', 'aarch64')
+
+
+def preferred_ciphers() -> Tuple[str, ...]:
+    """Authenticated ciphers fastest first for this CPU, then AES-CTR fallbacks."""
+    fast = _AES_GCM + _CHACHA if aes_accelerated() else _CHACHA + _AES_GCM
+    return fast + _AES_CTR
+
+
+def prefer(available: Sequence[str], wanted: Sequence[str]) -> Tuple[str, ...]:
+    """available reordered so the wanted entries it contains come first."""
+    head = tuple(name for name in wanted if name in available)
+    return head + tuple(name for name in available if name not in head)
+
+
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """Transport settings for one kind of link or workload.
+
+    Settings left at None/0/"" keep the ssh client's or paramiko's default.
+    """
+    name: str
+    label: str
+    description: str
+    compression: Optional[bool] = None
+    tune_ciphers: bool = False
+    macs: Tuple[str, ...] = ()
+    ip_qos: str = ""  # 'lowdelay' or 'throughput'
+    rekey_limit: str = ""  # ssh RekeyLimit data limit, e.g. '4G'
+    window_size: int = 0  # bytes per SSH channel window
+
+    def ssh_options(self) -> List[str]:
+        """Options for the ssh command line.
+
+        Values contain no spaces, since the terminal backend joins the
+        command into a shell string.
+        """
+        options = []
+        if self.compression is not None:
+            options.extend(['-o', f"Compression={'yes' if self.compression else 'no'}"])
+        # '^' puts these first in the client's default list instead of replacing it
+        if self.tune_ciphers:
+            options.extend(['-o', 'Ciphers=^' + ','.join(preferred_ciphers())])
+        if self.macs:
+            options.extend(['-o', 'MACs=^' + ','.join(self.macs)])
+        if self.ip_qos:
+            options.extend(['-o', f'IPQoS={self.ip_qos}'])
+        if self.rekey_limit:
+            options.extend(['-o', f'RekeyLimit={self.rekey_limit}'])
+        return options
+
+    def connect_kwargs(self) -> Dict[str, object]:
+        """Extra keyword arguments for paramiko.SSHClient.connect()."""
+        kwargs: Dict[str, object] = {}
+        if self.compression is not None:
+            kwargs['compress'] = self.compression
+        if (self.tune_ciphers or self.macs) and _HAS_TRANSPORT_FACTORY:
+            kwargs['transport_factory'] = self._make_transport
+        return kwargs
+
+    def tune_transport(self, transport: paramiko.Transport):
+        """Apply the settings that can be changed on a connected transport."""
+        if self.window_size:
+            # Used for every channel opened from now on
+            transport.default_window_size = self.window_size
+        tos = _IP_TOS.get(self.ip_qos)
+        if tos is not None and isinstance(transport.sock, socket.socket):
+            try:
+                transport.sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, tos)
+            except (OSError, AttributeError):
+                pass  # IPv6 socket or platform without IP_TOS
+
+    def _make_transport(self, sock, **kwargs) -> paramiko.Transport:
+        transport = paramiko.Transport(sock, **kwargs)
+        options = transport.get_security_options()
+        if self.tune_ciphers:
+            options.ciphers = prefer(options.ciphers, preferred_ciphers())
+        if self.macs:
+            options.digests = prefer(options.digests, self.macs)
+        return transport
+
+
+# SSHClient.connect() accepts transport_factory from paramiko 3.2 on; older
+# versions only get compression, window size and IP_TOS from a profile
+_HAS_TRANSPORT_FACTORY = 'transport_factory' in inspect.signature(paramiko.SSHClient.connect).parameters
+
+PROFILES: Dict[str, PerformanceProfile] = {
+    profile.name: profile for profile in (
+        PerformanceProfile(
+            PROFILE_DEFAULT, "Default",
+            "ssh client and paramiko defaults",
+        ),
+        PerformanceProfile(
+            PROFILE_INTERACTIVE, "Low-latency interactive",
+            "Shells, RDP and VNC: no compression, fastest cipher, low-delay packets",
+            compression=False, tune_ciphers=True,
+            macs=('umac-64-etm@openssh.com', 'hmac-sha2-256-etm@openssh.com'),
+            ip_qos='lowdelay',
+        ),
+        PerformanceProfile(
+            PROFILE_BULK, "Bulk throughput",
+            "File transfers and video streams on fast links: no compression, "
+            "fastest cipher, large channel windows",
+            compression=False, tune_ciphers=True,
+            macs=('umac-128-etm@openssh.com', 'hmac-sha2-256-etm@openssh.com'),
+            ip_qos='throughput', rekey_limit='4G', window_size=16 * 1024 * 1024,
+        ),
+        PerformanceProfile(
+            PROFILE_CONSTRAINED, "Constrained link",
+            "Slow or metered links: compression, short MACs, small channel windows",
+            compression=True, tune_ciphers=True,
+            macs=('umac-64-etm@openssh.com', 'hmac-sha2-256-etm@openssh.com'),
+            ip_qos='lowdelay', window_size=1024 * 1024,
+        ),
+    )
+}
+
+
+def get_profile(name: Optional[str]) -> PerformanceProfile:
+    """Profile by name; unknown or empty names give the default profile."""
+    return PROFILES.get(name or PROFILE_DEFAULT, PROFILES[PROFILE_DEFAULT])
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Parallel SFTP Transfer Queue
+
+Runs uploads and downloads of files and whole directory trees across
+several SFTP channels at once. Directories are expanded by the workers
+themselves (local walk for uploads, remote listing for downloads), so
+scanning a large tree overlaps with transferring the files already found.
+Large files are resumed from a partial destination and checksum-verified
+(see transfer_resume). Each worker borrows its own session from the connection pool; sessions on
+one server share a single transport, so extra channels cost no extra
+handshakes.
+"""
+
+import itertools
+import os
+import posixpath
+import stat
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .constants import TRANSFER_PARALLEL_CHANNELS, SFTP_PROGRESS_INTERVAL
+from .sftp_transfer import SFTPTransferEngine, TransferCancelled
+from .transfer_resume import ResumableTransfer, is_resumable
+from .delta_sync import DeltaUploader
+from .ssh_pool import PooledSession, SSHConnectionPool, get_pool
+
+_job_ids = itertools.count(1)
+
+
+@dataclass
+class TransferJob:
+    """A single file (or directory to expand) in a TransferQueue."""
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CANCELLED = "cancelled"
+
+    operation: str  # 'upload' or 'download'
+    local_path: str
+    remote_path: str
+    is_dir: bool = False
+    size: Optional[int] = None
+    status: str = STATUS_QUEUED
+    bytes_done: int = 0
+    error: str = ""
+    job_id: int = field(default_factory=lambda: next(_job_ids))
+
+    @property
+    def name(self) -> str:
+        path = self.local_path if self.operation == 'upload' else self.remote_path
+        return os.path.basename(path.rstrip('/\\')) or path
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED, self.STATUS_CANCELLED)
+
+
+# on_update(changed_jobs, bytes_done, total_bytes, bytes_per_second)
+UpdateCallback = Callable[[List[TransferJob], int, int, float], None]
+
+
+class TransferQueue:
+    """Transfer files and directory trees over N parallel SFTP channels.
+
+    Jobs can be added while the queue is running; add_upload/add_download
+    return False once the queue has finished, in which case a new queue is
+    needed. run() blocks until every job has finished and reports progress
+    to its callback from the calling thread, batched every
+    SFTP_PROGRESS_INTERVAL seconds.
+
+    With resume, files of at least SFTP_RESUME_MIN_SIZE continue from an
+    existing partial destination; verify additionally checks them with
+    chunked SHA-256 hashes once transferred. With delta, uploads over an
+    existing remote file only send the blocks that changed.
+    """
+
+    def __init__(self, ssh_config: Dict[str, Any],
+                 parallel: int = TRANSFER_PARALLEL_CHANNELS,
+                 engine: Optional[SFTPTransferEngine] = None,
+                 pool: Optional[SSHConnectionPool] = None,
+                 resume: bool = True, verify: bool = True, delta: bool = False):
+        self.ssh_config = ssh_config
+        self.parallel = max(1, parallel)
+        self.engine = engine or SFTPTransferEngine()
+        self.pool = pool or get_pool()
+        self.resumable = ResumableTransfer(self.engine, verify=verify) if resume else None
+        self.delta = DeltaUploader(self.engine) if delta else None
+
+        self.jobs: List[TransferJob] = []
+        self._pending: Deque[TransferJob] = deque()
+        self._outstanding = 0  # queued + running jobs
+        self._changed: Dict[int, TransferJob] = {}
+        self._bytes_done = 0
+        self._total_bytes = 0
+        self._live_workers = 0
+        self._closed = False
+        self._cancelled = False
+        self._condition = threading.Condition()
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    def add_upload(self, local_path: str, remote_dir: str) -> bool:
+        """Queue a local file or directory for upload into remote_dir."""
+        name = os.path.basename(os.path.normpath(local_path))
+        is_dir = os.path.isdir(local_path)
+        return self._add(TransferJob(
+            'upload', local_path, posixpath.join(remote_dir, name),
+            is_dir=is_dir, size=None if is_dir else os.path.getsize(local_path)
+        ))
+
+    def add_download(self, remote_path: str, local_dir: str, is_dir: bool = False,
+                     size: Optional[int] = None) -> bool:
+        """Queue a remote file or directory for download into local_dir."""
+        name = posixpath.basename(remote_path.rstrip('/'))
+        return self._add(TransferJob(
+            'download', os.path.join(local_dir, name), remote_path, is_dir=is_dir, size=size
+        ))
+
+    def add_job(self, job: TransferJob) -> bool:
+        """Queue a prepared job (explicit local and remote destination)."""
+        return self._add(job)
+
+    def cancel(self):
+        """Stop after the files currently in flight; queued jobs are cancelled."""
+        with self._condition:
+            self._cancelled = True
+            while self._pending:
+                job = self._pending.popleft()
+                job.status = TransferJob.STATUS_CANCELLED
+                self._finish_locked(job)
+            self._condition.notify_all()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self, on_update: Optional[UpdateCallback] = None) -> List[TransferJob]:
+        """Process jobs until the queue is empty; returns all file jobs."""
+        started = time.monotonic()
+        # Connect once up front so authentication errors surface immediately
+        first_session = self._acquire()
+
+        workers = []
+        self._live_workers = self.parallel
+        for index in range(self.parallel):
+            session = first_session if index == 0 else None
+            worker = threading.Thread(
+                target=self._worker, args=(session,),
+                name=f"sftp-transfer-{index}", daemon=True
+            )
+            worker.start()
+            workers.append(worker)
+
+        next_report = time.monotonic()
+        while True:
+            with self._condition:
+                # Job changes notify the condition; only wake early to finish
+                while not self._closed and next_report > time.monotonic():
+                    self._condition.wait(next_report - time.monotonic())
+                if self._closed:
+                    break
+            self._report(on_update, started)
+            next_report = time.monotonic() + SFTP_PROGRESS_INTERVAL
+
+        for worker in workers:
+            worker.join()
+        self._report(on_update, started)
+        return [job for job in self.jobs if not job.is_dir]
+
+    # ------------------------------------------------------------------ #
+    # Scheduling
+    # ------------------------------------------------------------------ #
+
+    def _add(self, job: TransferJob) -> bool:
+        with self._condition:
+            if self._closed or self._cancelled:
+                return False
+            self._enqueue_locked(job)
+            return True
+
+    def _enqueue_locked(self, job: TransferJob):
+        self.jobs.append(job)
+        if job.is_dir:
+            # Expand directories ahead of queued files so deep trees are
+            # discovered early, while the files found so far keep workers busy
+            self._pending.appendleft(job)
+        else:
+            self._pending.append(job)
+        self._outstanding += 1
+        if job.size:
+            self._total_bytes += job.size
+        self._changed[job.job_id] = job
+        self._condition.notify_all()
+
+    def _next_job(self) -> Optional[TransferJob]:
+        """Block until a job is available; None once the queue is done."""
+        with self._condition:
+            while not self._pending:
+                if self._outstanding == 0:
+                    self._closed = True
+                    self._condition.notify_all()
+                    return None
+                # A directory job is still being expanded
+                self._condition.wait()
+            job = self._pending.popleft()
+            job.status = TransferJob.STATUS_RUNNING
+            self._changed[job.job_id] = job
+            return job
+
+    def _finish_locked(self, job: TransferJob):
+        self._outstanding -= 1
+        self._changed[job.job_id] = job
+        if self._outstanding == 0:
+            self._closed = True
+        self._condition.notify_all()
+
+    def _finish(self, job: TransferJob, status: str, error: str = ""):
+        with self._condition:
+            job.status = status
+            job.error = error
+            self._finish_locked(job)
+
+    def _report(self, on_update: Optional[UpdateCallback], started: float):
+        with self._condition:
+            changed = list(self._changed.values())
+            self._changed.clear()
+            bytes_done, total = self._bytes_done, self._total_bytes
+        if on_update is not None:
+            elapsed = time.monotonic() - started
+            on_update(changed, bytes_done, total, bytes_done / elapsed if elapsed > 0 else 0.0)
+
+    # ------------------------------------------------------------------ #
+    # Workers
+    # ------------------------------------------------------------------ #
+
+    def _acquire(self) -> PooledSession:
+        return self.pool.acquire(
+            hostname=self.ssh_config['hostname'],
+            port=self.ssh_config.get('port', 22),
+            username=self.ssh_config['username'],
+            password=self.ssh_config.get('password'),
+            key_filename=self.ssh_config.get('key_filename'),
+            profile=self.ssh_config.get('profile'),
+        )
+
+    def _worker(self, session: Optional[PooledSession]):
+        try:
+            if session is None:
+                session = self._acquire()
+            sftp = session.sftp()
+        except Exception as e:
+            # Fewer channels is fine as long as one worker is running
+            if session is not None:
+                session.release()
+            self._worker_exited(f"Could not open SFTP channel: {e}")
+            return
+
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    break
+                try:
+                    if job.is_dir:
+                        self._expand(sftp, job)
+                    else:
+                        self._transfer(session, sftp, job)
+                    self._finish(job, TransferJob.STATUS_DONE)
+                except TransferCancelled:
+                    self._finish(job, TransferJob.STATUS_CANCELLED)
+                except Exception as e:
+                    self._finish(job, TransferJob.STATUS_FAILED, str(e))
+        finally:
+            session.release()
+        self._worker_exited()
+
+    def _worker_exited(self, error: str = ""):
+        """Fail whatever is left if the last worker could not run."""
+        with self._condition:
+            self._live_workers -= 1
+            if self._live_workers > 0 or self._closed:
+                return
+            while self._pending:
+                job = self._pending.popleft()
+                job.status = TransferJob.STATUS_FAILED
+                job.error = error
+                self._finish_locked(job)
+            self._closed = True
+            self._condition.notify_all()
+
+    def _transfer(self, session: PooledSession, sftp, job: TransferJob):
+        reported = [0]
+
+        def progress(done: int, total: int, rate: float):
+            with self._condition:
+                if job.size is None:
+                    job.size = total
+                    self._total_bytes += total
+                self._bytes_done += done - reported[0]
+                reported[0] = done
+                job.bytes_done = done
+                self._changed[job.job_id] = job
+
+        is_cancelled = lambda: self._cancelled
+        if self.delta is not None and job.operation == 'upload':
+            # Also covers resuming: a partial remote file matches block for block
+            self.delta.upload(sftp, job.local_path, job.remote_path, session.client,
+                              progress, is_cancelled)
+        elif self.resumable is not None and is_resumable(job.size):
+            if job.operation == 'upload':
+                self.resumable.upload(sftp, job.local_path, job.remote_path, session.client,
+                                      progress, is_cancelled)
+            else:
+                self.resumable.download(sftp, job.remote_path, job.local_path, session.client,
+                                        progress, is_cancelled, size=job.size)
+        elif job.operation == 'upload':
+            self.engine.upload(sftp, job.local_path, job.remote_path, progress, is_cancelled)
+        else:
+            self.engine.download(sftp, job.remote_path, job.local_path, progress, is_cancelled,
+                                 size=job.size)
+
+    def _expand(self, sftp, job: TransferJob):
+        """Create the destination directory and queue the directory's entries.
+
+        Symbolic links to files are transferred as the file they point at.
+        Links to directories are not followed, so a link loop cannot recurse
+        forever; they are skipped along with dangling links and special
+        files (sockets, FIFOs, devices).
+        """
+        children = []
+        if job.operation == 'upload':
+            _remote_makedirs(sftp, job.remote_path)
+            with os.scandir(job.local_path) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    # is_file() follows links: regular files and links to them
+                    if not is_dir and not entry.is_file():
+                        continue
+                    children.append(TransferJob(
+                        'upload', entry.path, posixpath.join(job.remote_path, entry.name),
+                        is_dir=is_dir, size=None if is_dir else entry.stat().st_size
+                    ))
+        else:
+            os.makedirs(job.local_path, exist_ok=True)
+            for attr in sftp.listdir_attr(job.remote_path):
+                remote_path = posixpath.join(job.remote_path, attr.filename)
+                if attr.st_mode is not None and stat.S_ISLNK(attr.st_mode):
+                    # Listings are lstat results; resolve the link's target
+                    try:
+                        attr = sftp.stat(remote_path)
+                    except IOError:
+                        continue
+                    if not stat.S_ISREG(attr.st_mode or 0):
+                        continue
+                    is_dir = False
+                else:
+                    # Servers may leave out the mode; treat such entries as files
+                    is_dir = stat.S_ISDIR(attr.st_mode or 0)
+                    if attr.st_mode is not None and not is_dir \
+                            and not stat.S_ISREG(attr.st_mode):
+                        continue
+                children.append(TransferJob(
+                    'download', os.path.join(job.local_path, posixpath.basename(remote_path)),
+                    remote_path, is_dir=is_dir, size=None if is_dir else attr.st_size
+                ))
+
+        with self._condition:
+            if self._cancelled:
+                raise TransferCancelled()
+            for child in children:
+                self._enqueue_locked(child)
+
+
+def _remote_makedirs(sftp, path: str):
+    """mkdir that tolerates existing directories."""
+    try:
+        sftp.mkdir(path)
+    except IOError:
+        if not stat.S_ISDIR(sftp.stat(path).st_mode):
+            raise
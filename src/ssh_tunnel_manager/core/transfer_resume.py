@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Resumable, Checksum-Verified Transfers
+
+Wraps SFTPTransferEngine so an interrupted transfer continues where it
+stopped instead of starting over. Files are compared in fixed-size chunks
+(SHA-256 per SFTP_VERIFY_CHUNK_SIZE bytes): the partial destination is
+checked chunk by chunk against the source, the transfer resumes after the
+last matching chunk, and afterwards every chunk is verified and any that
+differ are copied again.
+
+Remote chunk hashes are computed on the server with sha256sum over an exec
+channel, so verifying costs no transfer bandwidth. Servers without a POSIX
+shell or sha256sum fall back to streaming the remote data and hashing it
+locally; in that case the partial prefix is trusted for resuming and only
+the final verification reads the file back.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shlex
+from typing import Callable, List, Optional, Tuple
+
+import paramiko
+
+from .constants import SFTP_VERIFY_CHUNK_SIZE, SFTP_RESUME_MIN_SIZE, SSH_TIMEOUT
+from .sftp_transfer import ProgressCallback, SFTPTransferEngine, TransferStats
+
+_SHA256_HEX = re.compile(r'^[0-9a-f]{64}$')
+
+# Hash chunks [$2, $2 + $3) of file $1, one hex digest per line
+_REMOTE_HASH_SCRIPT = (
+    'H=sha256sum; command -v sha256sum >/dev/null 2>&1 || H="shasum -a 256"; '
+    'i=$2; end=$(($2 + $3)); '
+    'while [ "$i" -lt "$end" ]; do '
+    'dd if="$1" bs=$4 skip="$i" count=1 2>/dev/null | $H | cut -d" " -f1; '
+    'i=$((i + 1)); '
+    'done'
+)
+
+
+class ChecksumMismatch(IOError):
+    """Raised when a file still differs from its source after repair."""
+
+
+def local_chunk_hashes(path: str, length: int,
+                       chunk_size: int = SFTP_VERIFY_CHUNK_SIZE) -> List[str]:
+    """SHA-256 of each chunk_size chunk of the first length bytes of a local file."""
+    hashes = []
+    with open(path, 'rb') as f:
+        for index in range(-(-length // chunk_size)):
+            digest = hashlib.sha256()
+            remaining = min(chunk_size, length - index * chunk_size)
+            while remaining > 0:
+                data = f.read(min(remaining, 1024 * 1024))
+                if not data:
+                    break
+                digest.update(data)
+                remaining -= len(data)
+            hashes.append(digest.hexdigest())
+    return hashes
+
+
+class ResumableTransfer:
+    """Resume partial transfers and verify the result with chunked hashes.
+
+    client is the SSHClient the SFTP session belongs to; it is used for the
+    sha256sum exec channel. Without it (or when the server can't run the
+    command) chunk hashes are computed by streaming the remote data.
+    """
+
+    METHOD_EXEC = "sha256sum"
+    METHOD_STREAM = "stream"
+
+    def __init__(self, engine: Optional[SFTPTransferEngine] = None,
+                 chunk_size: int = SFTP_VERIFY_CHUNK_SIZE, verify: bool = True):
+        self.engine = engine or SFTPTransferEngine()
+        self.chunk_size = chunk_size
+        self.verify = verify
+        self.logger = logging.getLogger(__name__)
+        # Transports known not to run the hash command, so it is tried once
+        self._no_remote_hash = set()
+
+    def download(self, sftp: paramiko.SFTPClient, remote_path: str, local_path: str,
+                 client: Optional[paramiko.SSHClient] = None,
+                 progress: Optional[ProgressCallback] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 size: Optional[int] = None) -> TransferStats:
+        """Download, continuing from a partial local file if there is one."""
+        total = size if size is not None else sftp.stat(remote_path).st_size
+        partial = os.path.getsize(local_path) if os.path.isfile(local_path) else 0
+
+        offset, remote_hashes, method = self._resume_point(
+            sftp, client, remote_path, local_path, min(partial, total)
+        )
+        if offset:
+            self.logger.info(f"Resuming download of {remote_path} at byte {offset}")
+        stats = self.engine.download(sftp, remote_path, local_path, progress, is_cancelled,
+                                     size=total, offset=offset)
+        if self.verify:
+            self._verify(sftp, client, 'download', local_path, remote_path, total,
+                         remote_hashes, method, stats)
+        return stats
+
+    def upload(self, sftp: paramiko.SFTPClient, local_path: str, remote_path: str,
+               client: Optional[paramiko.SSHClient] = None,
+               progress: Optional[ProgressCallback] = None,
+               is_cancelled: Optional[Callable[[], bool]] = None) -> TransferStats:
+        """Upload, continuing from a partial remote file if there is one."""
+        total = os.path.getsize(local_path)
+        try:
+            partial = sftp.stat(remote_path).st_size or 0
+        except IOError:
+            partial = 0
+
+        offset, remote_hashes, method = self._resume_point(
+            sftp, client, remote_path, local_path, min(partial, total)
+        )
+        if offset:
+            self.logger.info(f"Resuming upload of {local_path} at byte {offset}")
+        stats = self.engine.upload(sftp, local_path, remote_path, progress, is_cancelled,
+                                   offset=offset)
+        if self.verify:
+            self._verify(sftp, client, 'upload', local_path, remote_path, total,
+                         remote_hashes, method, stats)
+        return stats
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _resume_point(self, sftp, client, remote_path: str, local_path: str, partial: int):
+        """Offset to resume from, plus the remote hashes already known.
+
+        Only whole chunks are kept; the last partial chunk is always resent.
+        """
+        chunks = partial // self.chunk_size
+        if chunks == 0:
+            return 0, [], ""
+
+        remote = self._remote_hashes_exec(client, remote_path, 0, chunks)
+        if remote is None:
+            # No cheap way to check the prefix: trust it, verify at the end
+            return chunks * self.chunk_size, [], ""
+
+        local = local_chunk_hashes(local_path, chunks * self.chunk_size, self.chunk_size)
+        matching = 0
+        while matching < chunks and local[matching] == remote[matching]:
+            matching += 1
+        return matching * self.chunk_size, remote[:matching], self.METHOD_EXEC
+
+    def _verify(self, sftp, client, operation: str, local_path: str, remote_path: str,
+                total: int, known: List[str], method: str, stats: TransferStats):
+        """Compare every chunk and copy mismatching ones again (once)."""
+        chunk_count = -(-total // self.chunk_size)
+        remote, stats.verify_method = self._remote_hashes(
+            sftp, client, remote_path, total, known, method
+        )
+        local = local_chunk_hashes(local_path, total, self.chunk_size)
+        bad = self._mismatches(local, remote, chunk_count)
+
+        if bad:
+            self.logger.warning(
+                f"{len(bad)} chunk(s) of {remote_path} failed verification, copying them again"
+            )
+            for index in bad:
+                start = index * self.chunk_size
+                end = min(start + self.chunk_size, total)
+                self.engine.rewrite_range(sftp, operation, local_path, remote_path, start, end)
+            remote, _ = self._remote_hashes(sftp, client, remote_path, total, [],
+                                            stats.verify_method)
+            local = local_chunk_hashes(local_path, total, self.chunk_size)
+            still_bad = self._mismatches(local, remote, chunk_count)
+            if still_bad:
+                stats.verified = False
+                raise ChecksumMismatch(
+                    f"{remote_path}: {len(still_bad)} chunk(s) differ from the source after retry"
+                )
+        stats.verified = True
+
+    @staticmethod
+    def _mismatches(local: List[str], remote: List[str], chunk_count: int) -> List[int]:
+        # A short remote list means the remote file is shorter than expected
+        return [
+            index for index in range(chunk_count)
+            if index >= len(remote) or local[index] != remote[index]
+        ]
+
+    def _remote_hashes(self, sftp, client, remote_path: str, total: int,
+                       known: List[str], method: str) -> Tuple[List[str], str]:
+        """Hashes of every chunk of the remote file and how they were computed.
+
+        known holds hashes of the leading chunks already obtained from the
+        server while finding the resume point.
+        """
+        chunk_count = -(-total // self.chunk_size)
+        if method != self.METHOD_STREAM:
+            rest = self._remote_hashes_exec(client, remote_path, len(known),
+                                            chunk_count - len(known))
+            if rest is not None:
+                return known + rest, self.METHOD_EXEC
+        return self._remote_hashes_stream(sftp, remote_path, total), self.METHOD_STREAM
+
+    def _remote_hashes_exec(self, client, remote_path: str, first: int,
+                            count: int) -> Optional[List[str]]:
+        """Chunk hashes computed by the server, or None if it can't."""
+        if count == 0:
+            return []
+        transport = client.get_transport() if client is not None else None
+        if transport is None or id(transport) in self._no_remote_hash:
+            return None
+
+        command = 'sh -c {} sh {} {} {} {}'.format(
+            shlex.quote(_REMOTE_HASH_SCRIPT), shlex.quote(remote_path),
+            first, count, self.chunk_size
+        )
+        try:
+            _, stdout, _ = client.exec_command(command, timeout=SSH_TIMEOUT)
+            hashes = [line.strip() for line in stdout.read().decode('ascii', 'replace').splitlines()]
+            exit_status = stdout.channel.recv_exit_status()
+        except Exception as e:
+            # Channel refused (e.g. MaxSessions reached) or timed out; may work next time
+            self.logger.debug(f"Remote hashing of {remote_path} failed: {e}")
+            return None
+
+        if exit_status != 0 or len(hashes) != count or not all(
+                _SHA256_HEX.match(digest) for digest in hashes):
+            self.logger.info("Server cannot hash files; falling back to streamed comparison")
+            self._no_remote_hash.add(id(transport))
+            return None
+        return hashes
+
+    def _remote_hashes_stream(self, sftp, remote_path: str, total: int) -> List[str]:
+        """Chunk hashes computed locally from the remote file's data."""
+        hashes = []
+        digest = hashlib.sha256()
+        filled = 0
+        for data in self.engine.read_range(sftp, remote_path, 0, total):
+            view = memoryview(data)
+            while view:
+                take = min(len(view), self.chunk_size - filled)
+                digest.update(view[:take])
+                view = view[take:]
+                filled += take
+                if filled == self.chunk_size:
+                    hashes.append(digest.hexdigest())
+                    digest = hashlib.sha256()
+                    filled = 0
+        if filled:
+            hashes.append(digest.hexdigest())
+        return hashes
+
+
+def is_resumable(size: Optional[int]) -> bool:
+    """Whether a file is large enough to be worth resuming and verifying."""
+    return size is not None and size >= SFTP_RESUME_MIN_SIZE
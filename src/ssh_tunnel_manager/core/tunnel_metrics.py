@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Tunnel Metrics
+
+Round-trip latency and liveness history for a tunnel, kept at three
+resolutions (1 second, 1 minute, 1 hour). Each resolution is a ring of
+fixed-size array.array buckets holding a sample count, latency sum, min
+and max and an up count, so a sample is a few array stores and the memory
+per tunnel is the same after a minute of uptime or a month. A bucket is
+reused once its time slot has come round again, which is also how old
+data ages out. Samples come from the monitor's probes, seconds apart, so
+the 1 second series has gaps between them.
+"""
+
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional
+
+from .constants import METRICS_ROLLUPS
+
+ROLLUP_SECOND = "1s"
+ROLLUP_MINUTE = "1m"
+ROLLUP_HOUR = "1h"
+
+
+class MetricRollup:
+    """Samples aggregated into slots buckets of resolution seconds each."""
+
+    def __init__(self, resolution: float, slots: int):
+        self.resolution = resolution
+        self.slots = slots
+        self._period = array('q', [-1] * slots)  # time slot held by each bucket
+        self._samples = array('L', [0] * slots)
+        self._up = array('L', [0] * slots)
+        self._latencies = array('L', [0] * slots)  # samples that have a latency
+        self._sum = array('d', [0.0] * slots)
+        self._min = array('d', [0.0] * slots)
+        self._max = array('d', [0.0] * slots)
+
+    def add(self, timestamp: float, alive: bool, latency: Optional[float] = None):
+        period = int(timestamp // self.resolution)
+        slot = period % self.slots
+        if self._period[slot] != period:
+            # The slot last held data from slots * resolution seconds ago (or never)
+            self._period[slot] = period
+            self._samples[slot] = self._up[slot] = self._latencies[slot] = 0
+            self._sum[slot] = self._min[slot] = self._max[slot] = 0.0
+        self._samples[slot] += 1
+        self._up[slot] += alive
+        if latency is not None:
+            count = self._latencies[slot]
+            self._min[slot] = latency if not count else min(self._min[slot], latency)
+            self._max[slot] = max(self._max[slot], latency)
+            self._sum[slot] += latency
+            self._latencies[slot] = count + 1
+
+    def series(self, kind: str = 'avg', now: Optional[float] = None) -> List[Optional[float]]:
+        """One value per bucket, oldest first, ending with the current one.
+
+        kind is 'avg', 'min' or 'max' latency, or 'uptime' (fraction of
+        samples that found the tunnel up). Buckets without data are None.
+        """
+        current = int((time.time() if now is None else now) // self.resolution)
+        values: List[Optional[float]] = []
+        for period in range(current - self.slots + 1, current + 1):
+            slot = period % self.slots
+            if self._period[slot] != period or not self._samples[slot]:
+                values.append(None)
+            elif kind == 'uptime':
+                values.append(self._up[slot] / self._samples[slot])
+            elif not self._latencies[slot]:
+                values.append(None)
+            elif kind == 'min':
+                values.append(self._min[slot])
+            elif kind == 'max':
+                values.append(self._max[slot])
+            else:
+                values.append(self._sum[slot] / self._latencies[slot])
+        return values
+
+
+class TunnelMetrics:
+    """Latency and liveness series of one tunnel at every rollup.
+
+    Written by the monitor thread, read by the GUI; a lock keeps a reader
+    from seeing a bucket half reset.
+    """
+
+    def __init__(self):
+        self.rollups: Dict[str, MetricRollup] = {
+            name: MetricRollup(resolution, slots) for name, resolution, slots in METRICS_ROLLUPS
+        }
+        self.last_latency: Optional[float] = None  # ms
+        self.last_alive: Optional[bool] = None
+        self._lock = threading.Lock()
+
+    def record(self, alive: bool, latency: Optional[float] = None, timestamp: Optional[float] = None):
+        """Add a sample: whether the tunnel was up and its SSH round trip in ms, if measured."""
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            for rollup in self.rollups.values():
+                rollup.add(timestamp, alive, latency)
+            self.last_alive = alive
+            if latency is not None:
+                self.last_latency = latency
+
+    def latency_series(self, rollup: str = ROLLUP_MINUTE, kind: str = 'avg',
+                       now: Optional[float] = None) -> List[Optional[float]]:
+        with self._lock:
+            return self.rollups[rollup].series(kind, now)
+
+    def uptime_series(self, rollup: str = ROLLUP_MINUTE, now: Optional[float] = None) -> List[Optional[float]]:
+        with self._lock:
+            return self.rollups[rollup].series('uptime', now)
@@ -6,11 +6,18 @@ SSH Tunnel Manager - SSH Process Management
 import os
 import sys
 import time
+import socket
+import threading
 import subprocess
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from .models import TunnelConfig
-from .constants import PROCESS_START_DELAY, PROCESS_ESTABLISH_DELAY
+from .tunnel_metrics import TunnelMetrics
+from .constants import (
+    PROCESS_START_DELAY, PROCESS_ESTABLISH_DELAY,
+    PROCESS_READY_TIMEOUT, PROCESS_READY_POLL_INTERVAL,
+    METRICS_CONNECT_TIMEOUT, METRICS_CHECK_REUSE
+)
 
 
 class TunnelProcess:
@@ -22,6 +29,13 @@ class TunnelProcess:
     STATUS_RUNNING = "running"
     STATUS_ERROR = "error"
     
+    # Start progress events (see start_async)
+    EVENT_SPAWNED = "spawned"
+    EVENT_FORWARD_BOUND = "forward_bound"
+    EVENT_HEALTHY = "healthy"
+    EVENT_FAILED = "failed"
+    EVENT_TIMEOUT = "timeout"
+    
     def __init__(self, config: TunnelConfig, terminal_widget=None):
         self.config = config
         self.process: Optional[subprocess.Popen] = None
@@ -29,6 +43,8 @@ class TunnelProcess:
         self.status = self.STATUS_STOPPED
         self.terminal_widget = terminal_widget
         self.connection_lost_count = 0  # Track connection lost messages
+        self.metrics = TunnelMetrics()  # latency/liveness history, kept across restarts
+        self._last_check: Optional[Tuple[float, bool]] = None  # (monotonic time, healthy)
         
     def start(self) -> bool:
         """Start the SSH tunnel in a native terminal window."""
@@ -40,10 +56,7 @@ class TunnelProcess:
             self.status = self.STATUS_STARTING
             self.connection_lost_count = 0
             
-            cmd = self.config.get_ssh_command_args()
-            
-            # Always start in native terminal window for password entry
-            self.process = self._start_native_terminal_process(cmd)
+            self.process = self._launch()
                 
             # Give SSH time to establish the tunnel
             time.sleep(PROCESS_ESTABLISH_DELAY)
@@ -55,8 +68,7 @@ class TunnelProcess:
                     # The monitor thread will transition it to RUNNING when it's actually connected
                     return True
                 else:
-                    return_code = self.process.returncode
-                    error_message = self._get_error_message(return_code)
+                    error_message = self._get_process_error(self.process)
                     self.status = self.STATUS_ERROR
                     raise Exception(error_message)
             else:
@@ -67,6 +79,108 @@ class TunnelProcess:
             self.is_running = False
             self.status = self.STATUS_ERROR
             raise e
+    
+    def start_async(self, on_event: Optional[Callable[[str, str], None]] = None) -> bool:
+        """Start the SSH tunnel without blocking the calling thread.
+        
+        The process is spawned immediately and readiness is tracked on a
+        background thread. ``on_event(event, detail)`` is called from that
+        thread with one of the EVENT_* constants as the tunnel progresses:
+        spawned -> forward_bound -> healthy, or failed/timeout.
+        
+        Returns False if the process could not be spawned.
+        """
+        def emit(event: str, detail: str = ""):
+            if on_event:
+                try:
+                    on_event(event, detail)
+                except Exception:
+                    pass
+        
+        if self.is_running:
+            emit(self.EVENT_HEALTHY, "Tunnel already running")
+            return True
+        
+        self.status = self.STATUS_STARTING
+        self.connection_lost_count = 0
+        
+        try:
+            process = self._launch()
+        except Exception as e:
+            self.is_running = False
+            self.status = self.STATUS_ERROR
+            emit(self.EVENT_FAILED, f"Failed to launch SSH process: {e}")
+            return False
+        
+        self.process = process
+        if self.config.backend == 'embedded':
+            emit(self.EVENT_SPAWNED, "Embedded SSH connection started")
+        else:
+            emit(self.EVENT_SPAWNED, f"SSH process started (pid {process.pid})")
+        
+        waiter = threading.Thread(
+            target=self._wait_until_ready, args=(process, emit),
+            name=f"tunnel-start-{self.config.name}", daemon=True
+        )
+        waiter.start()
+        return True
+    
+    def _wait_until_ready(self, process: subprocess.Popen, emit: Callable[[str, str], None]):
+        """Poll a freshly spawned process until its forward is usable."""
+        started = time.monotonic()
+        deadline = started + PROCESS_READY_TIMEOUT
+        forward_bound = False
+        
+        while time.monotonic() < deadline:
+            # Tunnel was stopped or restarted while we were waiting
+            if self.process is not process:
+                return
+            
+            return_code = process.poll()
+            if return_code is not None:
+                self.is_running = False
+                self.status = self.STATUS_ERROR
+                emit(self.EVENT_FAILED, self._get_process_error(process))
+                return
+            
+            if not forward_bound:
+                if self.config.tunnel_type in ('local', 'dynamic'):
+                    forward_bound = self._local_port_open(timeout=PROCESS_READY_POLL_INTERVAL)
+                else:
+                    # Remote forwards can't be probed locally; ExitOnForwardFailure
+                    # makes ssh exit if the bind fails, so surviving the
+                    # establish delay is our best signal.
+                    forward_bound = time.monotonic() - started >= PROCESS_ESTABLISH_DELAY
+                if forward_bound:
+                    emit(self.EVENT_FORWARD_BOUND, self.config.get_connection_string())
+            
+            if forward_bound and self.transition_to_running_if_healthy():
+                emit(self.EVENT_HEALTHY, "Tunnel is up")
+                return
+            
+            time.sleep(PROCESS_READY_POLL_INTERVAL)
+        
+        if self.process is process and self.status == self.STATUS_STARTING:
+            # Still alive (e.g. waiting for a password); the monitor thread
+            # will finish the STARTING -> RUNNING transition later.
+            emit(self.EVENT_TIMEOUT,
+                 f"Tunnel not ready after {PROCESS_READY_TIMEOUT}s, still waiting")
+
+    def _launch(self):
+        """Launch the tunnel with the backend selected in its configuration."""
+        if self.config.backend == 'embedded':
+            # In-process paramiko transport; returns a Popen-like handle
+            from .ssh_engine import get_engine
+            return get_engine().open_tunnel(self.config)
+        
+        # Always start in native terminal window for password entry
+        cmd = self.config.get_ssh_command_args()
+        return self._start_native_terminal_process(cmd)
+    
+    def _get_process_error(self, process) -> str:
+        """Get the error message for a tunnel process that exited."""
+        error = getattr(process, 'error', '')
+        return error or self._get_error_message(process.returncode)
 
     def _start_native_terminal_process(self, cmd: list[str]) -> subprocess.Popen:
         """Start SSH process in a native terminal window for user password entry."""
@@ -76,6 +190,10 @@ class TunnelProcess:
             startup_info = subprocess.STARTUPINFO()
             startup_info.lpTitle = console_title
             
+            # cmd treats '^' as an escape character; profile options use it
+            # literally (Ciphers=^... prepends to ssh's defaults)
+            command_line = " ".join(arg.replace('^', '^^') for arg in cmd)
+            
             # Add a warning message to the command
             warning_cmd = [
                 'cmd', '/c', 
@@ -92,7 +210,7 @@ class TunnelProcess:
                 f'echo Local port: {self.config.local_port} && '
                 f'echo Remote: {self.config.remote_host}:{self.config.remote_port} && '
                 f'echo. && '
-                f'{" ".join(cmd)}'
+                f'{command_line}'
             ]
             
             return subprocess.Popen(
@@ -213,34 +331,70 @@ read -p "Press Enter to close..."
         if not self.process or self.process.poll() is not None:
             return False
         
-        # For local tunnels, try to connect to the local port
-        if self.config.tunnel_type == 'local':
-            import socket
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)  # 2 second timeout
-                result = sock.connect_ex(('localhost', self.config.local_port))
-                sock.close()
-                return result == 0
-            except Exception:
-                return False
-        
-        # For dynamic tunnels (SOCKS), try to bind to the port
-        elif self.config.tunnel_type == 'dynamic':
-            import socket
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result = sock.connect_ex(('localhost', self.config.local_port))
-                sock.close()
-                return result == 0
-            except Exception:
-                return False
+        # For local and dynamic (SOCKS) tunnels, try to connect to the local port
+        if self.config.tunnel_type in ('local', 'dynamic'):
+            healthy = self._local_port_open(timeout=2)
         
         # For remote tunnels, we can only check if the process is running
         else:
-            return True
+            healthy = True
+        
+        # The metrics sample taken in the same probe counts this check
+        self._last_check = (time.monotonic(), healthy)
+        return healthy
+    
+    def _local_port_open(self, timeout: float) -> bool:
+        """Check whether the tunnel's local port accepts connections."""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            result = sock.connect_ex(('localhost', self.config.local_port))
+            sock.close()
+            return result == 0
+        except Exception:
+            return False
     
+    def _server_connect_time(self, timeout: float) -> Optional[float]:
+        """Seconds taken to connect to the SSH server's port, or None if it fails."""
+        try:
+            started = time.perf_counter()
+            with socket.create_connection((self.config.ssh_host, self.config.ssh_port),
+                                          timeout=timeout):
+                return time.perf_counter() - started
+        except OSError:
+            return None
+
+    def record_sample(self, alive: bool):
+        """Add a liveness sample to metrics, with the latency to the SSH server.
+
+        Embedded tunnels time a keepalive request on their transport, which
+        crosses the SSH connection without reaching the forward's target.
+        The ssh client of terminal tunnels offers nothing comparable (a
+        connect to the local port is answered locally), so they record the
+        TCP connect time to the SSH server's port instead, and take liveness
+        from a health check run just before rather than connecting again.
+        """
+        latency = None
+        checked, self._last_check = self._last_check, None
+        round_trip = getattr(self.process, 'round_trip', None)
+        if alive and round_trip is not None:
+            seconds = round_trip(METRICS_CONNECT_TIMEOUT)
+            if seconds is None:
+                alive = False
+            else:
+                latency = seconds * 1000
+        elif alive:
+            if self.config.tunnel_type in ('local', 'dynamic'):
+                if checked is not None and time.monotonic() - checked[0] < METRICS_CHECK_REUSE:
+                    alive = checked[1]
+                else:
+                    alive = self._local_port_open(timeout=METRICS_CONNECT_TIMEOUT)
+            if alive:
+                # A failed connect leaves a gap; the tunnel itself is still up
+                seconds = self._server_connect_time(METRICS_CONNECT_TIMEOUT)
+                latency = seconds * 1000 if seconds is not None else None
+        self.metrics.record(alive, latency)
+
     def transition_to_running_if_healthy(self):
         """Transition from STARTING to RUNNING if health check passes."""
         if self.status == self.STATUS_STARTING and self.health_check():
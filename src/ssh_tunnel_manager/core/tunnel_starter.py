@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Asynchronous Tunnel Starter
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from .tunnel_process import TunnelProcess
+
+
+class TunnelStarter(QObject):
+    """Starts tunnels without blocking the GUI thread.
+
+    Wraps TunnelProcess.start_async and re-emits its progress callbacks as
+    Qt signals, which are delivered on the thread that owns this object.
+    Any number of tunnels can be starting at the same time.
+    """
+
+    start_event = Signal(str, str, str)  # tunnel_name, event, detail
+    tunnel_ready = Signal(str)  # tunnel_name once the health check passed
+    start_failed = Signal(str, str)  # tunnel_name, reason
+
+    def start(self, name: str, tunnel: TunnelProcess) -> bool:
+        """Begin starting a tunnel; returns False if it could not be spawned."""
+        def on_event(event: str, detail: str):
+            self.start_event.emit(name, event, detail)
+            if event == TunnelProcess.EVENT_HEALTHY:
+                self.tunnel_ready.emit(name)
+            elif event == TunnelProcess.EVENT_FAILED:
+                self.start_failed.emit(name, detail)
+
+        return tunnel.start_async(on_event)
+
+    def start_many(self, tunnels: dict[str, TunnelProcess]) -> int:
+        """Start several tunnels concurrently; returns how many were spawned."""
+        return sum(1 for name, tunnel in tunnels.items() if self.start(name, tunnel))
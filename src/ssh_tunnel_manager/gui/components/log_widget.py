@@ -3,12 +3,27 @@
 SSH Tunnel Manager - Log Widget Component
 """
 
-import time
-from PySide6.QtWidgets import QTextEdit, QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton
+import re
+from PySide6.QtWidgets import (
+    QListView, QAbstractItemView, QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit
+)
 from PySide6.QtGui import QFont
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer
 
-from ...core.constants import LOG_FONT_SIZE
+from ...core.constants import LOG_FONT_SIZE, LOG_SEARCH_DELAY
+from ...core.log_store import LogRecord, LogStore, default_log_file
+from ..widgets.log_view_model import LogListModel
+
+# (level, pattern, color, prefix), checked in order
+_MESSAGE_STYLES = (
+    ('error', re.compile(r'error|fail', re.IGNORECASE), '#F44336', '❌'),  # Red
+    ('warning', re.compile(r'warn', re.IGNORECASE), '#FF9800', '⚠️'),  # Orange
+    ('success', re.compile(r'success|started|connected|running', re.IGNORECASE), '#4CAF50', '✅'),  # Green
+    ('stopped', re.compile(r'stopped|disconnected', re.IGNORECASE), '#9E9E9E', '⏹️'),  # Gray
+)
+_PREFIXES = {level: prefix for level, _, _, prefix in _MESSAGE_STYLES}
+_COLORS = {level: color for level, _, color, _ in _MESSAGE_STYLES}
+_COLORS['info'] = '#E0E0E0'  # Light gray for normal messages
 
 
 class LogWidget(QObject):
@@ -16,7 +31,18 @@ class LogWidget(QObject):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.log_text = None
+        self.log_view = None
+        self.store = LogStore(log_file=default_log_file())
+        self.model = LogListModel(self.store, self._format_record, _COLORS, self)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(LOG_SEARCH_DELAY)
+        self.search_timer.timeout.connect(self._apply_search)
+        self.search_box = None
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(0)
+        self.scroll_timer.timeout.connect(self._scroll_to_bottom)
         
     def create_log_widget(self) -> QGroupBox:
         """Create the log widget group."""
@@ -25,13 +51,15 @@ class LogWidget(QObject):
         log_layout.setContentsMargins(12, 20, 12, 12)
         log_layout.setSpacing(8)
         
-        # Log text area
-        self.log_text = QTextEdit()
-        self.log_text.setMaximumHeight(200)
-        self.log_text.setMinimumHeight(150)
-        self.log_text.setFont(QFont("Consolas", LOG_FONT_SIZE))
-        self.log_text.setReadOnly(True)
-        log_layout.addWidget(self.log_text)
+        # Log view
+        self.log_view = QListView()
+        self.log_view.setModel(self.model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.log_view.setMaximumHeight(200)
+        self.log_view.setMinimumHeight(150)
+        self.log_view.setFont(QFont("Consolas", LOG_FONT_SIZE))
+        log_layout.addWidget(self.log_view)
         
         # Log controls
         log_controls = QHBoxLayout()
@@ -43,38 +71,43 @@ class LogWidget(QObject):
         clear_log_btn.clicked.connect(self.clear_log)
         clear_log_btn.setToolTip("Clear all log messages")
         
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("🔍 Search log...")
+        self.search_box.setMaximumWidth(220)
+        self.search_box.textChanged.connect(self.search_timer.start)
+        
         log_controls.addWidget(clear_log_btn)
         log_controls.addStretch()
+        log_controls.addWidget(self.search_box)
         log_layout.addLayout(log_controls)
         
         return log_group
     
-    def log(self, message: str):
+    @staticmethod
+    def _format_record(record: LogRecord) -> str:
+        return f"[{record.time_text}] {_PREFIXES.get(record.level, 'ℹ️')} {record.message}"
+    
+    def log(self, message: str, tunnel: str = "", event: str = ""):
         """Add a timestamped message to the log with color coding."""
-        if self.log_text:
-            timestamp = time.strftime("%H:%M:%S")
-            
-            # Determine message color based on content
-            if any(word in message.lower() for word in ['error', 'failed', 'fail']):
-                color = '#F44336'  # Red
-                prefix = '❌'
-            elif any(word in message.lower() for word in ['warning', 'warn']):
-                color = '#FF9800'  # Orange
-                prefix = '⚠️'
-            elif any(word in message.lower() for word in ['success', 'started', 'connected', 'running']):
-                color = '#4CAF50'  # Green
-                prefix = '✅'
-            elif any(word in message.lower() for word in ['stopped', 'disconnected']):
-                color = '#9E9E9E'  # Gray
-                prefix = '⏹️'
-            else:
-                color = '#E0E0E0'  # Light gray for normal messages
-                prefix = 'ℹ️'
-            
-            formatted_message = f'<span style="color: #90CAF9;">[{timestamp}]</span> <span style="color: {color};">{prefix} {message}</span>'
-            self.log_text.append(formatted_message)
+        # Determine message level based on content
+        level = next((level for level, pattern, _, _ in _MESSAGE_STYLES if pattern.search(message)), 'info')
+        if self.log_view is not None and not self.scroll_timer.isActive():
+            scrollbar = self.log_view.verticalScrollBar()
+            if scrollbar.value() >= scrollbar.maximum():
+                # One scroll per burst of messages rather than per message
+                self.scroll_timer.start()
+        self.model.add(message, level, tunnel, event)
+    
+    def _scroll_to_bottom(self):
+        if self.log_view:
+            self.log_view.scrollToBottom()
+    
+    def _apply_search(self):
+        """Show only messages matching the search words."""
+        if self.search_box:
+            self.model.set_filter(self.search_box.text())
+            self.log_view.scrollToBottom()
     
     def clear_log(self):
         """Clear the log."""
-        if self.log_text:
-            self.log_text.clear()
+        self.model.clear()
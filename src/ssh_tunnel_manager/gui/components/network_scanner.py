@@ -5,89 +5,86 @@ Provides ping and port scanning capabilities for network diagnostics
 """
 
 import socket
-import subprocess
 import threading
-import platform
 import time
 from typing import List, Tuple, Optional, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QSpinBox, QCheckBox, QProgressBar, QTabWidget, QWidget,
-    QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox, QComboBox,
+    QTableView, QAbstractItemView, QHeaderView, QGroupBox, QComboBox,
     QSplitter, QMessageBox, QApplication
 )
 from PySide6.QtCore import QThread, Signal, Qt, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont
+
+from ...core.port_probe import PortProber, PortResult
+from ...core.latency_probe import (
+    LatencyProber, parse_target, bucket_labels, METHOD_AUTO, METHOD_ICMP, METHOD_TCP
+)
+from ...core.constants import DEFAULT_SSH_PORT
+from ..widgets.port_results_model import PortResultsModel
 
 
 class PingWorker(QThread):
-    """Worker thread for ping operations."""
+    """Worker thread measuring latency to one or more hosts.
+    
+    Every round probes all hosts at once from this process (ICMP echo where
+    the system allows it, TCP connect to the SSH port otherwise), so the
+    times don't include starting a ping process.
+    """
     
-    ping_result = Signal(str, bool, float)  # host, success, response_time
+    ping_results = Signal(list)  # [(host, success, response_time)] for one round of echoes
+    ping_info = Signal(str)  # how each host is probed, or why it can't be
+    ping_stats = Signal(list)  # LatencyStats per host once finished
     ping_finished = Signal()
     
-    def __init__(self, host: str, count: int = 4):
+    def __init__(self, hosts, count: Optional[int] = 4, method: str = METHOD_AUTO):
         super().__init__()
-        self.host = host
-        self.count = count
+        if isinstance(hosts, str):
+            hosts = [hosts]
+        self.targets = [parse_target(host) for host in hosts]
+        self.count = count  # None: until stopped
+        self.method = method
         self.running = True
     
     def run(self):
         """Run ping operation."""
+        prober = LatencyProber(self.targets, method=self.method)
         try:
-            system = platform.system().lower()
-            
-            if system == "windows":
-                cmd = ["ping", "-n", str(self.count), self.host]
-            else:
-                cmd = ["ping", "-c", str(self.count), self.host]
-            
-            for i in range(self.count):
-                if not self.running:
-                    break
-                
-                start_time = time.time()
-                try:
-                    if system == "windows":
-                        result = subprocess.run(
-                            ["ping", "-n", "1", self.host],
-                            capture_output=True, text=True, timeout=5
-                        )
-                        success = result.returncode == 0
-                    else:
-                        result = subprocess.run(
-                            ["ping", "-c", "1", "-W", "5", self.host],
-                            capture_output=True, text=True, timeout=5
-                        )
-                        success = result.returncode == 0
-                    
-                    response_time = (time.time() - start_time) * 1000  # Convert to ms
-                    self.ping_result.emit(self.host, success, response_time)
-                    
-                except (subprocess.TimeoutExpired, Exception):
-                    self.ping_result.emit(self.host, False, 0.0)
-                
-                if i < self.count - 1:  # Don't sleep after last ping
-                    time.sleep(1)
-        
+            prober.resolve()
+            for stats in prober.stats.values():
+                if stats.error:
+                    self.ping_info.emit(f"{stats.host}: {stats.error}")
+                else:
+                    self.ping_info.emit(f"{stats.host} ({stats.address}) via {stats.method_text}")
+            if any(not stats.error for stats in prober.stats.values()):
+                stats = prober.run(self.count, on_round=self._emit_round,
+                                   is_cancelled=lambda: not self.running)
+                self.ping_stats.emit(stats)
         except Exception as e:
-            self.ping_result.emit(self.host, False, 0.0)
-        
+            self.ping_info.emit(f"Ping failed: {e}")
         finally:
+            prober.close()
             self.ping_finished.emit()
     
+    def _emit_round(self, results: list):
+        self.ping_results.emit([(host, rtt is not None, rtt or 0.0) for host, rtt in results])
+    
     def stop(self):
         """Stop the ping operation."""
         self.running = False
 
 
 class PortScanWorker(QThread):
-    """Worker thread for port scanning operations."""
+    """Worker thread for port scanning operations.
+    
+    Results are delivered in batches every SCAN_BATCH_INTERVAL rather than
+    one signal per port, so large scans don't flood the GUI event queue.
+    """
     
-    port_result = Signal(str, int, bool, str)  # host, port, open, service
-    scan_progress = Signal(int)  # current port number
+    results_ready = Signal(list)  # PortResults finished since the last batch
+    scan_error = Signal(str)
     scan_finished = Signal()
     
     def __init__(self, host: str, start_port: int, end_port: int, timeout: float = 1.0):
@@ -97,69 +94,19 @@ class PortScanWorker(QThread):
         self.end_port = end_port
         self.timeout = timeout
         self.running = True
-        
-        # Common service mappings
-        self.services = {
-            21: "FTP", 22: "SSH", 23: "Telnet", 25: "SMTP", 53: "DNS",
-            80: "HTTP", 110: "POP3", 143: "IMAP", 443: "HTTPS", 993: "IMAPS",
-            995: "POP3S", 3389: "RDP", 5432: "PostgreSQL", 3306: "MySQL",
-            1433: "MSSQL", 5900: "VNC", 8080: "HTTP-Alt", 8443: "HTTPS-Alt",
-            554: "RTSP", 1723: "PPTP", 1194: "OpenVPN", 500: "IPSec",
-            4500: "IPSec-NAT", 135: "RPC", 139: "NetBIOS", 445: "SMB",
-            389: "LDAP", 636: "LDAPS", 161: "SNMP", 162: "SNMP-Trap",
-            69: "TFTP", 123: "NTP", 179: "BGP", 515: "LPD", 631: "IPP",
-            993: "IMAPS", 995: "POP3S", 587: "SMTP-Sub", 465: "SMTPS"
-        }
     
     def run(self):
         """Run port scan operation."""
         try:
-            total_ports = self.end_port - self.start_port + 1
-            
-            # Use ThreadPoolExecutor for concurrent scanning
-            with ThreadPoolExecutor(max_workers=50) as executor:
-                # Submit all port scan tasks
-                future_to_port = {
-                    executor.submit(self._scan_port, port): port
-                    for port in range(self.start_port, self.end_port + 1)
-                }
-                
-                completed = 0
-                for future in as_completed(future_to_port):
-                    if not self.running:
-                        break
-                    
-                    port = future_to_port[future]
-                    try:
-                        is_open = future.result()
-                        service = self.services.get(port, "Unknown")
-                        self.port_result.emit(self.host, port, is_open, service)
-                    except Exception as e:
-                        self.port_result.emit(self.host, port, False, "Error")
-                    
-                    completed += 1
-                    self.scan_progress.emit(port)
-        
-        except Exception as e:
-            pass
-        
+            # One thread drives every probe; results arrive as they complete
+            prober = PortProber(self.host, self.timeout)
+            prober.run(range(self.start_port, self.end_port + 1),
+                       on_batch=self.results_ready.emit, is_cancelled=lambda: not self.running)
+        except OSError as e:
+            self.scan_error.emit(f"Cannot scan {self.host}: {e}")
         finally:
             self.scan_finished.emit()
     
-    def _scan_port(self, port: int) -> bool:
-        """Scan a single port."""
-        if not self.running:
-            return False
-        
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((self.host, port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
-    
     def stop(self):
         """Stop the port scan operation."""
         self.running = False
@@ -217,8 +164,11 @@ class NetworkScannerDialog(QDialog):
         host_layout = QHBoxLayout()
         host_layout.addWidget(QLabel("Host/IP:"))
         self.ping_host_edit = QLineEdit()
-        self.ping_host_edit.setPlaceholderText("Enter hostname or IP address (e.g., google.com, 8.8.8.8)")
+        self.ping_host_edit.setPlaceholderText("One or more hosts, space or comma separated (e.g., bastion1 10.0.0.5:2222)")
         host_layout.addWidget(self.ping_host_edit)
+        self.ping_tunnel_hosts_button = QPushButton("Tunnel Hosts")
+        self.ping_tunnel_hosts_button.setToolTip("Probe the SSH host of every configured tunnel")
+        host_layout.addWidget(self.ping_tunnel_hosts_button)
         input_layout.addLayout(host_layout)
         
         # Count input
@@ -228,6 +178,12 @@ class NetworkScannerDialog(QDialog):
         self.ping_count_spin.setRange(1, 100)
         self.ping_count_spin.setValue(4)
         count_layout.addWidget(self.ping_count_spin)
+        count_layout.addWidget(QLabel("Method:"))
+        self.ping_method_combo = QComboBox()
+        self.ping_method_combo.addItem("Auto (ICMP, else TCP)", METHOD_AUTO)
+        self.ping_method_combo.addItem("ICMP echo", METHOD_ICMP)
+        self.ping_method_combo.addItem("TCP connect", METHOD_TCP)
+        count_layout.addWidget(self.ping_method_combo)
         count_layout.addStretch()
         
         # Continuous ping checkbox
@@ -356,16 +312,22 @@ class NetworkScannerDialog(QDialog):
         # Results section
         results_splitter = QSplitter(Qt.Vertical)
         
-        # Open ports table
+        # Open ports table (closed ports on request)
         open_group = QGroupBox("Open Ports")
         open_layout = QVBoxLayout(open_group)
         
-        self.open_ports_table = QTableWidget()
-        self.open_ports_table.setColumnCount(3)
-        self.open_ports_table.setHorizontalHeaderLabels(["Port", "Service", "Status"])
+        self.port_results_model = PortResultsModel(self)
+        self.open_ports_table = QTableView()
+        self.open_ports_table.setModel(self.port_results_model)
+        self.open_ports_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.open_ports_table.verticalHeader().setVisible(False)
+        self.open_ports_table.verticalHeader().setDefaultSectionSize(22)
         self.open_ports_table.horizontalHeader().setStretchLastSection(True)
         open_layout.addWidget(self.open_ports_table)
         
+        self.show_closed_check = QCheckBox("Show closed ports")
+        open_layout.addWidget(self.show_closed_check)
+        
         # Statistics
         self.scan_stats_label = QLabel("Ready to scan...")
         open_layout.addWidget(self.scan_stats_label)
@@ -395,12 +357,14 @@ class NetworkScannerDialog(QDialog):
         self.ping_stop_button.clicked.connect(self._stop_ping)
         self.ping_clear_button.clicked.connect(self._clear_ping_results)
         self.ping_host_edit.returnPressed.connect(self._start_ping)
+        self.ping_tunnel_hosts_button.clicked.connect(self._set_tunnel_hosts)
         
         # Port scan tab connections
         self.scan_start_button.clicked.connect(self._start_port_scan)
         self.scan_stop_button.clicked.connect(self._stop_port_scan)
         self.scan_clear_button.clicked.connect(self._clear_scan_results)
         self.scan_host_edit.returnPressed.connect(self._start_port_scan)
+        self.show_closed_check.toggled.connect(self.port_results_model.set_show_closed)
         
         # Preset buttons
         self.common_ports_button.clicked.connect(self._set_common_ports)
@@ -412,27 +376,40 @@ class NetworkScannerDialog(QDialog):
     
     def _start_ping(self):
         """Start ping operation."""
-        host = self.ping_host_edit.text().strip()
-        if not host:
+        hosts = self.ping_host_edit.text().replace(',', ' ').split()
+        if not hosts:
             QMessageBox.warning(self, "Input Error", "Please enter a host or IP address.")
             return
         
-        count = self.ping_count_spin.value() if not self.continuous_ping_check.isChecked() else 999999
+        count = self.ping_count_spin.value() if not self.continuous_ping_check.isChecked() else None
         
         self.ping_start_button.setEnabled(False)
         self.ping_stop_button.setEnabled(True)
         
-        self.ping_results.append(f"Starting ping to {host}...\n")
+        self.ping_results.append(f"Starting ping to {', '.join(hosts)}...\n")
         
-        self.ping_worker = PingWorker(host, count)
-        self.ping_worker.ping_result.connect(self._handle_ping_result)
+        self.ping_worker = PingWorker(hosts, count, self.ping_method_combo.currentData())
+        self.ping_worker.ping_results.connect(self._handle_ping_results)
+        self.ping_worker.ping_info.connect(self.ping_results.append)
+        self.ping_worker.ping_stats.connect(self._show_ping_statistics)
         self.ping_worker.ping_finished.connect(self._ping_finished)
         self.ping_worker.start()
         
         # Initialize stats
         self.ping_sent = 0
         self.ping_received = 0
-        self.ping_times = []
+    
+    def _set_tunnel_hosts(self):
+        """Fill in the SSH host of every configured tunnel."""
+        config_manager = getattr(self.parent(), 'config_manager', None)
+        if config_manager is None:
+            return
+        hosts = []
+        for config in config_manager.get_all_configurations().values():
+            host = config.ssh_host if config.ssh_port == DEFAULT_SSH_PORT else f"{config.ssh_host}:{config.ssh_port}"
+            if host not in hosts:
+                hosts.append(host)
+        self.ping_host_edit.setText(" ".join(hosts))
     
     def _stop_ping(self):
         """Stop ping operation."""
@@ -447,29 +424,44 @@ class NetworkScannerDialog(QDialog):
         if self.ping_worker:
             self.ping_worker.wait()
             self.ping_worker = None
-        
-        # Show final statistics
-        if self.ping_times:
-            avg_time = sum(self.ping_times) / len(self.ping_times)
-            min_time = min(self.ping_times)
-            max_time = max(self.ping_times)
-            
-            loss_rate = ((self.ping_sent - self.ping_received) / self.ping_sent) * 100 if self.ping_sent > 0 else 0
-            
-            self.ping_results.append(f"\n--- Ping Statistics ---")
-            self.ping_results.append(f"Packets: Sent = {self.ping_sent}, Received = {self.ping_received}, Lost = {self.ping_sent - self.ping_received} ({loss_rate:.1f}% loss)")
-            self.ping_results.append(f"Round-trip times: Min = {min_time:.1f}ms, Max = {max_time:.1f}ms, Avg = {avg_time:.1f}ms\n")
     
-    def _handle_ping_result(self, host: str, success: bool, response_time: float):
-        """Handle individual ping result."""
-        self.ping_sent += 1
-        
-        if success:
-            self.ping_received += 1
-            self.ping_times.append(response_time)
-            self.ping_results.append(f"Reply from {host}: time={response_time:.1f}ms")
-        else:
-            self.ping_results.append(f"Request timeout for {host}")
+    def _show_ping_statistics(self, stats_list: list):
+        """Show per-host statistics with RTT and jitter histograms."""
+        lines = ["", "--- Ping Statistics ---"]
+        for stats in stats_list:
+            if stats.error:
+                continue
+            lines.append(f"{stats.host} via {stats.method_text}:")
+            lines.append(f"  Packets: Sent = {stats.sent}, Received = {stats.received}, "
+                         f"Lost = {stats.lost} ({stats.loss:.1f}% loss)")
+            if stats.received:
+                lines.append(f"  Round-trip times: Min = {stats.min_rtt:.3f}ms, Max = {stats.max_rtt:.3f}ms, "
+                             f"Avg = {stats.avg_rtt:.3f}ms, Jitter = {stats.jitter:.3f}ms")
+                lines.extend(self._histogram_lines("RTT", stats.rtt_histogram))
+            if stats.received > 1:
+                lines.extend(self._histogram_lines("Jitter", stats.jitter_histogram))
+        self.ping_results.append("\n".join(lines) + "\n")
+    
+    @staticmethod
+    def _histogram_lines(title: str, counts: List[int]) -> List[str]:
+        peak = max(counts) or 1
+        lines = [f"  {title} histogram:"]
+        for label, count in zip(bucket_labels(), counts):
+            if count:
+                lines.append(f"    {label:>10} ms | {'#' * max(1, round(count / peak * 30))} {count}")
+        return lines
+    
+    def _handle_ping_results(self, results: list):
+        """Handle a batch of ping results."""
+        lines = []
+        for host, success, response_time in results:
+            self.ping_sent += 1
+            if success:
+                self.ping_received += 1
+                lines.append(f"Reply from {host}: time={response_time:.3f}ms")
+            else:
+                lines.append(f"Request timeout for {host}")
+        self.ping_results.append("\n".join(lines))
         
         # Update statistics
         loss_rate = ((self.ping_sent - self.ping_received) / self.ping_sent) * 100 if self.ping_sent > 0 else 0
@@ -504,24 +496,21 @@ class NetworkScannerDialog(QDialog):
         self.scan_start_button.setEnabled(False)
         self.scan_stop_button.setEnabled(True)
         self.scan_progress.setVisible(True)
-        self.scan_progress.setRange(start_port, end_port)
+        self.total_ports = end_port - start_port + 1
+        self.scan_progress.setRange(0, self.total_ports)
+        self.scan_progress.setValue(0)
         
         # Clear previous results
-        self.open_ports_table.setRowCount(0)
+        self.port_results_model.clear()
         self.scan_log.clear()
         
         self.scan_log.append(f"Starting port scan on {host}:{start_port}-{end_port}...")
         
         self.port_worker = PortScanWorker(host, start_port, end_port, timeout)
-        self.port_worker.port_result.connect(self._handle_port_result)
-        self.port_worker.scan_progress.connect(self._update_scan_progress)
+        self.port_worker.results_ready.connect(self._handle_port_results)
+        self.port_worker.scan_error.connect(self.scan_log.append)
         self.port_worker.scan_finished.connect(self._scan_finished)
         self.port_worker.start()
-        
-        # Initialize stats
-        self.scanned_ports = 0
-        self.open_ports_count = 0
-        self.total_ports = end_port - start_port + 1
     
     def _stop_port_scan(self):
         """Stop port scan operation."""
@@ -538,40 +527,23 @@ class NetworkScannerDialog(QDialog):
             self.port_worker.wait()
             self.port_worker = None
         
-        self.scan_log.append(f"\nScan completed. Found {self.open_ports_count} open ports out of {self.scanned_ports} scanned.")
+        model = self.port_results_model
+        self.scan_log.append(f"\nScan completed. Found {model.open_count} open ports out of {model.scanned_count} scanned.")
     
-    def _handle_port_result(self, host: str, port: int, is_open: bool, service: str):
-        """Handle individual port scan result."""
-        self.scanned_ports += 1
-        
-        if is_open:
-            self.open_ports_count += 1
-            
-            # Add to open ports table
-            row = self.open_ports_table.rowCount()
-            self.open_ports_table.insertRow(row)
-            
-            port_item = QTableWidgetItem(str(port))
-            service_item = QTableWidgetItem(service)
-            status_item = QTableWidgetItem("Open")
-            status_item.setBackground(QColor(144, 238, 144))  # Light green
-            
-            self.open_ports_table.setItem(row, 0, port_item)
-            self.open_ports_table.setItem(row, 1, service_item)
-            self.open_ports_table.setItem(row, 2, status_item)
-            
-            self.scan_log.append(f"Port {port} ({service}) - OPEN")
+    def _handle_port_results(self, results: list):
+        """Handle a batch of port scan results."""
+        model = self.port_results_model
+        opened = model.add_results(results)
+        if opened:
+            self.scan_log.append("\n".join(f"Port {r.port} ({r.service}) - OPEN" for r in opened))
         
         # Update statistics
-        self.scan_stats_label.setText(f"Scanned: {self.scanned_ports}/{self.total_ports}, Open: {self.open_ports_count}")
-    
-    def _update_scan_progress(self, current_port: int):
-        """Update scan progress."""
-        self.scan_progress.setValue(current_port)
+        self.scan_progress.setValue(model.scanned_count)
+        self.scan_stats_label.setText(f"Scanned: {model.scanned_count}/{self.total_ports}, Open: {model.open_count}")
     
     def _clear_scan_results(self):
         """Clear scan results."""
-        self.open_ports_table.setRowCount(0)
+        self.port_results_model.clear()
         self.scan_log.clear()
         self.scan_stats_label.setText("Ready to scan...")
     
@@ -660,21 +632,13 @@ class NetworkScannerManager:
         # Quick port scan of most common ports
         common_ports = [21, 22, 23, 25, 53, 80, 135, 139, 443, 445, 3389]
         
-        def scan_port(port):
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex((host, port))
-                sock.close()
-                return port if result == 0 else None
-            except Exception:
-                return None
-        
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(scan_port, port) for port in common_ports]
-            for future in as_completed(futures):
-                port = future.result()
-                if port:
-                    results['open_ports'].append(port)
+        def record_open(result: PortResult):
+            if result.is_open:
+                results['open_ports'].append(result.port)
+        
+        try:
+            PortProber(host, timeout=1).run(common_ports, on_result=record_open)
+        except OSError:
+            pass
         
         return results
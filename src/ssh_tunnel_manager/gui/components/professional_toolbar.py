@@ -23,6 +23,7 @@ class ProfessionalToolbar(QWidget):
     start_tunnel = Signal()
     stop_tunnel = Signal()
     test_tunnel = Signal()
+    test_all_tunnels = Signal()
     browse_files = Signal()
     browse_remote_files = Signal()
     open_web_browser = Signal()
@@ -66,6 +67,11 @@ class ProfessionalToolbar(QWidget):
         self.buttons['add'].clicked.connect(self.add_tunnel.emit)
         toolbar_layout.addWidget(self.buttons['add'])
         
+        self.buttons['test_all'] = self._create_button("Test All", "default")
+        self.buttons['test_all'].setToolTip("Test every running tunnel at once")
+        self.buttons['test_all'].clicked.connect(self.test_all_tunnels.emit)
+        toolbar_layout.addWidget(self.buttons['test_all'])
+        
         # Tools group - simplified, actions moved to cards
         toolbar_layout.addWidget(self._create_separator())
         toolbar_layout.addWidget(self._create_group_label("Tools"))
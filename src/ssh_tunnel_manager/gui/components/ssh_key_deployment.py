@@ -276,8 +276,10 @@ class SSHKeyDeployWorker(QThread):
         This method uses SFTP for direct file operations instead of shell commands,
         providing the most secure deployment method available.
         """
+        session = None
         try:
             import paramiko
+            from ...core.ssh_pool import get_pool
             
             self.progress_update.emit("Trying paramiko method...")
             
@@ -286,25 +288,20 @@ class SSHKeyDeployWorker(QThread):
                 self.progress_update.emit("Key validation failed in paramiko method")
                 return False
             
-            # Create SSH client with security settings
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Connect to server with timeout
+            # Borrow a pooled connection (reused by later deployments,
+            # transfers and listings against the same server)
             self.progress_update.emit("Connecting via paramiko...")
-            ssh.connect(
+            session = get_pool().acquire(
                 hostname=self.host,
                 port=self.port,
                 username=self.username,
                 password=self.password,
-                timeout=30,
-                auth_timeout=30,
-                banner_timeout=30
+                timeout=30
             )
             
             # Use SFTP for secure file operations instead of shell commands
             self.progress_update.emit("Opening SFTP connection...")
-            sftp = ssh.open_sftp()
+            sftp = session.sftp()
             
             # Ensure .ssh directory exists with proper permissions
             ssh_dir = '.ssh'
@@ -343,8 +340,6 @@ class SSHKeyDeployWorker(QThread):
             if new_key in existing_keys:
                 self.progress_update.emit("Key already exists in authorized_keys")
                 self.deployment_result.emit(True, "SSH key already deployed (found existing entry)")
-                sftp.close()
-                ssh.close()
                 return True
             
             # Add new key to the list
@@ -378,10 +373,6 @@ class SSHKeyDeployWorker(QThread):
             except Exception as e:
                 self.progress_update.emit(f"Warning: Could not set file permissions: {e}")
             
-            # Clean up connections
-            sftp.close()
-            ssh.close()
-            
             self.deployment_result.emit(True, "SSH key deployed successfully using paramiko!")
             return True
             
@@ -399,6 +390,10 @@ class SSHKeyDeployWorker(QThread):
             safe_error = str(e).replace(self.password, '[PASSWORD]')
             self.progress_update.emit(f"paramiko method failed: {safe_error}")
             return False
+        finally:
+            # Return the connection to the pool
+            if session is not None:
+                session.release()
     
     def _provide_manual_instructions(self):
         """
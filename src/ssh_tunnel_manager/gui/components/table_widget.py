@@ -74,62 +74,77 @@ class TunnelTableWidget(QObject):
         
         self.selection_changed.emit(selected, config_name)
     
+    # Columns whose text is centered
+    CENTERED_COLUMNS = (1, 2, 3)
+    
     def refresh_table(self, configs: dict, active_tunnels: dict):
-        """Refresh table with current configurations."""
+        """Refresh table with current configurations.
+        
+        Rows are keyed by tunnel name: only rows for added or deleted tunnels
+        are inserted or removed, and existing cells are only touched when
+        their text changed.
+        """
         if not self.table:
             return
-            
-        self.table.setRowCount(len(configs))
         
-        for row, (name, config) in enumerate(configs.items()):
-            # Name
-            name_item = QTableWidgetItem(name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 0, name_item)
-            
-            # Status with emoji
-            if name in active_tunnels:
-                status_text = "🟢 Running"
-                status_item = QTableWidgetItem(status_text)
-            else:
-                status_text = "🔴 Stopped"
-                status_item = QTableWidgetItem(status_text)
-            
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            status_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 1, status_item)
-            
-            # Type
-            type_item = QTableWidgetItem(config.tunnel_type.title())
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            type_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 2, type_item)
+        self.table.setUpdatesEnabled(False)
+        try:
+            current = [self.table.item(row, 0).text() if self.table.item(row, 0) else ""
+                       for row in range(self.table.rowCount())]
             
-            # Local Port
-            port_item = QTableWidgetItem(str(config.local_port))
-            port_item.setFlags(port_item.flags() & ~Qt.ItemIsEditable)
-            port_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 3, port_item)
+            # Remove rows for deleted tunnels
+            for row in reversed(range(len(current))):
+                if current[row] not in configs:
+                    self.table.removeRow(row)
+                    del current[row]
             
-            # Remote
-            if config.tunnel_type == 'dynamic':
-                remote_str = "SOCKS Proxy"
-            else:
-                remote_str = f"{config.remote_host}:{config.remote_port}"
-            remote_item = QTableWidgetItem(remote_str)
-            remote_item.setFlags(remote_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 4, remote_item)
-            
-            # SSH Host
-            ssh_str = f"{config.ssh_user}@{config.ssh_host}:{config.ssh_port}"
-            ssh_item = QTableWidgetItem(ssh_str)
-            ssh_item.setFlags(ssh_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 5, ssh_item)
-            
-            # Description
-            desc_item = QTableWidgetItem(config.description)
-            desc_item.setFlags(desc_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 6, desc_item)
+            for row, (name, config) in enumerate(configs.items()):
+                if row >= len(current) or current[row] != name:
+                    # New tunnel, or one whose position changed
+                    if name in current:
+                        old_row = current.index(name)
+                        self.table.removeRow(old_row)
+                        del current[old_row]
+                    self.table.insertRow(row)
+                    current.insert(row, name)
+                
+                for column, text in enumerate(self._row_values(name, config, active_tunnels)):
+                    self._set_cell(row, column, text)
+        finally:
+            self.table.setUpdatesEnabled(True)
+    
+    def _row_values(self, name: str, config, active_tunnels: dict) -> list[str]:
+        """Get the display text for each column of a tunnel row."""
+        # Status with emoji
+        status_text = "🟢 Running" if name in active_tunnels else "🔴 Stopped"
+        
+        # Remote
+        if config.tunnel_type == 'dynamic':
+            remote_str = "SOCKS Proxy"
+        else:
+            remote_str = f"{config.remote_host}:{config.remote_port}"
+        
+        return [
+            name,
+            status_text,
+            config.tunnel_type.title(),
+            str(config.local_port),
+            remote_str,
+            f"{config.ssh_user}@{config.ssh_host}:{config.ssh_port}",
+            config.description,
+        ]
+    
+    def _set_cell(self, row: int, column: int, text: str):
+        """Set a cell's text, creating the item only if it does not exist yet."""
+        item = self.table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem(text)
+            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            if column in self.CENTERED_COLUMNS:
+                item.setTextAlignment(Qt.AlignCenter)
+            self.table.setItem(row, column, item)
+        elif item.text() != text:
+            item.setText(text)
     
     def get_selected_config_name(self) -> str:
         """Get the currently selected configuration name."""
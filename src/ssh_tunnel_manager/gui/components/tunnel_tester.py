@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Bulk Tunnel Tester
+Tests every running tunnel at once and shows a report as results arrive
+"""
+
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView
+)
+from PySide6.QtCore import QThread, Signal, Qt
+from PySide6.QtGui import QColor
+
+from ...core.models import TunnelConfig
+from ...utils.connection_tester import ConnectionTester, TunnelTestResult
+
+
+class BulkTestWorker(QThread):
+    """Worker thread testing a fixed list of tunnel configs."""
+
+    result_ready = Signal(object)  # TunnelTestResult, as each test finishes
+    tests_finished = Signal(list)  # all TunnelTestResults, sorted by name
+
+    def __init__(self, configs: List[TunnelConfig]):
+        super().__init__()
+        self.configs = configs
+
+    def run(self):
+        """Run the tests."""
+        results = ConnectionTester.test_configs(self.configs, on_result=self.result_ready.emit)
+        self.tests_finished.emit(results)
+
+
+class BulkTestDialog(QDialog):
+    """Report of a test of all running tunnels."""
+
+    COLUMNS = ["Tunnel", "Result", "Protocol", "Latency", "Details"]
+
+    def __init__(self, active_tunnels: Dict, parent=None,
+                 log: Optional[Callable[[str], None]] = None):
+        super().__init__(parent)
+        self.setWindowTitle("Test All Tunnels")
+        self.resize(760, 400)
+        self.setModal(False)
+        self.log = log
+        self.worker = None
+        self._rows: Dict[str, int] = {}
+
+        self._setup_ui()
+        self._start(active_tunnels)
+
+    def _setup_ui(self):
+        """Setup the user interface."""
+        layout = QVBoxLayout(self)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        for column in range(len(self.COLUMNS) - 1):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(len(self.COLUMNS) - 1, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.close_button = QPushButton("Close")
+        self.close_button.clicked.connect(self.close)
+        button_layout.addWidget(self.close_button)
+        layout.addLayout(button_layout)
+
+    def _start(self, active_tunnels: Dict):
+        """List the running tunnels as pending and start testing them."""
+        # One snapshot for the table and the worker: a tunnel stopped after
+        # this still gets tested (and fails) rather than never reporting
+        configs = sorted((tunnel.config for tunnel in list(active_tunnels.values())
+                          if tunnel.is_running), key=lambda config: config.name)
+        names = [config.name for config in configs]
+        self.table.setRowCount(len(names))
+        for row, name in enumerate(names):
+            self._rows[name] = row
+            self.table.setItem(row, 0, QTableWidgetItem(name))
+            self.table.setItem(row, 1, QTableWidgetItem("Testing..."))
+        if not names:
+            self.status_label.setText("No running tunnels to test")
+            return
+
+        self.status_label.setText(f"Testing {len(names)} tunnel(s)...")
+        self.worker = BulkTestWorker(configs)
+        self.worker.result_ready.connect(self._show_result)
+        self.worker.tests_finished.connect(self._tests_finished)
+        self.worker.start()
+
+    def _show_result(self, result: TunnelTestResult):
+        """Fill in a tunnel's row."""
+        row = self._rows.get(result.name)
+        if row is None:
+            return
+        outcome = QTableWidgetItem("✅ Passed" if result.success else "❌ Failed")
+        outcome.setForeground(QColor("#2ea44f" if result.success else "#f85149"))
+        latency = f"{result.latency:.1f} ms" if result.latency is not None else "—"
+        latency_item = QTableWidgetItem(latency)
+        latency_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self.table.setItem(row, 1, outcome)
+        self.table.setItem(row, 2, QTableWidgetItem(result.protocol or "—"))
+        self.table.setItem(row, 3, latency_item)
+        self.table.setItem(row, 4, QTableWidgetItem(result.message))
+
+    def _tests_finished(self, results: list):
+        """Summarize the run."""
+        passed = sum(result.success for result in results)
+        summary = f"{passed} of {len(results)} tunnel(s) passed"
+        self.status_label.setText(summary)
+        if self.log:
+            icon = '✅' if passed == len(results) else '⚠️'
+            self.log(f"{icon} Tested all tunnels: {summary}")
+            for result in results:
+                if not result.success:
+                    self.log(f"❌ Test failed for {result.name}: {result.error}")
+
+    def done(self, result):
+        """Escape closes the dialog here, without closeEvent."""
+        self._wait_for_worker()
+        super().done(result)
+
+    def closeEvent(self, event):
+        """Handle dialog close event."""
+        self._wait_for_worker()
+        event.accept()
+
+    def _wait_for_worker(self):
+        # Tests are bounded by their timeouts, so waiting is short; the
+        # worker must not outlive the dialog, which is deleted on close
+        if self.worker:
+            self.worker.wait()
@@ -8,11 +8,15 @@ from .password_dialog import SSHPasswordDialog
 from .sftp_browser import SFTPFileBrowser
 from .quick_transfer import QuickFileTransferDialog
 from .multi_hop_sftp_browser import MultiHopSFTPBrowser
+from .remote_file_viewer import RemoteFileViewer
+from .profile_benchmark import ProfileBenchmarkDialog
 
 __all__ = [
     'TunnelConfigDialog', 
     'SSHPasswordDialog', 
     'SFTPFileBrowser', 
     'QuickFileTransferDialog',
-    'MultiHopSFTPBrowser'
+    'MultiHopSFTPBrowser',
+    'RemoteFileViewer',
+    'ProfileBenchmarkDialog'
 ]
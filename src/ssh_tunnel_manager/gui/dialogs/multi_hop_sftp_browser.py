@@ -11,7 +11,6 @@ import os
 import stat
 import threading
 import socket
-import paramiko
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -25,7 +24,9 @@ from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize
 from PySide6.QtGui import QAction, QIcon, QFont, QCursor
 
 from ...core.models import TunnelConfig
-from .sftp_browser import SFTPFileBrowser, FileTransferWorker
+from ...core.ssh_pool import get_pool
+from ...core.remote_listing import ListingCache
+from .sftp_browser import SFTPFileBrowser
 
 
 class MultiHopSFTPBrowser(SFTPFileBrowser):
@@ -46,10 +47,15 @@ class MultiHopSFTPBrowser(SFTPFileBrowser):
         QDialog.__init__(self, parent)
         self.tunnel_config = tunnel_config
         self.password = password
+        self.ssh_session = None
+        self.jump_session = None
         self.ssh_client = None
         self.sftp_client = None
         self.current_remote_path = "/"
         self.transfer_worker = None
+        self.listing_worker = None
+        self.listing_cache = ListingCache()
+        self._queue_items: Dict[int, QTreeWidgetItem] = {}
         self.access_remote = access_remote
         
         # Set window title based on access mode
@@ -153,88 +159,53 @@ class MultiHopSFTPBrowser(SFTPFileBrowser):
             # (which forwards to remote_host:remote_port, not remote_host:22),
             # we need to use the existing SSH connection as a jump host
             
-            # Create first SSH connection to the jump host
-            jump_ssh = paramiko.SSHClient()
-            jump_ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            jump_connect_params = {
-                'hostname': self.tunnel_config.ssh_host,
-                'port': self.tunnel_config.ssh_port,
-                'username': self.tunnel_config.ssh_user,
-                'timeout': 30
-            }
-            
-            # Add authentication for jump host
-            if self.password:
-                jump_connect_params['password'] = self.password
-            elif self.tunnel_config.ssh_key_path and os.path.exists(self.tunnel_config.ssh_key_path):
-                jump_connect_params['key_filename'] = self.tunnel_config.ssh_key_path
+            # Borrow a pooled connection to the jump host
+            key_filename = None
+            if not self.password and self.tunnel_config.ssh_key_path and os.path.exists(self.tunnel_config.ssh_key_path):
+                key_filename = self.tunnel_config.ssh_key_path
             
             self.log(f"Connecting to jump host {self.tunnel_config.ssh_host}...")
-            jump_ssh.connect(**jump_connect_params)
+            self.jump_session = get_pool().acquire(
+                hostname=self.tunnel_config.ssh_host,
+                port=self.tunnel_config.ssh_port,
+                username=self.tunnel_config.ssh_user,
+                password=self.password,
+                key_filename=key_filename,
+            )
+            jump_ssh = self.jump_session.client
             
             # Check if SSH is available on the remote host
             self.log(f"Checking SSH connectivity to {self.tunnel_config.remote_host}:22...")
             if not self._check_remote_ssh_port(jump_ssh):
                 raise Exception(f"SSH port (22) is not accessible on remote host {self.tunnel_config.remote_host}")
             
-            # Create a channel through the jump host to the remote host's SSH port
-            self.log(f"Creating channel to {self.tunnel_config.remote_host}:22...")
-            jump_transport = jump_ssh.get_transport()
-            dest_addr = (self.tunnel_config.remote_host, 22)  # SSH port on remote host
-            local_addr = ('localhost', self.tunnel_config.local_port)  # Local tunnel port
-            channel = jump_transport.open_channel("direct-tcpip", dest_addr, local_addr)
-            
-            # Create SSH client for the remote host using the channel
-            self.log(f"Creating SSH transport for remote host {self.tunnel_config.remote_host}...")
-            
-            # Create transport directly from the channel
-            remote_transport = paramiko.Transport(channel)
-            
-            # Start the client
-            remote_transport.start_client()
-            
-            # Authenticate to the remote host
-            if self.password:
-                self.log(f"Authenticating with password...")
-                remote_transport.auth_password(self.tunnel_config.ssh_user, self.password)
-            elif self.tunnel_config.ssh_key_path and os.path.exists(self.tunnel_config.ssh_key_path):
-                self.log(f"Authenticating with SSH key...")
-                # Load the private key
-                try:
-                    # Try different key types
-                    for key_class in [paramiko.RSAKey, paramiko.Ed25519Key, paramiko.ECDSAKey, paramiko.DSSKey]:
-                        try:
-                            private_key = key_class.from_private_key_file(self.tunnel_config.ssh_key_path)
-                            break
-                        except:
-                            continue
-                    else:
-                        raise Exception("Could not load SSH private key")
-                    
-                    remote_transport.auth_publickey(self.tunnel_config.ssh_user, private_key)
-                except Exception as key_error:
-                    raise Exception(f"SSH key authentication failed: {str(key_error)}")
-            else:
+            # Connect to the remote host's SSH port through a direct-tcpip
+            # channel on the jump connection; the hop connection is pooled
+            # too, so reopening this browser skips both handshakes
+            if not self.password and not key_filename:
                 raise Exception("No authentication method provided")
+            self.log(f"Authenticating to remote host {self.tunnel_config.remote_host} via jump host...")
+            self.ssh_session = get_pool().acquire(
+                hostname=self.tunnel_config.remote_host,
+                port=22,
+                username=self.tunnel_config.ssh_user,
+                password=self.password,
+                key_filename=key_filename,
+                via=self.jump_session,
+            )
+            self.ssh_client = self.ssh_session.client
             
-            if not remote_transport.is_authenticated():
+            if not self.ssh_session.transport.is_authenticated():
                 raise Exception("Authentication to remote host failed")
                 
             self.log(f"Successfully authenticated to remote host!")
             
-            # Create SFTP client from the transport
-            self.sftp_client = paramiko.SFTPClient.from_transport(remote_transport)
-            
-            # Store the transport for cleanup
-            self.remote_transport = remote_transport
+            # SFTP channel on the pooled hop connection
+            self.sftp_client = self.ssh_session.sftp()
             
             self.log(f"Connected successfully to {self.tunnel_config.remote_host} via tunnel!")
             self.status_label.setText(f"Connected to {self.tunnel_config.remote_host} via tunnel")
             
-            # Store jump connection for cleanup
-            self.jump_ssh = jump_ssh
-            
             # Load initial directory
             self.refresh_remote_files()
                 
@@ -263,23 +234,18 @@ class MultiHopSFTPBrowser(SFTPFileBrowser):
             self.close()
     
     def disconnect(self):
-        """Disconnect all SSH connections."""
+        """Return all SSH connections to the pool."""
         try:
-            if hasattr(self, 'sftp_client') and self.sftp_client:
-                self.sftp_client.close()
-                self.sftp_client = None
-                
-            if hasattr(self, 'remote_transport') and self.remote_transport:
-                self.remote_transport.close()
-                self.remote_transport = None
+            if self.ssh_session:
+                self.ssh_session.release()
+                self.ssh_session = None
                 
-            if hasattr(self, 'ssh_client') and self.ssh_client:
-                self.ssh_client.close()
-                self.ssh_client = None
+            if self.jump_session:
+                self.jump_session.release()
+                self.jump_session = None
                 
-            if hasattr(self, 'jump_ssh') and self.jump_ssh:
-                self.jump_ssh.close()
-                self.jump_ssh = None
+            self.sftp_client = None
+            self.ssh_client = None
                 
         except Exception as e:
             self.log(f"Error during disconnect: {str(e)}")
@@ -332,14 +298,14 @@ class MultiHopSFTPBrowser(SFTPFileBrowser):
             self.log(f"Testing direct SSH channel to {self.tunnel_config.remote_host}:22...")
             
             transport = jump_ssh.get_transport()
-            # Set socket timeout for the transport
-            transport.sock.settimeout(timeout)
             
-            # Try to open a channel to the SSH port
+            # Try to open a channel to the SSH port (the transport may be
+            # pooled, so bound the open itself instead of its socket)
             test_channel = transport.open_channel(
                 "direct-tcpip", 
                 (self.tunnel_config.remote_host, 22), 
-                ('localhost', 0)
+                ('localhost', 0),
+                timeout=timeout
             )
             
             # If we got here, the port is open. Let's try to read SSH banner
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Performance Profile Benchmark Dialog
+"""
+
+from typing import Optional
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QPushButton, QLabel,
+    QSpinBox, QDoubleSpinBox, QCheckBox, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView, QDialogButtonBox
+)
+from PySide6.QtCore import Qt, QThread, Signal
+
+from ...core.profile_benchmark import ProfileBenchmark, ProfileBenchmarkResult
+from ...core.ssh_profiles import PROFILES
+from ...core.sftp_transfer import format_rate
+
+
+class ProfileBenchmarkWorker(QThread):
+    """Worker thread running the benchmark, one result per profile."""
+
+    result_ready = Signal(object)  # ProfileBenchmarkResult
+
+    def __init__(self, benchmark: ProfileBenchmark, parent=None):
+        super().__init__(parent)
+        self.benchmark = benchmark
+        self.cancelled = False
+
+    def run(self):
+        self.benchmark.run(on_result=self.result_ready.emit, is_cancelled=lambda: self.cancelled)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class ProfileBenchmarkDialog(QDialog):
+    """Compare performance profiles on a simulated link and pick one."""
+
+    COLUMNS = ["Profile", "Connect", "Throughput", "Round Trip", "Cipher", "Compression"]
+
+    def __init__(self, current_profile: str = "", parent=None):
+        super().__init__(parent)
+        self.selected_profile = current_profile
+        self.worker: Optional[ProfileBenchmarkWorker] = None
+        self.results = []
+
+        self.setWindowTitle("Benchmark Performance Profiles")
+        self.resize(720, 380)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the dialog UI."""
+        layout = QVBoxLayout(self)
+
+        info = QLabel(
+            "Each profile connects to a local SSH server stand-in through a simulated link.\n"
+            "Enter the round-trip time and bandwidth of the link the tunnel will use."
+        )
+        info.setStyleSheet("color: gray;")
+        layout.addWidget(info)
+
+        form = QFormLayout()
+        self.rtt_spin = QSpinBox()
+        self.rtt_spin.setRange(0, 2000)
+        self.rtt_spin.setSuffix(" ms")
+        self.bandwidth_spin = QDoubleSpinBox()
+        self.bandwidth_spin.setRange(0, 10000)
+        self.bandwidth_spin.setDecimals(1)
+        self.bandwidth_spin.setSuffix(" Mbit/s")
+        self.bandwidth_spin.setSpecialValueText("Unlimited")
+        self.compressible_check = QCheckBox("Compressible data (text, logs) instead of video/archives")
+        form.addRow("Round-trip time:", self.rtt_spin)
+        form.addRow("Bandwidth:", self.bandwidth_spin)
+        form.addRow("", self.compressible_check)
+        layout.addLayout(form)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        controls = QHBoxLayout()
+        self.run_btn = QPushButton("▶ Run Benchmark")
+        self.run_btn.clicked.connect(self.start_benchmark)
+        self.status_label = QLabel("")
+        controls.addWidget(self.run_btn)
+        controls.addWidget(self.status_label)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Ok).setText("Use Selected Profile")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def start_benchmark(self):
+        """Run every profile on the configured link."""
+        self.table.setRowCount(0)
+        self.results = []
+        benchmark = ProfileBenchmark(
+            round_trip_time=self.rtt_spin.value() / 1000,
+            bandwidth=self.bandwidth_spin.value() * 1_000_000 / 8,
+            compressible=self.compressible_check.isChecked(),
+        )
+        self.worker = ProfileBenchmarkWorker(benchmark, self)
+        self.worker.result_ready.connect(self.on_result)
+        self.worker.finished.connect(self.on_finished)
+        self.run_btn.setEnabled(False)
+        self.status_label.setText("Running...")
+        self.worker.start()
+
+    def on_result(self, result: ProfileBenchmarkResult):
+        """Add one profile's measurements to the table."""
+        if self.sender() is not self.worker:
+            return
+        self.results.append(result)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        profile = PROFILES[result.profile]
+        if result.error:
+            cells = [profile.label, "", "", "", "", result.error]
+        else:
+            cells = [
+                profile.label,
+                f"{result.handshake * 1000:.0f} ms",
+                format_rate(result.throughput),
+                f"{result.round_trip * 1000:.1f} ms",
+                result.cipher,
+                result.compression,
+            ]
+        for column, text in enumerate(cells):
+            item = QTableWidgetItem(text)
+            item.setData(Qt.UserRole, result.profile)
+            self.table.setItem(row, column, item)
+
+    def on_finished(self):
+        if self.sender() is not self.worker:
+            return
+        self.worker = None
+        self.run_btn.setEnabled(True)
+        fastest = ProfileBenchmark.fastest(self.results)
+        lowest_latency = ProfileBenchmark.fastest(self.results, by='round_trip')
+        if fastest is None:
+            self.status_label.setText("No profile could connect")
+            return
+        self.status_label.setText(
+            f"Highest throughput: {PROFILES[fastest].label} - "
+            f"lowest latency: {PROFILES[lowest_latency].label}"
+        )
+        # Preselect the highest throughput profile
+        for row in range(self.table.rowCount()):
+            if self.table.item(row, 0).data(Qt.UserRole) == fastest:
+                self.table.selectRow(row)
+
+    def accept(self):
+        row = self.table.currentRow()
+        if row >= 0:
+            self.selected_profile = self.table.item(row, 0).data(Qt.UserRole)
+        super().accept()
+
+    def done(self, result: int):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+            self.worker = None
+        super().done(result)
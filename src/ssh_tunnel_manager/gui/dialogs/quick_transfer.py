@@ -4,6 +4,7 @@ SSH Tunnel Manager - Quick File Transfer Dialog
 """
 
 import os
+import posixpath
 from typing import Optional, List
 
 from PySide6.QtWidgets import (
@@ -14,8 +15,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
-from .sftp_browser import FileTransferWorker
+from .sftp_browser import TransferQueueWorker
 from ...core.models import TunnelConfig
+from ...core.transfer_queue import TransferJob
 
 
 class QuickFileTransferDialog(QDialog):
@@ -28,7 +30,7 @@ class QuickFileTransferDialog(QDialog):
         self.transfer_worker = None
         
         self.setWindowTitle(f"Quick File Transfer - {tunnel_config.ssh_host}")
-        self.setFixedSize(500, 400)
+        self.setFixedSize(500, 430)
         self.setup_ui()
     
     def setup_ui(self):
@@ -66,6 +68,10 @@ class QuickFileTransferDialog(QDialog):
         remote_layout.addWidget(self.remote_path_edit)
         upload_layout.addLayout(remote_layout)
         
+        # Only send the blocks that differ from the file already on the server
+        self.delta_check = QCheckBox("Delta sync (send changed blocks only)")
+        upload_layout.addWidget(self.delta_check)
+        
         # Upload button
         self.upload_btn = QPushButton("📤 Upload")
         self.upload_btn.clicked.connect(self.start_upload)
@@ -183,19 +189,12 @@ class QuickFileTransferDialog(QDialog):
             QMessageBox.warning(self, "No Destination", "Please specify a remote destination path.")
             return
         
-        # For simplicity, upload the first file
-        # In a full implementation, you'd handle multiple files
-        local_file = self.selected_files[0]
-        filename = os.path.basename(local_file)
-        
-        # Ensure remote path ends with the filename
-        if remote_path.endswith('/'):
-            full_remote_path = remote_path + filename
-        else:
-            full_remote_path = remote_path + '/' + filename
-        
-        self.log(f"Starting upload: {filename}")
-        self._start_transfer('upload', local_file, full_remote_path)
+        # Upload every selected file into the remote directory
+        remote_dir = remote_path.rstrip('/') or '/'
+        for local_file in self.selected_files:
+            filename = os.path.basename(local_file)
+            self.log(f"Starting upload: {filename}")
+            self._start_transfer('upload', local_file, posixpath.join(remote_dir, filename))
     
     def start_download(self):
         """Start downloading the specified file."""
@@ -220,9 +219,12 @@ class QuickFileTransferDialog(QDialog):
         self._start_transfer('download', local_file, remote_file)
     
     def _start_transfer(self, operation: str, local_path: str, remote_path: str):
-        """Start a file transfer operation."""
-        if self.transfer_worker and self.transfer_worker.isRunning():
-            QMessageBox.warning(self, "Transfer in Progress", "Another transfer is already in progress.")
+        """Queue a file transfer, starting the transfer queue if needed."""
+        size = os.path.getsize(local_path) if operation == 'upload' else None
+        job = TransferJob(operation, local_path, remote_path, size=size)
+        
+        # Join the running queue if there is one
+        if self.transfer_worker and self.transfer_worker.isRunning() and self.transfer_worker.add_job(job):
             return
         
         # Prepare SSH config for worker
@@ -230,6 +232,7 @@ class QuickFileTransferDialog(QDialog):
             'hostname': self.tunnel_config.ssh_host,
             'port': self.tunnel_config.ssh_port,
             'username': self.tunnel_config.ssh_user,
+            'profile': self.tunnel_config.performance_profile,
         }
         
         if self.password:
@@ -238,14 +241,13 @@ class QuickFileTransferDialog(QDialog):
             ssh_config['key_filename'] = self.tunnel_config.ssh_key_path
         
         # Create and start worker
-        self.transfer_worker = FileTransferWorker(operation, ssh_config, local_path, remote_path)
+        self.transfer_worker = TransferQueueWorker(ssh_config, delta=self.delta_check.isChecked())
         self.transfer_worker.progress_updated.connect(self.on_transfer_progress)
         self.transfer_worker.transfer_finished.connect(self.on_transfer_finished)
+        self.transfer_worker.add_job(job)
         
         self.progress_bar.setValue(0)
         self.cancel_btn.setEnabled(True)
-        self.upload_btn.setEnabled(False)
-        self.download_btn.setEnabled(False)
         
         self.transfer_worker.start()
     
@@ -258,9 +260,8 @@ class QuickFileTransferDialog(QDialog):
         """Handle transfer completion."""
         self.progress_bar.setValue(100 if success else 0)
         self.progress_label.setText("Transfer completed" if success else "Transfer failed")
-        self.cancel_btn.setEnabled(False)
-        self.upload_btn.setEnabled(True)
-        self.download_btn.setEnabled(True)
+        if self.sender() is self.transfer_worker:
+            self.cancel_btn.setEnabled(False)
         
         self.log(message)
         
@@ -285,7 +286,7 @@ class QuickFileTransferDialog(QDialog):
         
         # Auto-scroll to bottom
         cursor = self.log_text.textCursor()
-        cursor.movePosition(cursor.End)
+        cursor.movePosition(cursor.MoveOperation.End)
         self.log_text.setTextCursor(cursor)
     
     def closeEvent(self, event):
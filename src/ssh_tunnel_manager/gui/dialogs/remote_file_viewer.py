@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Remote File Viewer Dialog
+"""
+
+import codecs
+import re
+from typing import Callable, Optional, Tuple
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit,
+    QPlainTextEdit, QCheckBox
+)
+from PySide6.QtCore import QThread, QTimer, Signal
+from PySide6.QtGui import QFont, QTextCursor
+
+from ...core.remote_file_reader import FilePage, RemoteFileReader
+from ...core.ssh_pool import PooledSession
+from ...core.constants import VIEWER_PAGE_SIZE, VIEWER_FOLLOW_INTERVAL, VIEWER_FOLLOW_MAX_LINES
+from ...core.sftp_transfer import format_size
+
+_OFFSET_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([kmg%]?)b?\s*$', re.IGNORECASE)
+_OFFSET_UNITS = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+
+
+def parse_offset(text: str, size: int) -> Optional[int]:
+    """Byte offset from text like '4096', '10M' or '50%'; None if invalid."""
+    match = _OFFSET_PATTERN.match(text)
+    if not match:
+        return None
+    value, unit = float(match.group(1)), match.group(2).lower()
+    if unit == '%':
+        return int(size * min(value, 100) / 100)
+    return int(value * _OFFSET_UNITS[unit])
+
+
+class RemoteReadWorker(QThread):
+    """Worker thread running one read against the remote file."""
+
+    result_ready = Signal(object)
+    read_failed = Signal(str)
+
+    def __init__(self, read: Callable[[], object], parent=None):
+        super().__init__(parent)
+        self.read = read
+
+    def run(self):
+        try:
+            self.result_ready.emit(self.read())
+        except Exception as e:
+            self.read_failed.emit(str(e))
+
+
+class RemoteFileViewer(QDialog):
+    """Paged viewer for remote files of any size.
+
+    Pages are read on demand through a RemoteFileReader, so only the part
+    of the file on screen (plus a small block cache) is held in memory.
+    Follow mode polls the file size and appends whatever was written,
+    like tail -f.
+    """
+
+    def __init__(self, session: PooledSession, remote_path: str, parent=None):
+        super().__init__(parent)
+        # Own SFTP channel on the browser's connection, so reads don't queue
+        # behind listings or transfers
+        self.session = session.pool.acquire_shared(session)
+        self.remote_path = remote_path
+        self.reader: Optional[RemoteFileReader] = None
+        self.page: Optional[FilePage] = None
+        self.read_worker: Optional[RemoteReadWorker] = None
+        self.follow_pos = 0
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setInterval(VIEWER_FOLLOW_INTERVAL)
+        self.follow_timer.timeout.connect(self.poll_follow)
+
+        self.setWindowTitle(f"View File: {remote_path}")
+        self.setGeometry(300, 300, 800, 550)
+        self.setup_ui()
+        self._request(self._open_reader, self.on_page_loaded)
+
+    def setup_ui(self):
+        """Setup the dialog UI."""
+        layout = QVBoxLayout(self)
+
+        self.text_view = QPlainTextEdit()
+        self.text_view.setReadOnly(True)
+        self.text_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_view.setFont(QFont("Consolas", 10))
+        layout.addWidget(self.text_view)
+
+        # Navigation
+        nav_layout = QHBoxLayout()
+        self.start_btn = QPushButton("⏮ Start")
+        self.start_btn.clicked.connect(self.go_start)
+        self.prev_btn = QPushButton("◀ Previous")
+        self.prev_btn.clicked.connect(self.go_previous)
+        self.next_btn = QPushButton("Next ▶")
+        self.next_btn.clicked.connect(self.go_next)
+        self.end_btn = QPushButton("End ⏭")
+        self.end_btn.clicked.connect(self.go_end)
+
+        self.offset_edit = QLineEdit()
+        self.offset_edit.setPlaceholderText("Offset (e.g. 4096, 10M, 50%)")
+        self.offset_edit.returnPressed.connect(self.go_offset)
+        go_btn = QPushButton("Go")
+        go_btn.clicked.connect(self.go_offset)
+
+        self.follow_check = QCheckBox("Follow")
+        self.follow_check.setToolTip("Show new lines as they are written (tail -f)")
+        self.follow_check.toggled.connect(self.set_follow)
+
+        for widget in (self.start_btn, self.prev_btn, self.next_btn, self.end_btn):
+            nav_layout.addWidget(widget)
+        nav_layout.addWidget(self.offset_edit)
+        nav_layout.addWidget(go_btn)
+        nav_layout.addWidget(self.follow_check)
+        layout.addLayout(nav_layout)
+
+        # Status and close
+        bottom_layout = QHBoxLayout()
+        self.status_label = QLabel("Opening...")
+        bottom_layout.addWidget(self.status_label)
+        bottom_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        bottom_layout.addWidget(close_btn)
+        layout.addLayout(bottom_layout)
+
+        self._set_navigation_enabled(False)
+
+    # ------------------------------------------------------------------ #
+    # Paging
+    # ------------------------------------------------------------------ #
+
+    def go_start(self):
+        self._load_page(lambda reader: reader.page(0, VIEWER_PAGE_SIZE))
+
+    def go_previous(self):
+        if self.page is not None:
+            start = self.page.start
+            self._load_page(lambda reader: reader.page(start - VIEWER_PAGE_SIZE, start))
+
+    def go_next(self):
+        if self.page is not None:
+            end = self.page.end
+            self._load_page(lambda reader: reader.page(end, end + VIEWER_PAGE_SIZE))
+
+    def go_end(self):
+        self._load_page(lambda reader: reader.tail(VIEWER_PAGE_SIZE))
+
+    def go_offset(self):
+        if self.reader is None:
+            return
+        offset = parse_offset(self.offset_edit.text(), self.reader.size)
+        if offset is None:
+            self.status_label.setText("Invalid offset")
+            return
+        self._load_page(lambda reader: reader.page(offset, offset + VIEWER_PAGE_SIZE))
+
+    def _load_page(self, read: Callable[[RemoteFileReader], FilePage]):
+        if self.reader is None:
+            return
+        if self.follow_check.isChecked():
+            # Paging leaves follow mode
+            self.follow_check.setChecked(False)
+        reader = self.reader
+        self._request(lambda: read(reader), self.on_page_loaded)
+
+    def _open_reader(self) -> FilePage:
+        """Open the file (worker thread) and read its first page."""
+        self.reader = RemoteFileReader(self.session.sftp(), self.remote_path)
+        return self.reader.page(0, VIEWER_PAGE_SIZE)
+
+    def on_page_loaded(self, page: FilePage):
+        """Show a page read from the file."""
+        if self.sender() is not self.read_worker:
+            return
+        self.read_worker = None
+        self.page = page
+        self.text_view.setPlainText(page.text)
+        if self.follow_check.isChecked():
+            self.follow_pos = page.end
+            self._decoder.reset()
+            self.text_view.moveCursor(QTextCursor.MoveOperation.End)
+        self._set_navigation_enabled(True)
+        self._update_status()
+
+    # ------------------------------------------------------------------ #
+    # Follow mode
+    # ------------------------------------------------------------------ #
+
+    def set_follow(self, enabled: bool):
+        """Start or stop following the end of the file."""
+        if enabled:
+            # Bounded document: old lines scroll off as new ones arrive
+            self.text_view.setMaximumBlockCount(VIEWER_FOLLOW_MAX_LINES)
+            if self.reader is not None:
+                reader = self.reader
+                self._request(lambda: reader.tail(VIEWER_PAGE_SIZE), self.on_page_loaded)
+            self.follow_timer.start()
+        else:
+            self.follow_timer.stop()
+            self.text_view.setMaximumBlockCount(0)
+            if self.reader is not None:
+                # Back to a regular page ending where following stopped
+                reader, end = self.reader, max(self.follow_pos, self.page.end if self.page else 0)
+                self._request(lambda: reader.page(end - VIEWER_PAGE_SIZE, end), self.on_page_loaded)
+
+    def poll_follow(self):
+        """Check for new data unless a read is still in progress."""
+        if self.reader is None or self.read_worker is not None:
+            return
+        reader, pos = self.reader, self.follow_pos
+        self._request(lambda: self._read_new_data(reader, pos), self.on_follow_data)
+
+    @staticmethod
+    def _read_new_data(reader: RemoteFileReader, pos: int) -> Tuple[bool, FilePage]:
+        """Data written after pos, or (True, tail) to start over.
+
+        Starts over when the file shrank (truncated or rotated) or grew by
+        more than a page since the last check.
+        """
+        size = reader.refresh()
+        if size < pos or size - pos > VIEWER_PAGE_SIZE:
+            return True, reader.tail(VIEWER_PAGE_SIZE)
+        return False, FilePage(pos, size, size, reader.read(pos, size))
+
+    def on_follow_data(self, result: Tuple[bool, FilePage]):
+        """Append new data, or replace the view when following restarted."""
+        if self.sender() is not self.read_worker:
+            return
+        self.read_worker = None
+        if not self.follow_check.isChecked():
+            return
+
+        restart, page = result
+        scrollbar = self.text_view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        if restart:
+            self.text_view.setPlainText(page.text)
+            self._decoder.reset()
+            at_bottom = True
+        elif page.data:
+            cursor = self.text_view.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            # Incremental decoding keeps characters split across reads intact
+            cursor.insertText(self._decoder.decode(page.data))
+        self.follow_pos = page.end
+        self.page = page
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        self._update_status()
+
+    # ------------------------------------------------------------------ #
+    # Helpers
+    # ------------------------------------------------------------------ #
+
+    def _request(self, read: Callable[[], object], on_result: Callable[[object], None]):
+        """Run a read in a worker; only the latest request's result is used."""
+        worker = RemoteReadWorker(read, self)
+        worker.result_ready.connect(on_result)
+        worker.read_failed.connect(self.on_read_failed)
+        worker.finished.connect(worker.deleteLater)
+        self.read_worker = worker
+        worker.start()
+
+    def on_read_failed(self, error: str):
+        if self.sender() is not self.read_worker:
+            return
+        self.read_worker = None
+        self.status_label.setText(f"Error: {error}")
+        self._set_navigation_enabled(self.reader is not None)
+
+    def _set_navigation_enabled(self, enabled: bool):
+        for widget in (self.start_btn, self.prev_btn, self.next_btn, self.end_btn,
+                       self.offset_edit, self.follow_check):
+            widget.setEnabled(enabled)
+        if enabled and self.page is not None:
+            self.prev_btn.setEnabled(not self.page.at_start)
+            self.next_btn.setEnabled(not self.page.at_end)
+
+    def _update_status(self):
+        page = self.page
+        if page is None:
+            return
+        if self.follow_check.isChecked():
+            self.status_label.setText(f"Following - {format_size(page.size)}")
+        else:
+            self.status_label.setText(
+                f"Bytes {page.start:,}-{page.end:,} of {page.size:,} ({format_size(page.size)})"
+            )
+        self._set_navigation_enabled(True)
+
+    def done(self, result):
+        """Escape and the browser closing end the dialog here, not in closeEvent."""
+        self.shutdown()
+        super().done(result)
+
+    def closeEvent(self, event):
+        """Handle dialog close event."""
+        self.shutdown()
+        event.accept()
+
+    def shutdown(self):
+        """Stop reading and hand the channel back to the pool; safe to call twice."""
+        self.follow_timer.stop()
+        self.read_worker = None
+        for worker in self.findChildren(RemoteReadWorker):
+            worker.wait(5000)
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        if self.session is not None:
+            self.session.release()
+            self.session = None
@@ -4,6 +4,7 @@ SSH Tunnel Manager - SFTP File Browser Dialog
 """
 
 import os
+import posixpath
 import stat
 import threading
 from pathlib import Path
@@ -12,7 +13,7 @@ from typing import Optional, List, Dict, Any
 import paramiko
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTreeWidget, 
-    QTreeWidgetItem, QSplitter, QLabel, QLineEdit, QProgressBar,
+    QTreeWidgetItem, QTreeView, QAbstractItemView, QSplitter, QLabel, QLineEdit, QProgressBar,
     QTextEdit, QGroupBox, QMessageBox, QFileDialog, QMenu, 
     QComboBox, QCheckBox, QSpinBox, QApplication
 )
@@ -20,84 +21,204 @@ from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize
 from PySide6.QtGui import QAction, QIcon, QFont, QCursor
 
 from ...core.models import TunnelConfig
+from ...core.ssh_pool import PooledSession, get_pool
+from ...core.sftp_transfer import SFTPTransferEngine, format_rate, format_size
+from ...core.transfer_queue import TransferQueue, TransferJob
+from ...core.transfer_resume import ResumableTransfer
+from ...core.delta_sync import DeltaUploader
+from ...core.remote_listing import ListingCache, entry_sort_key, iter_listing_batches
+from ..widgets.remote_file_model import RemoteFileModel
+from .remote_file_viewer import RemoteFileViewer
+from ...core.constants import TRANSFER_PARALLEL_CHANNELS
 
 
 class FileTransferWorker(QThread):
-    """Worker thread for file transfer operations."""
+    """Worker thread for file transfer operations.
+    
+    With resume (the default), an existing partial destination file is
+    continued rather than rewritten and the result is checksum-verified.
+    With delta, an upload over an existing remote file only sends the
+    blocks that changed.
+    """
     
     progress_updated = Signal(int, str)  # progress, status
     transfer_finished = Signal(bool, str)  # success, message
     
     def __init__(self, operation: str, ssh_config: Dict[str, Any], 
-                 local_path: str, remote_path: str):
+                 local_path: str, remote_path: str,
+                 engine: Optional[SFTPTransferEngine] = None,
+                 resume: bool = True, verify: bool = True, delta: bool = False):
         super().__init__()
         self.operation = operation  # 'upload' or 'download'
         self.ssh_config = ssh_config
         self.local_path = local_path
         self.remote_path = remote_path
+        self.engine = engine or SFTPTransferEngine()
+        self.resumable = ResumableTransfer(self.engine, verify=verify) if resume else None
+        self.delta = DeltaUploader(self.engine) if delta else None
         self.cancelled = False
         
     def run(self):
-        """Execute the file transfer."""
+        """Execute the file transfer on a pooled connection."""
         try:
-            # Create SSH client
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Connect
-            ssh.connect(
+            # Borrow an authenticated session; back-to-back transfers to the
+            # same server reuse the connection and its SFTP channel
+            with get_pool().session(
                 hostname=self.ssh_config['hostname'],
                 port=self.ssh_config.get('port', 22),
                 username=self.ssh_config['username'],
                 password=self.ssh_config.get('password'),
                 key_filename=self.ssh_config.get('key_filename'),
-                timeout=30
-            )
-            
-            # Create SFTP client
-            sftp = ssh.open_sftp()
-            
-            if self.operation == 'upload':
-                self._upload_file(sftp, self.local_path, self.remote_path)
-            elif self.operation == 'download':
-                self._download_file(sftp, self.remote_path, self.local_path)
-            
-            sftp.close()
-            ssh.close()
+                profile=self.ssh_config.get('profile'),
+            ) as session:
+                sftp = session.sftp()
+                
+                if self.operation == 'upload':
+                    self._upload_file(sftp, self.local_path, self.remote_path, session.client)
+                elif self.operation == 'download':
+                    self._download_file(sftp, self.remote_path, self.local_path, session.client)
             
             self.transfer_finished.emit(True, f"{self.operation.title()} completed successfully")
             
         except Exception as e:
             self.transfer_finished.emit(False, f"{self.operation.title()} failed: {str(e)}")
     
-    def _upload_file(self, sftp, local_path: str, remote_path: str):
-        """Upload a file with progress tracking."""
-        file_size = os.path.getsize(local_path)
-        transferred = 0
-        
-        def progress_callback(transferred_bytes, total_bytes):
-            if self.cancelled:
-                raise Exception("Transfer cancelled by user")
-            progress = int((transferred_bytes / total_bytes) * 100)
-            self.progress_updated.emit(progress, f"Uploading... {transferred_bytes}/{total_bytes} bytes")
-        
-        sftp.put(local_path, remote_path, callback=progress_callback)
+    def _upload_file(self, sftp, local_path: str, remote_path: str,
+                     client: Optional[paramiko.SSHClient] = None):
+        """Upload a file with pipelined writes and progress tracking."""
+        progress = lambda done, total, rate: self._report_progress("Uploading", done, total, rate)
+        is_cancelled = lambda: self.cancelled
+        if self.delta is not None:
+            self.delta.upload(sftp, local_path, remote_path, client, progress, is_cancelled)
+        elif self.resumable is not None:
+            self.resumable.upload(sftp, local_path, remote_path, client, progress, is_cancelled)
+        else:
+            self.engine.upload(sftp, local_path, remote_path, progress, is_cancelled)
+    
+    def _download_file(self, sftp, remote_path: str, local_path: str,
+                       client: Optional[paramiko.SSHClient] = None):
+        """Download a file with pipelined reads and progress tracking."""
+        progress = lambda done, total, rate: self._report_progress("Downloading", done, total, rate)
+        is_cancelled = lambda: self.cancelled
+        if self.resumable is not None:
+            self.resumable.download(sftp, remote_path, local_path, client, progress, is_cancelled)
+        else:
+            self.engine.download(sftp, remote_path, local_path, progress, is_cancelled)
+    
+    def _report_progress(self, action: str, transferred_bytes: int, total_bytes: int, rate: float):
+        """Emit progress with the current transfer rate."""
+        progress = int((transferred_bytes / total_bytes) * 100) if total_bytes else 100
+        self.progress_updated.emit(
+            progress, f"{action}... {transferred_bytes}/{total_bytes} bytes ({format_rate(rate)})"
+        )
+    
+    def cancel(self):
+        """Cancel the transfer."""
+        self.cancelled = True
+
+
+class TransferQueueWorker(QThread):
+    """Worker thread running a queue of file and directory transfers.
+    
+    Files are spread over several parallel SFTP channels. More jobs can be
+    added with add_job() while the worker is running.
+    """
+    
+    progress_updated = Signal(int, str)  # progress, status
+    jobs_updated = Signal(list)  # TransferJobs whose status or progress changed
+    transfer_finished = Signal(bool, str)  # success, message
     
-    def _download_file(self, sftp, remote_path: str, local_path: str):
-        """Download a file with progress tracking."""
-        remote_stat = sftp.stat(remote_path)
-        file_size = remote_stat.st_size
+    def __init__(self, ssh_config: Dict[str, Any], parallel: int = TRANSFER_PARALLEL_CHANNELS,
+                 engine: Optional[SFTPTransferEngine] = None, delta: bool = False):
+        super().__init__()
+        self.queue = TransferQueue(ssh_config, parallel, engine, delta=delta)
+        self._files_done = 0
+    
+    def add_job(self, job: TransferJob) -> bool:
+        """Queue a transfer; returns False if this worker has already finished."""
+        return self.queue.add_job(job)
+    
+    def run(self):
+        """Process the queue until every job has finished."""
+        try:
+            jobs = self.queue.run(self._on_update)
+        except Exception as e:
+            self.transfer_finished.emit(False, f"Transfer failed: {str(e)}")
+            return
         
-        def progress_callback(transferred_bytes, total_bytes):
+        failed = [job for job in jobs if job.status == TransferJob.STATUS_FAILED]
+        cancelled = sum(1 for job in jobs if job.status == TransferJob.STATUS_CANCELLED)
+        done = len(jobs) - len(failed) - cancelled
+        
+        message = f"Transferred {done} of {len(jobs)} file(s)"
+        if failed:
+            message += f", {len(failed)} failed (first error: {failed[0].name}: {failed[0].error})"
+        if cancelled:
+            message += f", {cancelled} cancelled"
+        self.transfer_finished.emit(not failed and not cancelled, message)
+    
+    def _on_update(self, changed: list, bytes_done: int, total_bytes: int, rate: float):
+        """Forward batched queue progress to the GUI."""
+        if changed:
+            self._files_done = sum(
+                1 for job in self.queue.jobs if job.finished and not job.is_dir
+            )
+            self.jobs_updated.emit(changed)
+        file_count = sum(1 for job in self.queue.jobs if not job.is_dir)
+        progress = int(bytes_done / total_bytes * 100) if total_bytes else 0
+        self.progress_updated.emit(
+            progress,
+            f"{self._files_done}/{file_count} files, {format_size(bytes_done)} of "
+            f"{format_size(total_bytes)} ({format_rate(rate)})"
+        )
+    
+    def cancel(self):
+        """Cancel queued transfers and abort the ones in flight."""
+        self.queue.cancel()
+
+
+class RemoteListingWorker(QThread):
+    """Worker thread streaming a remote directory listing in batches.
+    
+    Runs on its own SFTP channel of the browser's pooled connection, so the
+    dialog stays responsive while large directories load.
+    """
+    
+    batch_ready = Signal(str, list)  # path, SFTPAttributes
+    listing_finished = Signal(str, list)  # path, every entry in display order
+    listing_failed = Signal(str, str)  # path, error
+    
+    def __init__(self, session: PooledSession, path: str, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.path = path
+        self.cancelled = False
+    
+    def run(self):
+        """List the directory and emit its entries batch by batch."""
+        session = self.session.pool.acquire_shared(self.session)
+        try:
+            sftp = session.sftp()
+            entries = []
+            for batch in iter_listing_batches(sftp, self.path, is_cancelled=lambda: self.cancelled):
+                entries.extend(batch)
+                self.batch_ready.emit(self.path, batch)
             if self.cancelled:
-                raise Exception("Transfer cancelled by user")
-            progress = int((transferred_bytes / total_bytes) * 100)
-            self.progress_updated.emit(progress, f"Downloading... {transferred_bytes}/{total_bytes} bytes")
-        
-        sftp.get(remote_path, local_path, callback=progress_callback)
+                # Abandoned mid-listing: don't hand a channel with an open
+                # directory handle back to the pool
+                sftp.close()
+            else:
+                # Sort here rather than on the GUI thread
+                entries.sort(key=entry_sort_key)
+                self.listing_finished.emit(self.path, entries)
+        except Exception as e:
+            if not self.cancelled:
+                self.listing_failed.emit(self.path, str(e))
+        finally:
+            session.release()
     
     def cancel(self):
-        """Cancel the transfer."""
+        """Stop listing; no further signals are emitted."""
         self.cancelled = True
 
 
@@ -108,10 +229,14 @@ class SFTPFileBrowser(QDialog):
         super().__init__(parent)
         self.tunnel_config = tunnel_config
         self.password = password
+        self.ssh_session = None
         self.ssh_client = None
         self.sftp_client = None
         self.current_remote_path = "/"
         self.transfer_worker = None
+        self.listing_worker = None
+        self.listing_cache = ListingCache()
+        self._queue_items: Dict[int, QTreeWidgetItem] = {}
         
         self.setWindowTitle(f"SFTP File Browser - {tunnel_config.ssh_host}")
         self.setGeometry(200, 200, 900, 600)
@@ -172,7 +297,7 @@ class SFTPFileBrowser(QDialog):
         nav_up_btn.clicked.connect(self.navigate_up)
         
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.refresh_remote_files)
+        refresh_btn.clicked.connect(lambda: self.refresh_remote_files())
         
         nav_layout.addWidget(QLabel("Path:"))
         nav_layout.addWidget(self.path_edit)
@@ -181,12 +306,16 @@ class SFTPFileBrowser(QDialog):
         
         layout.addLayout(nav_layout)
         
-        # File tree
-        self.remote_tree = QTreeWidget()
-        self.remote_tree.setHeaderLabels(["Name", "Size", "Modified", "Permissions"])
+        # File list (rows are added lazily as the view scrolls)
+        self.remote_model = RemoteFileModel(self)
+        self.remote_tree = QTreeView()
+        self.remote_tree.setModel(self.remote_model)
+        self.remote_tree.setRootIsDecorated(False)
+        self.remote_tree.setUniformRowHeights(True)
+        self.remote_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.remote_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.remote_tree.customContextMenuRequested.connect(self.show_remote_context_menu)
-        self.remote_tree.itemDoubleClicked.connect(self.on_remote_item_double_clicked)
+        self.remote_tree.doubleClicked.connect(self.on_remote_item_double_clicked)
         
         # Set column widths
         header = self.remote_tree.header()
@@ -216,6 +345,10 @@ class SFTPFileBrowser(QDialog):
         upload_folder_btn.clicked.connect(self.select_folder_to_upload)
         upload_layout.addWidget(upload_folder_btn)
         
+        # Only send the blocks that differ from the file already on the server
+        self.delta_check = QCheckBox("Delta sync (send changed blocks only)")
+        upload_layout.addWidget(self.delta_check)
+        
         layout.addWidget(upload_group)
         
         # Progress section
@@ -229,12 +362,40 @@ class SFTPFileBrowser(QDialog):
         self.cancel_btn.setEnabled(False)
         self.cancel_btn.clicked.connect(self.cancel_transfer)
         
+        # Parallel SFTP channels used by the transfer queue
+        parallel_layout = QHBoxLayout()
+        parallel_layout.addWidget(QLabel("Parallel transfers:"))
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, 10)  # OpenSSH allows 10 sessions per connection by default
+        self.parallel_spin.setValue(TRANSFER_PARALLEL_CHANNELS)
+        parallel_layout.addWidget(self.parallel_spin)
+        parallel_layout.addStretch()
+        
         progress_layout.addWidget(self.progress_label)
         progress_layout.addWidget(self.progress_bar)
+        progress_layout.addLayout(parallel_layout)
         progress_layout.addWidget(self.cancel_btn)
         
         layout.addWidget(progress_group)
         
+        # Per-file queue status
+        queue_group = QGroupBox("Transfer Queue")
+        queue_layout = QVBoxLayout(queue_group)
+        
+        self.queue_tree = QTreeWidget()
+        self.queue_tree.setHeaderLabels(["File", "Size", "Status"])
+        self.queue_tree.setRootIsDecorated(False)
+        self.queue_tree.setUniformRowHeights(True)
+        self.queue_tree.header().resizeSection(0, 160)
+        
+        clear_queue_btn = QPushButton("Clear Finished")
+        clear_queue_btn.clicked.connect(self.clear_finished_transfers)
+        
+        queue_layout.addWidget(self.queue_tree)
+        queue_layout.addWidget(clear_queue_btn)
+        
+        layout.addWidget(queue_group)
+        
         # Log section
         log_group = QGroupBox("Transfer Log")
         log_layout = QVBoxLayout(log_group)
@@ -258,29 +419,24 @@ class SFTPFileBrowser(QDialog):
         try:
             self.log("Connecting to SSH server...")
             
-            # Create SSH client
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            # Borrow a pooled connection (reused if a recent transfer or
+            # browser session already authenticated to this server)
+            key_filename = None
+            if not self.password and self.tunnel_config.ssh_key_path and os.path.exists(self.tunnel_config.ssh_key_path):
+                key_filename = self.tunnel_config.ssh_key_path
             
-            # Prepare connection parameters
-            connect_params = {
-                'hostname': self.tunnel_config.ssh_host,
-                'port': self.tunnel_config.ssh_port,
-                'username': self.tunnel_config.ssh_user,
-                'timeout': 30
-            }
-            
-            # Add authentication
-            if self.password:
-                connect_params['password'] = self.password
-            elif self.tunnel_config.ssh_key_path and os.path.exists(self.tunnel_config.ssh_key_path):
-                connect_params['key_filename'] = self.tunnel_config.ssh_key_path
-            
-            # Connect
-            self.ssh_client.connect(**connect_params)
+            self.ssh_session = get_pool().acquire(
+                hostname=self.tunnel_config.ssh_host,
+                port=self.tunnel_config.ssh_port,
+                username=self.tunnel_config.ssh_user,
+                password=self.password,
+                key_filename=key_filename,
+                profile=self.tunnel_config.performance_profile,
+            )
+            self.ssh_client = self.ssh_session.client
             
-            # Create SFTP client
-            self.sftp_client = self.ssh_client.open_sftp()
+            # SFTP channel on the pooled connection
+            self.sftp_client = self.ssh_session.sftp()
             
             self.log("Connected successfully!")
             self.status_label.setText("Connected")
@@ -303,14 +459,14 @@ class SFTPFileBrowser(QDialog):
         try:
             if self.transfer_worker and self.transfer_worker.isRunning():
                 self.cancel_transfer()
+            self._cancel_listing(wait=True)
                 
-            if self.sftp_client:
-                self.sftp_client.close()
-                self.sftp_client = None
-                
-            if self.ssh_client:
-                self.ssh_client.close()
-                self.ssh_client = None
+            # Hand the connection back to the pool instead of closing it
+            if self.ssh_session:
+                self.ssh_session.release()
+                self.ssh_session = None
+            self.sftp_client = None
+            self.ssh_client = None
                 
             self.log("Disconnected from server")
             self.status_label.setText("Disconnected")
@@ -318,82 +474,83 @@ class SFTPFileBrowser(QDialog):
         except Exception as e:
             self.log(f"Error during disconnect: {str(e)}")
     
-    def refresh_remote_files(self):
-        """Refresh the remote file listing."""
-        if not self.sftp_client:
-            return
-            
-        try:
-            self.log(f"Loading directory: {self.current_remote_path}")
-            self.remote_tree.clear()
-            
-            # Add parent directory entry if not at root
-            if self.current_remote_path != "/":
-                parent_item = QTreeWidgetItem([".. (Parent Directory)", "", "", ""])
-                parent_item.setData(0, Qt.UserRole, "..")
-                self.remote_tree.addTopLevelItem(parent_item)
-            
-            # List directory contents
-            items = self.sftp_client.listdir_attr(self.current_remote_path)
-            
-            # Sort: directories first, then files
-            items.sort(key=lambda x: (not stat.S_ISDIR(x.st_mode), x.filename.lower()))
-            
-            for item in items:
-                self._add_remote_item(item)
-                
-            self.path_edit.setText(self.current_remote_path)
-            self.log(f"Loaded {len(items)} items")
-            
-        except Exception as e:
-            self.log(f"Error loading directory: {str(e)}")
-            QMessageBox.warning(self, "Error", f"Failed to load directory:\n{str(e)}")
-    
-    def _add_remote_item(self, item):
-        """Add an item to the remote file tree."""
-        # Format size
-        if stat.S_ISDIR(item.st_mode):
-            size_str = "<DIR>"
-            icon = "📁"
-        else:
-            size_str = self._format_size(item.st_size)
-            icon = "📄"
-        
-        # Format modification time
-        import datetime
-        mod_time = datetime.datetime.fromtimestamp(item.st_mtime).strftime("%Y-%m-%d %H:%M")
+    def refresh_remote_files(self, use_cache: bool = False):
+        """Load the current remote directory.
         
-        # Format permissions
-        perms = stat.filemode(item.st_mode)
+        The listing streams in from a worker thread. With use_cache, a
+        listing of the same path loaded within LISTING_CACHE_TTL is shown
+        immediately instead.
+        """
+        if not self.sftp_client or not self.ssh_session:
+            return
         
-        # Create tree item
-        tree_item = QTreeWidgetItem([
-            f"{icon} {item.filename}",
-            size_str,
-            mod_time,
-            perms
-        ])
+        path = self.current_remote_path
+        self.path_edit.setText(path)
+        show_parent = path != "/"
         
-        # Store item data
-        tree_item.setData(0, Qt.UserRole, item.filename)
-        tree_item.setData(1, Qt.UserRole, item)
+        if use_cache:
+            entries = self.listing_cache.get(path)
+            if entries is not None:
+                self._cancel_listing()
+                self.remote_model.set_entries(list(entries), show_parent)
+                self.status_label.setText(f"{len(entries)} items (cached)")
+                return
         
-        self.remote_tree.addTopLevelItem(tree_item)
-    
-    def _format_size(self, size: int) -> str:
-        """Format file size in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} PB"
+        self.log(f"Loading directory: {path}")
+        self._cancel_listing()
+        self.remote_model.clear(show_parent)
+        self.status_label.setText("Loading...")
+        
+        # Parented to the dialog so an abandoned worker outlives our reference
+        self.listing_worker = RemoteListingWorker(self.ssh_session, path, self)
+        self.listing_worker.batch_ready.connect(self.on_listing_batch)
+        self.listing_worker.listing_finished.connect(self.on_listing_finished)
+        self.listing_worker.listing_failed.connect(self.on_listing_failed)
+        self.listing_worker.finished.connect(self.listing_worker.deleteLater)
+        self.listing_worker.start()
+    
+    def _cancel_listing(self, wait: bool = False):
+        """Abandon the listing in progress; with wait, also let abandoned ones stop."""
+        if self.listing_worker is not None:
+            self.listing_worker.cancel()
+            self.listing_worker = None
+        if wait:
+            for worker in self.findChildren(RemoteListingWorker):
+                worker.cancel()
+                worker.wait(2000)
+    
+    def on_listing_batch(self, path: str, entries: list):
+        """Append a batch of a streaming listing."""
+        if self.sender() is not self.listing_worker:
+            return  # an abandoned listing
+        self.remote_model.add_entries(entries)
+        self.status_label.setText(f"Loading... {len(self.remote_model.entries)} items")
+    
+    def on_listing_finished(self, path: str, entries: list):
+        """Show the completed, sorted listing and cache it."""
+        if self.sender() is not self.listing_worker:
+            return
+        self.listing_worker = None
+        self.remote_model.replace_entries(entries)
+        self.listing_cache.put(path, entries)
+        self.status_label.setText(f"{len(entries)} items")
+        self.log(f"Loaded {len(entries)} items")
+    
+    def on_listing_failed(self, path: str, error: str):
+        """Report a listing error."""
+        if self.sender() is not self.listing_worker:
+            return
+        self.listing_worker = None
+        self.status_label.setText("Error")
+        self.log(f"Error loading directory: {error}")
+        QMessageBox.warning(self, "Error", f"Failed to load directory:\n{error}")
     
     def navigate_to_path(self):
         """Navigate to the path in the path edit."""
         new_path = self.path_edit.text().strip()
         if new_path:
             self.current_remote_path = new_path
-            self.refresh_remote_files()
+            self.refresh_remote_files(use_cache=True)
     
     def navigate_up(self):
         """Navigate to parent directory."""
@@ -402,42 +559,58 @@ class SFTPFileBrowser(QDialog):
             if parent == ".":
                 parent = "/"
             self.current_remote_path = parent
-            self.refresh_remote_files()
+            self.refresh_remote_files(use_cache=True)
     
-    def on_remote_item_double_clicked(self, item, column):
+    def on_remote_item_double_clicked(self, index):
         """Handle double-click on remote item."""
-        filename = item.data(0, Qt.UserRole)
+        filename = self.remote_model.name(index.row())
         
-        if filename == "..":
+        if filename == RemoteFileModel.PARENT_NAME:
             self.navigate_up()
             return
         
-        item_data = item.data(1, Qt.UserRole)
-        if item_data and stat.S_ISDIR(item_data.st_mode):
+        if self.remote_model.is_dir(index.row()):
             # Navigate into directory
             new_path = os.path.join(self.current_remote_path, filename).replace("\\", "/")
             if not new_path.startswith("/"):
                 new_path = "/" + new_path
             self.current_remote_path = new_path
-            self.refresh_remote_files()
+            self.refresh_remote_files(use_cache=True)
+    
+    def _selected_entries(self) -> list:
+        """SFTPAttributes of the selected rows (the parent row excluded)."""
+        entries = []
+        for index in self.remote_tree.selectionModel().selectedRows():
+            entry = self.remote_model.entry(index.row())
+            if entry is not None:
+                entries.append(entry)
+        return entries
     
     def show_remote_context_menu(self, position):
         """Show context menu for remote files."""
-        item = self.remote_tree.itemAt(position)
-        if not item:
+        index = self.remote_tree.indexAt(position)
+        if not index.isValid():
             return
         
-        filename = item.data(0, Qt.UserRole)
-        if filename == "..":
+        item_data = self.remote_model.entry(index.row())
+        if item_data is None:
             return
+        filename = item_data.filename
         
         menu = QMenu(self)
         
-        # Download action
-        download_action = QAction("📥 Download", self)
-        download_action.triggered.connect(lambda: self.download_file(filename))
+        # Download action (directories are downloaded recursively)
+        is_dir = self.remote_model.is_dir(index.row())
+        download_action = QAction("📥 Download Folder" if is_dir else "📥 Download", self)
+        download_action.triggered.connect(lambda: self.download_file(filename, is_dir))
         menu.addAction(download_action)
         
+        selected = self._selected_entries()
+        if len(selected) > 1:
+            download_selected_action = QAction(f"📥 Download {len(selected)} Selected Items", self)
+            download_selected_action.triggered.connect(lambda: self.download_items(selected))
+            menu.addAction(download_selected_action)
+        
         # Delete action
         menu.addSeparator()
         delete_action = QAction("🗑️ Delete", self)
@@ -445,7 +618,6 @@ class SFTPFileBrowser(QDialog):
         menu.addAction(delete_action)
         
         # View action for text files
-        item_data = item.data(1, Qt.UserRole)
         if item_data and not stat.S_ISDIR(item_data.st_mode):
             if any(filename.lower().endswith(ext) for ext in ['.txt', '.log', '.conf', '.cfg', '.ini', '.py', '.js', '.html', '.css']):
                 view_action = QAction("👀 View", self)
@@ -490,18 +662,26 @@ class SFTPFileBrowser(QDialog):
     
     def upload_folder(self, local_folder: str):
         """Upload a folder recursively."""
-        # This is a simplified version - in a full implementation,
-        # you'd want to handle this recursively
-        QMessageBox.information(
-            self, 
-            "Upload Folder", 
-            "Folder upload is not yet implemented.\nPlease select individual files for now."
-        )
+        if not self.sftp_client:
+            return
+        
+        folder_name = os.path.basename(os.path.normpath(local_folder))
+        remote_path = posixpath.join(self.current_remote_path, folder_name)
+        
+        self.log(f"Starting folder upload: {folder_name}")
+        self._start_transfer('upload', local_folder, remote_path, is_dir=True)
     
-    def download_file(self, filename: str):
-        """Download a file from the remote server."""
+    def download_file(self, filename: str, is_dir: bool = False):
+        """Download a file (or a folder, recursively) from the remote server."""
         remote_path = os.path.join(self.current_remote_path, filename).replace("\\", "/")
         
+        if is_dir:
+            local_dir = QFileDialog.getExistingDirectory(self, "Download Folder To")
+            if local_dir:
+                self.log(f"Starting folder download: {filename}")
+                self._start_transfer('download', os.path.join(local_dir, filename), remote_path, is_dir=True)
+            return
+        
         # Choose local save location
         local_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -514,6 +694,21 @@ class SFTPFileBrowser(QDialog):
             self.log(f"Starting download: {filename}")
             self._start_transfer('download', local_path, remote_path)
     
+    def download_items(self, entries: List[paramiko.SFTPAttributes]):
+        """Download several selected files and folders into one local folder."""
+        local_dir = QFileDialog.getExistingDirectory(self, "Download Selected Items To")
+        if not local_dir:
+            return
+        
+        for entry in entries:
+            is_dir = stat.S_ISDIR(entry.st_mode or 0)
+            remote_path = posixpath.join(self.current_remote_path, entry.filename)
+            self._start_transfer(
+                'download', os.path.join(local_dir, entry.filename), remote_path, is_dir=is_dir,
+                size=None if is_dir else entry.st_size
+            )
+        self.log(f"Queued {len(entries)} item(s) for download")
+    
     def delete_remote_file(self, filename: str):
         """Delete a file on the remote server."""
         reply = QMessageBox.question(
@@ -536,6 +731,7 @@ class SFTPFileBrowser(QDialog):
                     self.sftp_client.remove(remote_path)
                 
                 self.log(f"Deleted: {filename}")
+                self.listing_cache.invalidate(self.current_remote_path)
                 self.refresh_remote_files()
                 
             except Exception as e:
@@ -543,66 +739,91 @@ class SFTPFileBrowser(QDialog):
                 QMessageBox.warning(self, "Delete Error", f"Failed to delete file:\n{str(e)}")
     
     def view_remote_file(self, filename: str):
-        """View the contents of a remote text file."""
-        try:
-            remote_path = os.path.join(self.current_remote_path, filename).replace("\\", "/")
-            
-            # Read file content (limit to 1MB for safety)
-            with self.sftp_client.file(remote_path, 'r') as f:
-                content = f.read(1024 * 1024)  # 1MB limit
-            
-            # Show in a simple dialog
-            from PySide6.QtWidgets import QTextBrowser
-            
-            dialog = QDialog(self)
-            dialog.setWindowTitle(f"View File: {filename}")
-            dialog.setGeometry(300, 300, 600, 400)
-            
-            layout = QVBoxLayout(dialog)
-            
-            text_browser = QTextBrowser()
-            text_browser.setPlainText(content)
-            text_browser.setFont(QFont("Consolas", 10))
-            
-            layout.addWidget(text_browser)
-            
-            close_btn = QPushButton("Close")
-            close_btn.clicked.connect(dialog.close)
-            layout.addWidget(close_btn)
-            
-            dialog.exec()
-            
-        except Exception as e:
-            self.log(f"Failed to view {filename}: {str(e)}")
-            QMessageBox.warning(self, "View Error", f"Failed to view file:\n{str(e)}")
-    
-    def _start_transfer(self, operation: str, local_path: str, remote_path: str):
-        """Start a file transfer operation."""
-        if self.transfer_worker and self.transfer_worker.isRunning():
-            QMessageBox.warning(self, "Transfer in Progress", "Another transfer is already in progress.")
+        """Open a remote file in the paged viewer."""
+        if not self.ssh_session:
             return
-        
-        # Prepare SSH config for worker
+        remote_path = posixpath.join(self.current_remote_path, filename)
+        # Non-modal, so a followed log keeps updating while browsing
+        viewer = RemoteFileViewer(self.ssh_session, remote_path, self)
+        viewer.setAttribute(Qt.WA_DeleteOnClose)
+        viewer.show()
+    
+    def _ssh_config(self) -> Dict[str, Any]:
+        """SSH connection parameters for transfer workers."""
         ssh_config = {
             'hostname': self.tunnel_config.ssh_host,
             'port': self.tunnel_config.ssh_port,
             'username': self.tunnel_config.ssh_user,
+            'profile': self.tunnel_config.performance_profile,
         }
         
         if self.password:
             ssh_config['password'] = self.password
         elif self.tunnel_config.ssh_key_path:
             ssh_config['key_filename'] = self.tunnel_config.ssh_key_path
+        return ssh_config
+    
+    def _start_transfer(self, operation: str, local_path: str, remote_path: str,
+                        is_dir: bool = False, size: Optional[int] = None):
+        """Queue a file or directory transfer, starting the queue if needed."""
+        if operation == 'upload' and not is_dir and size is None:
+            size = os.path.getsize(local_path)
+        job = TransferJob(operation, local_path, remote_path, is_dir=is_dir, size=size)
+        
+        # Join the running queue if there is one
+        if self.transfer_worker and self.transfer_worker.isRunning() and self.transfer_worker.add_job(job):
+            return
         
         # Create and start worker
-        self.transfer_worker = FileTransferWorker(operation, ssh_config, local_path, remote_path)
+        self.transfer_worker = TransferQueueWorker(
+            self._ssh_config(), self.parallel_spin.value(), delta=self.delta_check.isChecked()
+        )
         self.transfer_worker.progress_updated.connect(self.on_transfer_progress)
+        self.transfer_worker.jobs_updated.connect(self.on_jobs_updated)
         self.transfer_worker.transfer_finished.connect(self.on_transfer_finished)
+        self.transfer_worker.add_job(job)
         
         self.progress_bar.setValue(0)
         self.cancel_btn.setEnabled(True)
         self.transfer_worker.start()
     
+    def on_jobs_updated(self, jobs: list):
+        """Update per-file rows in the transfer queue."""
+        self.queue_tree.setUpdatesEnabled(False)
+        try:
+            for job in jobs:
+                # Directories are only shown if they could not be expanded
+                if job.is_dir and job.status != TransferJob.STATUS_FAILED:
+                    continue
+                tree_item = self._queue_items.get(job.job_id)
+                if tree_item is None:
+                    arrow = "⬆" if job.operation == 'upload' else "⬇"
+                    tree_item = QTreeWidgetItem([f"{arrow} {job.name}", "", ""])
+                    tree_item.setToolTip(0, job.remote_path)
+                    self.queue_tree.addTopLevelItem(tree_item)
+                    self._queue_items[job.job_id] = tree_item
+                
+                if job.size is not None:
+                    tree_item.setText(1, format_size(job.size))
+                if job.status == TransferJob.STATUS_RUNNING and job.size:
+                    status_text = f"{int(job.bytes_done / job.size * 100)}%"
+                elif job.status == TransferJob.STATUS_FAILED:
+                    status_text = f"failed: {job.error}"
+                else:
+                    status_text = job.status
+                tree_item.setText(2, status_text)
+        finally:
+            self.queue_tree.setUpdatesEnabled(True)
+    
+    def clear_finished_transfers(self):
+        """Remove finished rows from the transfer queue."""
+        for job_id, tree_item in list(self._queue_items.items()):
+            if tree_item.text(2) in (TransferJob.STATUS_DONE, TransferJob.STATUS_CANCELLED) \
+                    or tree_item.text(2).startswith(TransferJob.STATUS_FAILED):
+                index = self.queue_tree.indexOfTopLevelItem(tree_item)
+                self.queue_tree.takeTopLevelItem(index)
+                del self._queue_items[job_id]
+    
     def on_transfer_progress(self, progress: int, status: str):
         """Handle transfer progress updates."""
         self.progress_bar.setValue(progress)
@@ -612,11 +833,15 @@ class SFTPFileBrowser(QDialog):
         """Handle transfer completion."""
         self.progress_bar.setValue(100 if success else 0)
         self.progress_label.setText("Transfer completed" if success else "Transfer failed")
-        self.cancel_btn.setEnabled(False)
+        # A newer queue may already be running if jobs were added as this one finished
+        if self.sender() is self.transfer_worker:
+            self.cancel_btn.setEnabled(False)
         
         self.log(message)
         
-        if success:
+        # Transfers may have changed any directory they touched
+        self.listing_cache.invalidate()
+        if self.sftp_client:
             # Refresh the remote file list to show changes
             self.refresh_remote_files()
         
@@ -661,8 +886,24 @@ class SFTPFileBrowser(QDialog):
             else:
                 self.cancel_transfer()
         
+        self._close_viewers()
         self.disconnect()
         event.accept()
+
+    def done(self, result):
+        """Escape ends the dialog without closeEvent; viewers must still let go."""
+        self._close_viewers()
+        super().done(result)
+
+    def _close_viewers(self):
+        """Close open file viewers so they release their pooled channel and workers.
+
+        Viewers are children of the browser and would otherwise be destroyed
+        with it, without their own cleanup.
+        """
+        for viewer in self.findChildren(RemoteFileViewer):
+            viewer.shutdown()
+            viewer.close()
     
     @staticmethod
     def check_ssh_port(host, port=22, timeout=5):
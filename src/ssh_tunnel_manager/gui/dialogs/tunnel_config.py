@@ -6,13 +6,15 @@ SSH Tunnel Manager - Configuration Dialog
 from typing import Optional
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QFormLayout, QGroupBox, QLineEdit, 
-    QSpinBox, QComboBox, QCheckBox, QDialogButtonBox, QTextEdit, QLabel
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox, QLineEdit, 
+    QSpinBox, QComboBox, QCheckBox, QDialogButtonBox, QTextEdit, QLabel, QPushButton
 )
 from PySide6.QtCore import Qt
 
 from ...core.models import TunnelConfig
+from ...core.ssh_profiles import PROFILES, PROFILE_DEFAULT
 from ...core.constants import DEFAULT_SSH_PORT, DEFAULT_LOCAL_RTSP_PORT
+from .profile_benchmark import ProfileBenchmarkDialog
 
 
 class TunnelConfigDialog(QDialog):
@@ -22,7 +24,7 @@ class TunnelConfigDialog(QDialog):
         super().__init__(parent)
         self.config = config
         self.setWindowTitle("Tunnel Configuration")
-        self.setFixedSize(600, 550)  # Increased size for RTSP section
+        self.setFixedSize(600, 620)  # Increased size for RTSP, backend and profile sections
         self.setup_ui()
         
         if config:
@@ -81,6 +83,29 @@ class TunnelConfigDialog(QDialog):
         tunnel_layout.addRow("Remote Host:", self.remote_host_edit)
         tunnel_layout.addRow("Remote Port:", self.remote_port_spin)
         
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItem("Terminal window (ssh client)", "terminal")
+        self.backend_combo.addItem("Embedded (in-process, no window)", "embedded")
+        self.backend_combo.setToolTip(
+            "Embedded tunnels run inside the manager and authenticate with the\n"
+            "tunnel's SSH key, a default key in ~/.ssh or an SSH agent.\n"
+            "Hosts that only accept passwords need the terminal backend."
+        )
+        tunnel_layout.addRow("Backend:", self.backend_combo)
+        
+        # Compression / cipher / window settings for tunnel and SFTP sessions
+        self.profile_combo = QComboBox()
+        for profile in PROFILES.values():
+            self.profile_combo.addItem(profile.label, profile.name)
+            self.profile_combo.setItemData(self.profile_combo.count() - 1, profile.description, Qt.ToolTipRole)
+        benchmark_btn = QPushButton("Benchmark...")
+        benchmark_btn.setToolTip("Compare the profiles on a simulated link")
+        benchmark_btn.clicked.connect(self.benchmark_profiles)
+        profile_layout = QHBoxLayout()
+        profile_layout.addWidget(self.profile_combo, 1)
+        profile_layout.addWidget(benchmark_btn)
+        tunnel_layout.addRow("Performance:", profile_layout)
+        
         # RTSP Configuration
         rtsp_group = QGroupBox("RTSP Configuration (Optional)")
         rtsp_layout = QFormLayout(rtsp_group)
@@ -148,6 +173,10 @@ class TunnelConfigDialog(QDialog):
         self.remote_port_spin.setValue(config.remote_port or 80)
         self.auto_start_check.setChecked(config.auto_start)
         
+        backend_index = self.backend_combo.findData(config.backend)
+        self.backend_combo.setCurrentIndex(max(backend_index, 0))
+        self._select_profile(config.performance_profile)
+        
         # Load RTSP URL
         if hasattr(config, 'rtsp_url') and config.rtsp_url:
             self.rtsp_url_edit.setText(config.rtsp_url)
@@ -169,5 +198,17 @@ class TunnelConfigDialog(QDialog):
             remote_host=self.remote_host_edit.text().strip() if self.tunnel_type_combo.currentText() != 'dynamic' else "",
             remote_port=self.remote_port_spin.value() if self.tunnel_type_combo.currentText() != 'dynamic' else 0,
             auto_start=self.auto_start_check.isChecked(),
-            rtsp_url=self.rtsp_url_edit.text().strip()
+            rtsp_url=self.rtsp_url_edit.text().strip(),
+            backend=self.backend_combo.currentData(),
+            performance_profile=self.profile_combo.currentData()
         )
+    
+    def benchmark_profiles(self):
+        """Benchmark the performance profiles and optionally pick the result."""
+        dialog = ProfileBenchmarkDialog(self.profile_combo.currentData(), self)
+        if dialog.exec() == QDialog.Accepted:
+            self._select_profile(dialog.selected_profile)
+    
+    def _select_profile(self, name: str):
+        index = self.profile_combo.findData(name or PROFILE_DEFAULT)
+        self.profile_combo.setCurrentIndex(max(index, 0))
@@ -13,18 +13,22 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QSplitter,
     QSystemTrayIcon, QMenu, QApplication, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QFileSystemWatcher
 from PySide6.QtGui import QAction, QIcon, QPixmap, QPainter, QBrush
 
 from ..core.models import TunnelConfig
 from ..core.config_manager import ConfigurationManager
 from ..core.tunnel_process import TunnelProcess
 from ..core.monitor import TunnelMonitorThread
+from ..core.tunnel_starter import TunnelStarter
+from ..core.ssh_pool import get_pool
+from ..core.ssh_keys import get_key_discovery
 from ..core.constants import APP_NAME
 
 # Import professional components
 from .components.professional_toolbar import ProfessionalToolbar
 from .widgets.professional_cards import ProfessionalTunnelCardsWidget
+from .widgets.tunnel_list_model import TunnelListView
 from .widgets.professional_dashboard import ProfessionalDashboard
 from .widgets.professional_log import ProfessionalLogWidget, log_level_from_message
 
@@ -33,6 +37,7 @@ from .components.file_operations import FileOperationsManager
 from .components.rtsp_handler import RTSPHandler
 from .components.rdp_handler import RDPHandler
 from .components.network_scanner import NetworkScannerManager
+from .components.tunnel_tester import BulkTestDialog
 from .components.powershell_generator import PowerShellGeneratorManager
 from .components.ssh_key_generator import SSHKeyManager
 from .components.ssh_key_deployment import SSHKeyDeploymentManager
@@ -59,11 +64,15 @@ class SSHTunnelManager(QMainWindow):
         # Core managers
         self.config_manager = ConfigurationManager()
         self.active_tunnels: Dict[str, TunnelProcess] = {}
+        self.tunnel_starter = TunnelStarter(self)
+        self._setup_key_watcher()
         
         # Professional UI Components
         self.toolbar = ProfessionalToolbar(self)
         self.dashboard = ProfessionalDashboard(self)
+        self.dashboard.set_tunnels(self.active_tunnels)
         self.tunnel_cards = ProfessionalTunnelCardsWidget(self)
+        self.tunnel_list = TunnelListView(self)
         self.log_widget = ProfessionalLogWidget(self)
         
         # Existing service handlers
@@ -136,6 +145,8 @@ class SSHTunnelManager(QMainWindow):
         top_layout.addWidget(self.dashboard)
         self.dashboard.setVisible(False)  # Hidden by default
         top_layout.addWidget(self.tunnel_cards)
+        top_layout.addWidget(self.tunnel_list)
+        self.tunnel_list.setVisible(False)  # Compact list view for large inventories
         
         content_splitter.addWidget(top_section)
         content_splitter.addWidget(self.log_widget)
@@ -164,6 +175,7 @@ class SSHTunnelManager(QMainWindow):
         self.toolbar.start_tunnel.connect(self._start_tunnel)
         self.toolbar.stop_tunnel.connect(self._stop_tunnel)
         self.toolbar.test_tunnel.connect(self._test_tunnel)
+        self.toolbar.test_all_tunnels.connect(self._test_all_tunnels)
         self.toolbar.browse_files.connect(self._browse_files)
         self.toolbar.browse_remote_files.connect(self._browse_remote_files)
         self.toolbar.open_web_browser.connect(self._open_web_browser)
@@ -184,6 +196,20 @@ class SSHTunnelManager(QMainWindow):
         self.tunnel_cards.rdp_tunnel.connect(self._launch_rdp_by_name)
         self.tunnel_cards.test_tunnel.connect(self._test_tunnel_by_name)
         
+        # Compact list view signals
+        self.tunnel_list.start_tunnel.connect(self._start_tunnel_by_name)
+        self.tunnel_list.stop_tunnel.connect(self._stop_tunnel_by_name)
+        self.tunnel_list.edit_tunnel.connect(self._edit_tunnel_by_name)
+        self.tunnel_list.delete_tunnel.connect(self._delete_tunnel_by_name)
+        self.tunnel_list.files_tunnel.connect(self._browse_files_by_name)
+        self.tunnel_list.test_tunnel.connect(self._test_tunnel_by_name)
+        self.tunnel_list.selection_changed.connect(self._on_list_selection_changed)
+        
+        # Asynchronous tunnel start progress
+        self.tunnel_starter.start_event.connect(self._on_tunnel_start_event)
+        self.tunnel_starter.tunnel_ready.connect(self._on_tunnel_ready)
+        self.tunnel_starter.start_failed.connect(self._on_tunnel_start_failed)
+        
         # File operations
         self.file_ops_manager.log_message.connect(lambda msg: self.log(msg, log_level_from_message(msg)))
         self.file_ops_manager.tunnel_needed.connect(self._start_tunnel_by_name)
@@ -219,6 +245,10 @@ class SSHTunnelManager(QMainWindow):
         tools_menu.addAction(powershell_action)
         
         tools_menu.addSeparator()
+        test_all_action = QAction("🧪 Test All Tunnels", self)
+        test_all_action.triggered.connect(self._test_all_tunnels)
+        tools_menu.addAction(test_all_action)
+        
         network_scanner_action = QAction("🔍 Network Scanner", self)
         network_scanner_action.triggered.connect(self.network_scanner.show_scanner)
         tools_menu.addAction(network_scanner_action)
@@ -229,6 +259,11 @@ class SSHTunnelManager(QMainWindow):
         toggle_dashboard_action.triggered.connect(self._toggle_dashboard)
         view_menu.addAction(toggle_dashboard_action)
         
+        self.compact_list_action = QAction("Compact List View", self)
+        self.compact_list_action.setCheckable(True)
+        self.compact_list_action.toggled.connect(self._set_compact_list_view)
+        view_menu.addAction(self.compact_list_action)
+        
         # Help menu
         help_menu = menubar.addMenu("Help")
         about_action = QAction("About", self)
@@ -271,42 +306,75 @@ class SSHTunnelManager(QMainWindow):
         self.config_manager.load_configurations()
         self._refresh_ui()
     
+    def _setup_key_watcher(self):
+        """Drop cached SSH key lookups as soon as ~/.ssh changes."""
+        discovery = get_key_discovery()
+        self.key_watcher = QFileSystemWatcher(self)
+        if discovery.ssh_dir.is_dir():
+            self.key_watcher.addPath(str(discovery.ssh_dir))
+        self.key_watcher.directoryChanged.connect(lambda _path: discovery.invalidate())
+    
     def _start_monitoring(self):
         """Start tunnel monitoring."""
         self.monitor_thread = TunnelMonitorThread(self.active_tunnels)
-        self.monitor_thread.status_update.connect(self._update_tunnel_status)
+        self.monitor_thread.status_batch.connect(self._apply_status_batch)
         self.monitor_thread.connection_lost.connect(self._handle_connection_lost)
         self.monitor_thread.start()
     
     def _refresh_ui(self):
-        """Refresh all UI components."""
+        """Refresh all UI components (after configurations change)."""
         configs = self.config_manager.get_all_configurations()
-        
-        # Update dashboard stats
+        self._update_dashboard_stats(len(configs))
+        
+        # Update whichever tunnel view is showing
+        if self.tunnel_list.isVisibleTo(self):
+            self.tunnel_list.update_tunnels(configs, self.active_tunnels)
+            # Selection survives the update; keep the toolbar in step with it
+            name = self.tunnel_list.get_selected_config_name()
+            tunnel = self.active_tunnels.get(name)
+            self.toolbar.update_button_states(bool(name), bool(tunnel and tunnel.is_running))
+        else:
+            self.tunnel_cards.update_tunnels(configs, self.active_tunnels)
+            self.toolbar.update_button_states(False, False)
+    
+    def _update_dashboard_stats(self, total_count: int):
         active_count = len([t for t in self.active_tunnels.values() if t.is_running])
-        total_count = len(configs)
         self.dashboard.update_stats(active_count, total_count)
-        
-        # Update tunnel cards
-        self.tunnel_cards.update_tunnels(configs, self.active_tunnels)
-        
-        # Update toolbar button states
-        self.toolbar.update_button_states(False, False)
+    
+    def _on_list_selection_changed(self, has_selection: bool, config_name: str, is_active: bool):
+        """Follow the compact list's selection in the toolbar."""
+        self.toolbar.update_button_states(has_selection, is_active)
     
     def _update_tunnel_status(self, name: str, is_running: bool):
         """Update tunnel status from monitor."""
-        if name in self.active_tunnels:
-            self.active_tunnels[name].is_running = is_running
-        self._refresh_ui()
+        self._apply_status_batch({name: is_running})
+    
+    def _apply_status_batch(self, changes: dict):
+        """Apply all status changes from one monitor pass with a single refresh."""
+        for name, is_running in changes.items():
+            if name in self.active_tunnels:
+                self.active_tunnels[name].is_running = is_running
+        if self.tunnel_list.isVisibleTo(self):
+            # Only statuses changed: repaint those rows, don't rebuild the list
+            self._update_dashboard_stats(self.tunnel_list.model.rowCount())
+            self.tunnel_list.update_status(changes.keys(), self.active_tunnels)
+        else:
+            self._refresh_ui()
     
     def _handle_connection_lost(self, name: str):
         """Handle connection lost event."""
-        self.log(f"Connection lost for tunnel: {name}", "warning")
+        self.log(f"Connection lost for tunnel: {name}", "warning", name, "connection_lost")
     
     def _toggle_dashboard(self):
         """Toggle dashboard visibility."""
         self.dashboard.setVisible(not self.dashboard.isVisible())
     
+    def _set_compact_list_view(self, enabled: bool):
+        """Switch between tunnel cards and the virtualized list view."""
+        self.tunnel_cards.setVisible(not enabled)
+        self.tunnel_list.setVisible(enabled)
+        self._refresh_ui()
+    
     # ==================== TUNNEL ACTIONS ====================
     
     def _add_tunnel(self):
@@ -386,7 +454,7 @@ class SSHTunnelManager(QMainWindow):
         if not config:
             return
         
-        self.log(f"Starting tunnel: {config_name}", "info")
+        self.log(f"Starting tunnel: {config_name}", "info", config_name, "starting")
         
         if config_name not in self.active_tunnels:
             self.active_tunnels[config_name] = TunnelProcess(config, None)
@@ -395,12 +463,29 @@ class SSHTunnelManager(QMainWindow):
         tunnel.status = tunnel.STATUS_STARTING
         self._refresh_ui()
         
-        if tunnel.start():
-            self.log(f"Tunnel started: {config_name}", "success")
-            self._refresh_ui()
-        else:
-            self.log(f"Failed to start tunnel: {config_name}", "error")
-            self._refresh_ui()
+        # Readiness is reported through the tunnel_starter signals
+        self.tunnel_starter.start(config_name, tunnel)
+        self.monitor_thread.wake()
+        self._refresh_ui()
+    
+    def _on_tunnel_start_event(self, name: str, event: str, detail: str):
+        """Log intermediate start progress for a tunnel."""
+        if event == TunnelProcess.EVENT_SPAWNED:
+            self.log(f"{name}: {detail}", "info", name, event)
+        elif event == TunnelProcess.EVENT_FORWARD_BOUND:
+            self.log(f"{name}: forward bound ({detail})", "info", name, event)
+        elif event == TunnelProcess.EVENT_TIMEOUT:
+            self.log(f"{name}: {detail}", "warning", name, event)
+    
+    def _on_tunnel_ready(self, name: str):
+        """Handle a tunnel whose health check passed after start."""
+        self.log(f"Tunnel started: {name}", "success", name, "started")
+        self._refresh_ui()
+    
+    def _on_tunnel_start_failed(self, name: str, reason: str):
+        """Handle a tunnel that failed to start."""
+        self.log(f"Failed to start tunnel: {name} - {reason}", "error", name, "start_failed")
+        self._refresh_ui()
     
     def _stop_tunnel(self):
         """Stop selected tunnel (placeholder)."""
@@ -411,16 +496,26 @@ class SSHTunnelManager(QMainWindow):
         if config_name not in self.active_tunnels:
             return
         
-        self.log(f"Stopping tunnel: {config_name}", "info")
+        self.log(f"Stopping tunnel: {config_name}", "info", config_name, "stopping")
         tunnel = self.active_tunnels[config_name]
         tunnel.stop()
+        self.monitor_thread.wake()
         self._refresh_ui()
-        self.log(f"Tunnel stopped: {config_name}", "success")
+        self.log(f"Tunnel stopped: {config_name}", "success", config_name, "stopped")
     
     def _test_tunnel(self):
         """Test tunnel connection."""
         QMessageBox.information(self, "Info", "Please select a running tunnel first")
     
+    def _test_all_tunnels(self):
+        """Test every running tunnel concurrently and show the report."""
+        self.log("Testing all running tunnels", "info")
+        self.bulk_test_dialog = BulkTestDialog(
+            self.active_tunnels, self, lambda msg: self.log(msg, log_level_from_message(msg))
+        )
+        self.bulk_test_dialog.setAttribute(Qt.WA_DeleteOnClose)
+        self.bulk_test_dialog.show()
+    
     def _browse_files(self):
         """Browse files via SFTP."""
         QMessageBox.information(self, "Info", "Please select a running tunnel first")
@@ -523,9 +618,9 @@ class SSHTunnelManager(QMainWindow):
         msg_box.setStandardButtons(QMessageBox.Ok)
         msg_box.exec()
     
-    def log(self, message: str, level: str = "info"):
-        """Log a message with level."""
-        self.log_widget.add_log(message, level)
+    def log(self, message: str, level: str = "info", tunnel: str = "", event: str = ""):
+        """Log a message with level, optionally tagged with a tunnel and event."""
+        self.log_widget.add_log(message, level, tunnel, event)
     
     def closeEvent(self, event):
         """Handle close event."""
@@ -546,4 +641,7 @@ class SSHTunnelManager(QMainWindow):
             self.monitor_thread.stop()
             self.monitor_thread.wait()
         
+        # Close pooled SFTP/SSH connections
+        get_pool().close_all()
+        
         QApplication.quit()
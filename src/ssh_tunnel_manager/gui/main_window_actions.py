@@ -12,7 +12,10 @@ from pathlib import Path
 from PySide6.QtWidgets import QMessageBox, QDialog, QFileDialog
 
 from ..core.models import TunnelConfig
+from ..core.config_io import FILE_FILTER
+from ..core.ssh_keys import get_key_discovery
 from ..core.tunnel_process import TunnelProcess
+from ..core.tunnel_starter import TunnelStarter
 from ..utils.connection_tester import ConnectionTester
 from .dialogs.tunnel_config import TunnelConfigDialog
 
@@ -28,11 +31,30 @@ class MainWindowActions:
         self.refresh_table = None
         self.active_tunnels = {}
         self.tunnel_table = None
+        self.tunnel_starter = None
     
     def _get_parent(self, parent=None):
         """Helper to get the parent widget."""
         return parent or self.parent_widget
     
+    def _get_tunnel_starter(self) -> TunnelStarter:
+        """Get the asynchronous tunnel starter, creating it on first use."""
+        if getattr(self, 'tunnel_starter', None) is None:
+            self.tunnel_starter = TunnelStarter()
+            self.tunnel_starter.tunnel_ready.connect(self._on_tunnel_ready)
+            self.tunnel_starter.start_failed.connect(self._on_tunnel_start_failed)
+        return self.tunnel_starter
+    
+    def _on_tunnel_ready(self, name: str):
+        """Handle a tunnel whose health check passed after start."""
+        self.log(f"✅ SSH tunnel is up: {name}")
+        self.refresh_table()
+    
+    def _on_tunnel_start_failed(self, name: str, reason: str):
+        """Handle a tunnel that failed to start."""
+        self.log(f"❌ Failed to start tunnel {name}: {reason}")
+        self.refresh_table()
+    
     def add_tunnel(self, parent=None):
         """Add a new tunnel configuration."""
         parent_widget = self._get_parent(parent)
@@ -116,7 +138,7 @@ class MainWindowActions:
         
         try:
             # Check if SSH key is configured for informational logging
-            uses_password = not (config.ssh_key_path and os.path.exists(config.ssh_key_path))
+            uses_password = not get_key_discovery().key_exists(config.ssh_key_path)
             
             if uses_password:
                 self.log(f"🔐 Starting SSH tunnel: {name}")
@@ -137,7 +159,7 @@ class MainWindowActions:
                 self.active_tunnels[name].terminal_widget = None
             
             tunnel = self.active_tunnels[name]
-            if tunnel.start():
+            if self._get_tunnel_starter().start(name, tunnel):
                 self.log(f"✅ SSH tunnel process started: {name}")
                 self.log("📝 The tunnel will remain active as long as the terminal window stays open")
                 self.log("🛑 To stop the tunnel: close the terminal window or use the 'Stop Tunnel' button")
@@ -240,19 +262,21 @@ class MainWindowActions:
     def auto_start_tunnels(self):
         """Start all tunnels marked for auto-start."""
         auto_start_configs = self.config_manager.get_auto_start_configurations()
+        starter = self._get_tunnel_starter()
         count = 0
         
+        # Tunnels are started concurrently; readiness arrives via the starter signals
         for name, config in auto_start_configs.items():
             try:
                 # Only auto-start if not already running
                 if name not in self.active_tunnels or not self.active_tunnels[name].is_running:
                     # For auto-start, only use key-based auth (no password prompts)
-                    if config.ssh_key_path and os.path.exists(config.ssh_key_path):
+                    if get_key_discovery().key_exists(config.ssh_key_path):
                         if name not in self.active_tunnels:
                             self.active_tunnels[name] = TunnelProcess(config)
                         
-                        if self.active_tunnels[name].start():
-                            self.log(f"🚀 Auto-started tunnel: {name}")
+                        if starter.start(name, self.active_tunnels[name]):
+                            self.log(f"🚀 Auto-starting tunnel: {name}")
                             count += 1
                         else:
                             self.log(f"❌ Failed to auto-start tunnel: {name}")
@@ -268,19 +292,22 @@ class MainWindowActions:
         """Import tunnel configurations from file."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Import Tunnel Configurations",
-            str(Path.home()), "JSON Files (*.json)"
+            str(Path.home()), FILE_FILTER
         )
         
         if file_path:
             try:
-                success, message = self.config_manager.import_configurations(Path(file_path))
-                if success:
-                    self.refresh_table()
-                    self.log(f"Import successful: {message}")
-                    QMessageBox.information(self, "Import Success", message)
+                report = self.config_manager.import_report(Path(file_path))
+                message = report.summary()
+                self.refresh_table()
+                self.log(f"Import successful: {message}")
+                if report.invalid:
+                    box = QMessageBox(QMessageBox.Warning, "Import Finished", message,
+                                      QMessageBox.Ok, self)
+                    box.setDetailedText(report.details(limit=200))
+                    box.exec()
                 else:
-                    self.log(f"Import failed: {message}")
-                    QMessageBox.critical(self, "Import Failed", message)
+                    QMessageBox.information(self, "Import Success", message)
             except Exception as e:
                 error_msg = f"Import failed: {str(e)}"
                 self.log(error_msg)
@@ -290,7 +317,8 @@ class MainWindowActions:
         """Export tunnel configurations to file."""
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Tunnel Configurations",
-            str(Path.home() / "ssh_tunnels.json"), "JSON Files (*.json)"
+            str(Path.home() / "ssh_tunnels.json"),
+            "JSON Files (*.json);;JSON Lines (*.jsonl);;CSV Files (*.csv)"
         )
         
         if file_path:
@@ -451,7 +479,7 @@ Built with PySide6 (Qt6) for reliability and performance.
         cmd.extend(["-p", str(config.ssh_port)])
         
         # Use SSH key if available
-        if config.ssh_key_path and os.path.exists(config.ssh_key_path):
+        if get_key_discovery().key_exists(config.ssh_key_path):
             cmd.extend(["-i", config.ssh_key_path])
         
         # Add user and host
@@ -7,6 +7,11 @@ from .ssh_terminal import SSHTerminalWidget
 from .tunnel_cards import TunnelCard, TunnelCardsWidget
 from .dashboard import DashboardWidget, StatCard
 from .modern_log import ModernLogWidget
+from .tunnel_list_model import TunnelListModel, TunnelFilterProxyModel, TunnelListView
+from .remote_file_model import RemoteFileModel
+from .log_view_model import LogListModel
+from .port_results_model import PortResultsModel
+from .sparkline import SparklineWidget
 
 __all__ = [
     'SSHTerminalWidget',
@@ -15,4 +20,11 @@ __all__ = [
     'DashboardWidget',
     'StatCard',
     'ModernLogWidget',
+    'TunnelListModel',
+    'TunnelFilterProxyModel',
+    'TunnelListView',
+    'RemoteFileModel',
+    'LogListModel',
+    'PortResultsModel',
+    'SparklineWidget',
 ]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+SSH Tunnel Manager - Activity Log Model
+List model over a LogStore for the activity log views
+"""
+
+import bisect
+from typing import Callable, Dict, List, Optional, Sequence
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from ...core.log_store import LogRecord, LogStore, tokenize
+
+
+class LogListModel(QAbstractListModel):
+    """Rows of a LogStore, optionally filtered.
+
+    Rows are formatted only when the view paints them, so a QListView over
+    this model costs the same with fifty records or fifty thousand. Without
+    a filter the rows are a window of consecutive seqs; with one they are
+    the seqs the store's search returned, kept up to date as records are
+    added and dropped.
+    """
+
+    def __init__(self, store: LogStore, format_record: Callable[[LogRecord], str],
+                 level_colors: Dict[str, str], parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.format_record = format_record
+        self.level_colors = {level: QColor(color) for level, color in level_colors.items()}
+        self._first_seq = store.first_seq
+        self._rows = len(store)
+        self._seqs: Optional[List[int]] = None  # None when unfiltered
+        self._filter_terms: List[str] = []
+        self._filter_levels: Optional[Sequence[str]] = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._rows if self._seqs is None else len(self._seqs)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.record(index.row())
+        if record is None:
+            return None
+        if role == Qt.DisplayRole:
+            return self.format_record(record)
+        if role == Qt.ForegroundRole:
+            return self.level_colors.get(record.level)
+        if role == Qt.ToolTipRole and (record.tunnel or record.event):
+            return " - ".join(part for part in (record.tunnel, record.event) if part)
+        if role == Qt.UserRole:
+            return record
+        return None
+
+    def record(self, row: int) -> Optional[LogRecord]:
+        """Record shown in a row."""
+        if self._seqs is None:
+            return self.store.get(self._first_seq + row) if 0 <= row < self._rows else None
+        return self.store.get(self._seqs[row]) if 0 <= row < len(self._seqs) else None
+
+    @property
+    def is_filtered(self) -> bool:
+        return self._seqs is not None
+
+    def add(self, message: str, level: str = "info", tunnel: str = "", event: str = "") -> LogRecord:
+        """Append a record to the store and show it if it passes the filter."""
+        record, evicted = self.store.append(message, level, tunnel, event)
+        if evicted:
+            self._drop_evicted()
+        if self._seqs is None:
+            self.beginInsertRows(QModelIndex(), self._rows, self._rows)
+            self._rows += 1
+            self.endInsertRows()
+        elif LogStore.matches(record, self._filter_terms, self._filter_levels):
+            row = len(self._seqs)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._seqs.append(record.seq)
+            self.endInsertRows()
+        return record
+
+    def set_filter(self, text: str = "", levels: Optional[Sequence[str]] = None):
+        """Show only records matching text (word prefixes) and levels."""
+        self._filter_terms = tokenize(text)
+        self._filter_levels = levels
+        self.beginResetModel()
+        if self._filter_terms or levels is not None:
+            self._seqs = self.store.search(text, levels)
+        else:
+            self._seqs = None
+            self._first_seq = self.store.first_seq
+            self._rows = len(self.store)
+        self.endResetModel()
+
+    def clear(self):
+        """Drop every record from the store and the view."""
+        self.beginResetModel()
+        self.store.clear()
+        self._first_seq = self.store.first_seq
+        self._rows = 0
+        if self._seqs is not None:
+            self._seqs = []
+        self.endResetModel()
+
+    def _drop_evicted(self):
+        """Remove rows for records the store has dropped."""
+        first = self.store.first_seq
+        if self._seqs is None:
+            count = min(first - self._first_seq, self._rows)
+            if count > 0:
+                self.beginRemoveRows(QModelIndex(), 0, count - 1)
+                self._first_seq += count
+                self._rows -= count
+                self.endRemoveRows()
+            self._first_seq = max(self._first_seq, first)
+        else:
+            count = bisect.bisect_left(self._seqs, first)
+            if count:
+                self.beginRemoveRows(QModelIndex(), 0, count - 1)
+                del self._seqs[:count]
+                self.endRemoveRows()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Port Scan Results Model
+Table model for the network scanner's port scan results
+"""
+
+from typing import List
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from ...core.port_probe import PortResult
+
+
+class PortResultsModel(QAbstractTableModel):
+    """Table model over PortResults, added a batch at a time.
+
+    Every result is kept, but only open ports are shown unless
+    show_closed is set, so a scan of thousands of mostly closed ports adds
+    a handful of rows. Each batch becomes a single row insertion.
+    """
+
+    COLUMNS = ["Port", "Service", "Status", "Response"]
+    COL_PORT, COL_SERVICE, COL_STATUS, COL_RESPONSE = range(4)
+
+    # Custom roles
+    ResultRole = Qt.UserRole + 1  # PortResult for the row
+
+    OPEN_COLOR = QColor(144, 238, 144)  # Light green
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._results: List[PortResult] = []  # every result, in arrival order
+        self._rows: List[PortResult] = []  # results shown
+        self._show_closed = False
+        self.open_count = 0
+
+    # ------------------------------------------------------------------ #
+    # Qt model interface
+    # ------------------------------------------------------------------ #
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        result = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.COL_PORT:
+                return str(result.port)
+            if column == self.COL_SERVICE:
+                return result.service
+            if column == self.COL_STATUS:
+                return self.status_text(result)
+            if column == self.COL_RESPONSE:
+                return f"{result.rtt * 1000:.1f} ms" if result.rtt is not None else ""
+        if role == Qt.BackgroundRole and column == self.COL_STATUS and result.is_open:
+            return self.OPEN_COLOR
+        if role == Qt.TextAlignmentRole and column in (self.COL_PORT, self.COL_RESPONSE):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == self.ResultRole:
+            return result
+        return None
+
+    @staticmethod
+    def status_text(result: PortResult) -> str:
+        if result.is_open:
+            return "Open"
+        # Refused connections answered; anything else timed out or failed
+        return "Closed" if result.rtt is not None else "No response"
+
+    # ------------------------------------------------------------------ #
+    # Updates
+    # ------------------------------------------------------------------ #
+
+    @property
+    def scanned_count(self) -> int:
+        return len(self._results)
+
+    @property
+    def show_closed(self) -> bool:
+        return self._show_closed
+
+    def add_results(self, results: List[PortResult]) -> List[PortResult]:
+        """Add a batch of results; returns the open ones among them."""
+        results = sorted(results, key=lambda result: result.port)
+        self._results.extend(results)
+        opened = [result for result in results if result.is_open]
+        self.open_count += len(opened)
+        shown = results if self._show_closed else opened
+        if shown:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(shown) - 1)
+            self._rows.extend(shown)
+            self.endInsertRows()
+        return opened
+
+    def set_show_closed(self, show_closed: bool):
+        """Show every result, or only open ports."""
+        if show_closed == self._show_closed:
+            return
+        self.beginResetModel()
+        self._show_closed = show_closed
+        self._rows = list(self._results) if show_closed else [r for r in self._results if r.is_open]
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._results = []
+        self._rows = []
+        self.open_count = 0
+        self.endResetModel()
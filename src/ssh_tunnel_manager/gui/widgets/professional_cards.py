@@ -60,11 +60,8 @@ class ProfessionalTunnelCard(QFrame):
         header_layout.addStretch()
         
         # Status badge
-        status_text = "ACTIVE" if self.is_active else "STOPPED"
-        status_badge = QLabel(status_text)
-        status_style = get_status_style('active' if self.is_active else 'inactive')
-        status_badge.setStyleSheet(status_style)
-        header_layout.addWidget(status_badge)
+        self.status_badge = QLabel()
+        header_layout.addWidget(self.status_badge)
         
         layout.addLayout(header_layout)
         
@@ -116,8 +113,33 @@ class ProfessionalTunnelCard(QFrame):
             layout.addWidget(desc_label)
         
         # Context-aware actions based on tunnel state and type
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(8)
+        self.actions_layout = QHBoxLayout()
+        self.actions_layout.setSpacing(8)
+        layout.addLayout(self.actions_layout)
+        
+        self._update_status_widgets()
+    
+    def set_active(self, is_active: bool):
+        """Update the card for a status change without rebuilding it."""
+        if is_active == self.is_active:
+            return
+        self.is_active = is_active
+        self._update_status_widgets()
+    
+    def _update_status_widgets(self):
+        """Refresh the status badge and the state-dependent action buttons."""
+        self.status_badge.setText("ACTIVE" if self.is_active else "STOPPED")
+        self.status_badge.setStyleSheet(get_status_style('active' if self.is_active else 'inactive'))
+        
+        # Clear existing action buttons
+        while self.actions_layout.count():
+            item = self.actions_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        
+        actions_layout = self.actions_layout
+        tunnel_type = getattr(self.config, 'tunnel_type', 'local')
+        remote_port = getattr(self.config, 'remote_port', 'N/A')
         
         if self.is_active:
             # Active tunnel - show operational actions
@@ -169,7 +191,6 @@ class ProfessionalTunnelCard(QFrame):
             actions_layout.addWidget(delete_btn)
         
         actions_layout.addStretch()
-        layout.addLayout(actions_layout)
     
     def _create_button(self, text: str, style: str) -> QPushButton:
         """Create an action button."""
@@ -198,6 +219,7 @@ class ProfessionalTunnelCardsWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._cards: dict[str, ProfessionalTunnelCard] = {}
         self._setup_ui()
     
     def _setup_ui(self):
@@ -219,41 +241,78 @@ class ProfessionalTunnelCardsWidget(QWidget):
         self.cards_layout.setContentsMargins(16, 16, 16, 16)
         self.cards_layout.addStretch()
         
+        # Empty state
+        self.empty_label = QLabel("No tunnels configured\nClick 'New Tunnel' to get started")
+        self.empty_label.setObjectName("tertiary")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.setFont(QFont("Segoe UI", 12))
+        self.cards_layout.insertWidget(0, self.empty_label)
+        
         scroll.setWidget(self.cards_container)
         layout.addWidget(scroll)
     
     def update_tunnels(self, tunnels_dict: dict, active_tunnels: dict):
-        """Update the cards display."""
-        # Clear existing cards
-        while self.cards_layout.count() > 1:
-            item = self.cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Update the cards display.
         
-        # Create cards
-        for config_name, config in tunnels_dict.items():
-            # Check if tunnel is actually running, not just in the dict
-            is_active = (config_name in active_tunnels and 
-                        active_tunnels[config_name].is_running)
-            card = ProfessionalTunnelCard(config_name, config, is_active)
+        Cards are keyed by tunnel name: unchanged cards are kept, status
+        changes only touch the badge and buttons, and cards are created or
+        removed only for added or deleted tunnels.
+        """
+        self.cards_container.setUpdatesEnabled(False)
+        try:
+            # Remove cards for deleted tunnels
+            for config_name in list(self._cards):
+                if config_name not in tunnels_dict:
+                    card = self._cards.pop(config_name)
+                    self.cards_layout.removeWidget(card)
+                    card.deleteLater()
             
-            # Connect signals
-            card.start_clicked.connect(self.start_tunnel.emit)
-            card.stop_clicked.connect(self.stop_tunnel.emit)
-            card.edit_clicked.connect(self.edit_tunnel.emit)
-            card.delete_clicked.connect(self.delete_tunnel.emit)
-            card.files_clicked.connect(self.files_tunnel.emit)
-            card.web_clicked.connect(self.web_tunnel.emit)
-            card.rtsp_clicked.connect(self.rtsp_tunnel.emit)
-            card.rdp_clicked.connect(self.rdp_tunnel.emit)
-            card.test_clicked.connect(self.test_tunnel.emit)
+            order_changed = False
+            for config_name, config in tunnels_dict.items():
+                # Check if tunnel is actually running, not just in the dict
+                is_active = (config_name in active_tunnels and 
+                            active_tunnels[config_name].is_running)
+                card = self._cards.get(config_name)
+                
+                if card is not None and card.config == config:
+                    card.set_active(is_active)
+                    continue
+                
+                # New tunnel, or its configuration changed: (re)build the card
+                if card is not None:
+                    self.cards_layout.removeWidget(card)
+                    card.deleteLater()
+                self._cards[config_name] = self._create_card(config_name, config, is_active)
+                order_changed = True
             
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
+            if order_changed:
+                self._reorder_cards(list(tunnels_dict))
+            
+            self.empty_label.setVisible(not tunnels_dict)
+        finally:
+            self.cards_container.setUpdatesEnabled(True)
+    
+    def _create_card(self, config_name: str, config, is_active: bool) -> ProfessionalTunnelCard:
+        """Create a card and forward its signals."""
+        card = ProfessionalTunnelCard(config_name, config, is_active)
+        
+        # Connect signals
+        card.start_clicked.connect(self.start_tunnel.emit)
+        card.stop_clicked.connect(self.stop_tunnel.emit)
+        card.edit_clicked.connect(self.edit_tunnel.emit)
+        card.delete_clicked.connect(self.delete_tunnel.emit)
+        card.files_clicked.connect(self.files_tunnel.emit)
+        card.web_clicked.connect(self.web_tunnel.emit)
+        card.rtsp_clicked.connect(self.rtsp_tunnel.emit)
+        card.rdp_clicked.connect(self.rdp_tunnel.emit)
+        card.test_clicked.connect(self.test_tunnel.emit)
+        return card
+    
+    def _reorder_cards(self, names: list):
+        """Place cards in configuration order, before the trailing stretch."""
+        for card in self._cards.values():
+            self.cards_layout.removeWidget(card)
         
-        # Show empty state if no tunnels
-        if not tunnels_dict:
-            empty_label = QLabel("No tunnels configured\nClick 'New Tunnel' to get started")
-            empty_label.setObjectName("tertiary")
-            empty_label.setAlignment(Qt.AlignCenter)
-            empty_label.setFont(QFont("Segoe UI", 12))
-            self.cards_layout.insertWidget(0, empty_label)
+        # Index 0 holds the empty-state label
+        for index, config_name in enumerate(names, start=1):
+            self.cards_layout.insertWidget(index, self._cards[config_name])
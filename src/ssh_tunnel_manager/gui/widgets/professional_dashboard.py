@@ -5,12 +5,14 @@ Overview statistics and metrics
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout, QComboBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 from ..styles.professional_theme import COLORS
+from .sparkline import SparklineWidget
+from ...core.constants import DASHBOARD_REFRESH_INTERVAL, DASHBOARD_MAX_SPARKLINES
 
 
 class StatCard(QFrame):
@@ -45,12 +47,64 @@ class StatCard(QFrame):
         self.value_label.setText(value)
 
 
+class TunnelMetricsRow(QWidget):
+    """One running tunnel: name, latency and uptime sparklines, last latency."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(12)
+        
+        self.name_label = QLabel()
+        self.name_label.setFixedWidth(160)
+        layout.addWidget(self.name_label)
+        
+        self.latency_line = SparklineWidget(COLORS['accent_secondary'])
+        self.latency_line.setToolTip(
+            "Latency to the SSH server (keepalive round trip for embedded tunnels, "
+            "TCP connect time for terminal tunnels)"
+        )
+        layout.addWidget(self.latency_line, 2)
+        
+        self.uptime_line = SparklineWidget(COLORS['status_active'], maximum=1.0)
+        self.uptime_line.setToolTip("Share of checks that found the tunnel up")
+        layout.addWidget(self.uptime_line, 1)
+        
+        self.latency_label = QLabel()
+        self.latency_label.setObjectName("muted")
+        self.latency_label.setFixedWidth(80)
+        self.latency_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        layout.addWidget(self.latency_label)
+    
+    def show_metrics(self, name: str, metrics, rollup: str):
+        """Draw a tunnel's series at the given rollup."""
+        self.name_label.setText(name)
+        self.latency_line.set_values(metrics.latency_series(rollup))
+        self.uptime_line.set_values(metrics.uptime_series(rollup))
+        if metrics.last_alive is False:
+            self.latency_label.setText("down")
+        elif metrics.last_latency is not None:
+            self.latency_label.setText(f"{metrics.last_latency:.1f} ms")
+        else:
+            self.latency_label.setText("—")
+
+
 class ProfessionalDashboard(QWidget):
-    """Dashboard with overview statistics."""
+    """Dashboard with overview statistics and per-tunnel latency/uptime sparklines."""
+    
+    # (label, rollup in TunnelMetrics)
+    RANGES = [("Last 2 minutes", "1s"), ("Last 2 hours", "1m"), ("Last 2 days", "1h")]
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._tunnels = {}
         self._setup_ui()
+        
+        # Sparklines only repaint while the dashboard is on screen
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(DASHBOARD_REFRESH_INTERVAL)
+        self._refresh_timer.timeout.connect(self._refresh_metrics)
     
     def _setup_ui(self):
         """Setup dashboard UI."""
@@ -79,6 +133,70 @@ class ProfessionalDashboard(QWidget):
         stats_layout.addWidget(self.connections_card, 0, 3)
         
         layout.addLayout(stats_layout)
+        
+        # Per-tunnel history
+        history_header = QHBoxLayout()
+        history_title = QLabel("Latency and Uptime")
+        history_title.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        history_title.setStyleSheet(f"color: {COLORS['text_primary']};")
+        history_header.addWidget(history_title)
+        history_header.addStretch()
+        self.range_combo = QComboBox()
+        for label, rollup in self.RANGES:
+            self.range_combo.addItem(label, rollup)
+        self.range_combo.currentIndexChanged.connect(self._refresh_metrics)
+        history_header.addWidget(self.range_combo)
+        layout.addLayout(history_header)
+        
+        self.metrics_layout = QVBoxLayout()
+        self.metrics_layout.setSpacing(6)
+        self.metric_rows = []
+        for _ in range(DASHBOARD_MAX_SPARKLINES):
+            row = TunnelMetricsRow()
+            row.setVisible(False)
+            self.metrics_layout.addWidget(row)
+            self.metric_rows.append(row)
+        self.empty_label = QLabel("No running tunnels")
+        self.empty_label.setObjectName("muted")
+        self.metrics_layout.addWidget(self.empty_label)
+        self.more_label = QLabel()
+        self.more_label.setObjectName("muted")
+        self.more_label.setVisible(False)
+        self.metrics_layout.addWidget(self.more_label)
+        layout.addLayout(self.metrics_layout)
+    
+    def set_tunnels(self, active_tunnels: dict):
+        """Chart the running tunnels of active_tunnels (name -> TunnelProcess)."""
+        self._tunnels = active_tunnels
+        self._refresh_metrics()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh_timer.start()
+        self._refresh_metrics()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+    
+    def _refresh_metrics(self):
+        """Redraw the sparklines from each tunnel's metrics."""
+        if not self.isVisible():
+            return
+        rollup = self.range_combo.currentData()
+        running = sorted(
+            (name, tunnel) for name, tunnel in list(self._tunnels.items())
+            if tunnel.is_running and hasattr(tunnel, 'metrics')
+        )
+        for row, (name, tunnel) in zip(self.metric_rows, running):
+            row.show_metrics(name, tunnel.metrics, rollup)
+        for i, row in enumerate(self.metric_rows):
+            row.setVisible(i < len(running))
+        self.empty_label.setVisible(not running)
+        hidden = len(running) - len(self.metric_rows)
+        self.more_label.setVisible(hidden > 0)
+        if hidden > 0:
+            self.more_label.setText(f"+{hidden} more running")
     
     def update_stats(self, active: int, total: int, connections: int = 0):
         """Update dashboard statistics."""
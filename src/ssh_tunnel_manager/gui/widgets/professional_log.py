@@ -4,22 +4,49 @@ Professional Log Widget
 Clean, colored activity log
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
-    QLabel, QFrame, QPushButton, QLineEdit
+    QWidget, QVBoxLayout, QHBoxLayout, QListView, QAbstractItemView,
+    QLabel, QFrame, QPushButton, QLineEdit, QComboBox
 )
-from PySide6.QtCore import Qt, QDateTime
-from PySide6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QFont
 
 from ..styles.professional_theme import COLORS
+from .log_view_model import LogListModel
+from ...core.log_store import LogRecord, LogStore, LEVELS, classify_level, default_log_file
+from ...core.constants import LOG_SEARCH_DELAY
 
 
 class ProfessionalLogWidget(QWidget):
-    """Professional activity log with filtering."""
+    """Professional activity log with filtering.
+    
+    Entries live in a bounded LogStore (also written to the rotating
+    activity log file) and are shown through a list model.
+    """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store: Optional[LogStore] = None):
         super().__init__(parent)
+        self.store = store if store is not None else LogStore(log_file=default_log_file())
+        self.model = LogListModel(self.store, self._format_record, {
+            'info': COLORS['accent_secondary'],
+            'success': COLORS['text_success'],
+            'warning': COLORS['accent_warning'],
+            'error': COLORS['text_error'],
+        }, self)
+        
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(LOG_SEARCH_DELAY)
+        self.search_timer.timeout.connect(self._apply_filter)
+        
+        self.scroll_timer = QTimer(self)
+        self.scroll_timer.setSingleShot(True)
+        self.scroll_timer.setInterval(0)
+        
         self._setup_ui()
+        self.scroll_timer.timeout.connect(self.log_view.scrollToBottom)
     
     def _setup_ui(self):
         """Setup log widget UI."""
@@ -46,8 +73,17 @@ class ProfessionalLogWidget(QWidget):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search logs...")
         self.search_box.setMaximumWidth(180)
+        self.search_box.textChanged.connect(self.search_timer.start)
         header_layout.addWidget(self.search_box)
         
+        # Level filter
+        self.level_combo = QComboBox()
+        self.level_combo.addItem("All levels", None)
+        for level in LEVELS:
+            self.level_combo.addItem(level.capitalize(), level)
+        self.level_combo.currentIndexChanged.connect(self._apply_filter)
+        header_layout.addWidget(self.level_combo)
+        
         # Clear button
         clear_btn = QPushButton("Clear")
         clear_btn.setObjectName("default")
@@ -58,11 +94,13 @@ class ProfessionalLogWidget(QWidget):
         layout.addLayout(header_layout)
         
         # Log area
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setFont(QFont("Consolas", 10))
-        self.log_text.setMinimumHeight(120)
-        layout.addWidget(self.log_text)
+        self.log_view = QListView()
+        self.log_view.setModel(self.model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.log_view.setFont(QFont("Consolas", 10))
+        self.log_view.setMinimumHeight(120)
+        layout.addWidget(self.log_view)
         
         # Footer
         footer_layout = QHBoxLayout()
@@ -73,63 +111,43 @@ class ProfessionalLogWidget(QWidget):
         footer_layout.addStretch()
         
         layout.addLayout(footer_layout)
-        
-        self.log_count = 0
     
-    def add_log(self, message: str, level: str = "info"):
+    @staticmethod
+    def _format_record(record: LogRecord) -> str:
+        level_text = record.level.upper()[:4].ljust(4)
+        return f"[{record.time_text}] [{level_text}] {record.message}"
+    
+    def add_log(self, message: str, level: str = "info", tunnel: str = "", event: str = ""):
         """Add a log entry."""
-        timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
-        
-        # Color mapping
-        colors_map = {
-            'info': COLORS['accent_secondary'],
-            'success': COLORS['text_success'],
-            'warning': COLORS['accent_warning'],
-            'error': COLORS['text_error'],
-        }
-        
-        color = colors_map.get(level, COLORS['text_primary'])
-        
-        # Format entry
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        # Timestamp
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(COLORS['text_tertiary']))
-        cursor.insertText(f"[{timestamp}] ", fmt)
-        
-        # Level indicator
-        level_text = level.upper()[:4].ljust(4)
-        fmt.setForeground(QColor(color))
-        cursor.insertText(f"[{level_text}] ", fmt)
-        
-        # Message
-        fmt.setForeground(QColor(COLORS['text_primary']))
-        cursor.insertText(f"{message}\n", fmt)
-        
-        self.log_text.setTextCursor(cursor)
-        self.log_text.ensureCursorVisible()
-        
-        self.log_count += 1
-        self.log_count_label.setText(f"{self.log_count} entries")
+        if not self.scroll_timer.isActive():
+            scrollbar = self.log_view.verticalScrollBar()
+            if scrollbar.value() >= scrollbar.maximum():
+                # One scroll per burst of entries rather than per entry
+                self.scroll_timer.start()
+        self.model.add(message, level, tunnel, event)
+        self._update_count()
     
     def clear_logs(self):
         """Clear all logs."""
-        self.log_text.clear()
-        self.log_count = 0
-        self.log_count_label.setText("0 entries")
+        self.model.clear()
+        self._update_count()
+    
+    def _apply_filter(self):
+        """Filter the view by the search words and selected level."""
+        self.search_timer.stop()
+        level = self.level_combo.currentData()
+        self.model.set_filter(self.search_box.text(), [level] if level else None)
+        self.log_view.scrollToBottom()
+        self._update_count()
+    
+    def _update_count(self):
+        total = len(self.store)
+        if self.model.is_filtered:
+            self.log_count_label.setText(f"{self.model.rowCount()} of {total} entries")
+        else:
+            self.log_count_label.setText(f"{total} entries")
 
 
 def log_level_from_message(message: str) -> str:
     """Determine log level from message content."""
-    message_lower = message.lower()
-    
-    if any(word in message_lower for word in ['error', 'failed', 'failure', 'exception']):
-        return 'error'
-    elif any(word in message_lower for word in ['warning', 'warn']):
-        return 'warning'
-    elif any(word in message_lower for word in ['success', 'started', 'connected', 'complete']):
-        return 'success'
-    else:
-        return 'info'
+    return classify_level(message)
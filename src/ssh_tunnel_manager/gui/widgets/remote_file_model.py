@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Remote File Model
+Lazily populated model for SFTP directory listings
+"""
+
+import datetime
+import stat
+from typing import List, Optional
+
+import paramiko
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from ...core.constants import LISTING_PAGE_SIZE
+from ...core.sftp_transfer import format_size
+
+
+class RemoteFileModel(QAbstractTableModel):
+    """Table model over SFTPAttributes for the SFTP browser.
+
+    Entries can be appended in batches while a listing streams in and are
+    replaced by the sorted listing once it is complete. Rows are
+    exposed to the view a page at a time through canFetchMore/fetchMore,
+    and cell text is only formatted for the rows being painted. Row 0 is a
+    ".." entry when the directory has a parent.
+    """
+
+    COLUMNS = ["Name", "Size", "Modified", "Permissions"]
+    COL_NAME, COL_SIZE, COL_MODIFIED, COL_PERMISSIONS = range(4)
+
+    # Custom roles
+    EntryRole = Qt.UserRole + 1  # SFTPAttributes, None for the parent row
+    NameRole = Qt.UserRole + 2   # File name, '..' for the parent row
+
+    PARENT_NAME = ".."
+
+    def __init__(self, parent=None, page_size: int = LISTING_PAGE_SIZE):
+        super().__init__(parent)
+        self.page_size = page_size
+        self._entries: List[paramiko.SFTPAttributes] = []
+        self._visible = 0  # entries exposed to the view so far
+        self._show_parent = False
+
+    # ------------------------------------------------------------------ #
+    # Qt model interface
+    # ------------------------------------------------------------------ #
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._visible + self._show_parent
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._visible < len(self._entries)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        self._expose(min(len(self._entries), self._visible + self.page_size))
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        entry = self.entry(row)
+
+        if role == Qt.DisplayRole:
+            if entry is None:
+                return ".. (Parent Directory)" if column == self.COL_NAME else ""
+            return self._display_text(entry, column)
+        if role == self.EntryRole:
+            return entry
+        if role == self.NameRole:
+            return self.name(row)
+        if role == Qt.TextAlignmentRole and column == self.COL_SIZE:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    # ------------------------------------------------------------------ #
+    # Updates
+    # ------------------------------------------------------------------ #
+
+    def clear(self, show_parent: bool = False):
+        """Start a new listing."""
+        self.beginResetModel()
+        self._entries = []
+        self._visible = 0
+        self._show_parent = show_parent
+        self.endResetModel()
+
+    def set_entries(self, entries: List[paramiko.SFTPAttributes], show_parent: bool = False):
+        """Show a complete listing, already in display order, at once (e.g. from the cache)."""
+        self.beginResetModel()
+        self._entries = entries
+        self._visible = min(len(self._entries), self.page_size)
+        self._show_parent = show_parent
+        self.endResetModel()
+
+    def add_entries(self, entries: List[paramiko.SFTPAttributes]):
+        """Append a batch of a streaming listing.
+
+        The first page is shown right away; later rows appear as the view
+        scrolls down to them.
+        """
+        self._entries.extend(entries)
+        if self._visible < self.page_size:
+            self._expose(min(len(self._entries), self.page_size))
+
+    def replace_entries(self, entries: List[paramiko.SFTPAttributes]):
+        """Swap in the sorted version of the entries streamed so far.
+
+        Keeps the number of exposed rows, so the view doesn't jump back to
+        the top when a streaming listing completes. Selection and the
+        current index follow their entries to the new rows by file name.
+        """
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        names = [self.name(index.row()) for index in persistent]
+        self._entries = entries
+        self._visible = min(self._visible, len(entries))
+        if persistent:
+            rows = {entry.filename: row + self._show_parent
+                    for row, entry in enumerate(entries[:self._visible])}
+            if self._show_parent:
+                rows[self.PARENT_NAME] = 0
+            # Entries now sorted past the exposed rows drop out of the selection
+            self.changePersistentIndexList(persistent, [
+                self.index(rows[name], index.column()) if name in rows else QModelIndex()
+                for index, name in zip(persistent, names)
+            ])
+        self.layoutChanged.emit()
+
+    # ------------------------------------------------------------------ #
+    # Access
+    # ------------------------------------------------------------------ #
+
+    @property
+    def entries(self) -> List[paramiko.SFTPAttributes]:
+        """Every loaded entry, including rows not yet exposed to the view."""
+        return self._entries
+
+    def entry(self, row: int) -> Optional[paramiko.SFTPAttributes]:
+        """Entry for a row; None for the parent row or an invalid row."""
+        row -= self._show_parent
+        return self._entries[row] if 0 <= row < self._visible else None
+
+    def name(self, row: int) -> str:
+        """File name for a row, '..' for the parent row."""
+        if self._show_parent and row == 0:
+            return self.PARENT_NAME
+        entry = self.entry(row)
+        return entry.filename if entry is not None else ""
+
+    def is_dir(self, row: int) -> bool:
+        entry = self.entry(row)
+        return entry is not None and stat.S_ISDIR(entry.st_mode or 0)
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _expose(self, visible: int):
+        if visible <= self._visible:
+            return
+        first = self._visible + self._show_parent
+        self.beginInsertRows(QModelIndex(), first, visible + self._show_parent - 1)
+        self._visible = visible
+        self.endInsertRows()
+
+    @classmethod
+    def _display_text(cls, entry: paramiko.SFTPAttributes, column: int) -> str:
+        is_dir = stat.S_ISDIR(entry.st_mode or 0)
+        if column == cls.COL_NAME:
+            return f"{'📁' if is_dir else '📄'} {entry.filename}"
+        if column == cls.COL_SIZE:
+            return "<DIR>" if is_dir else format_size(entry.st_size or 0)
+        if column == cls.COL_MODIFIED:
+            if entry.st_mtime is None:
+                return ""
+            return datetime.datetime.fromtimestamp(entry.st_mtime).strftime("%Y-%m-%d %H:%M")
+        if column == cls.COL_PERMISSIONS:
+            return stat.filemode(entry.st_mode or 0)
+        return ""
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Sparkline Widget
+Small line chart of a metric series (e.g. a tunnel's latency history)
+"""
+
+from typing import List, Optional, Sequence
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import QPointF, QSize
+from PySide6.QtGui import QPainter, QPainterPath, QPen, QColor
+
+from ..styles.professional_theme import COLORS
+
+
+class SparklineWidget(QWidget):
+    """Draws a series as a line, one point per value.
+
+    None values (buckets without samples) are skipped and the line joins
+    the samples either side. The vertical scale runs from 0 to the largest
+    value, or to a fixed maximum if one is set (1.0 for uptime fractions).
+    """
+
+    def __init__(self, color: str = None, maximum: Optional[float] = None, parent=None):
+        super().__init__(parent)
+        self.color = QColor(color or COLORS['accent_secondary'])
+        self.maximum = maximum
+        self._values: List[Optional[float]] = []
+        self.setMinimumSize(120, 28)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def sizeHint(self) -> QSize:
+        return QSize(200, 28)
+
+    def set_values(self, values: Sequence[Optional[float]]):
+        """Replace the series and repaint."""
+        self._values = list(values)
+        self.update()
+
+    def paintEvent(self, event):
+        points = [(i, v) for i, v in enumerate(self._values) if v is not None]
+        if not points:
+            return
+        top = self.maximum if self.maximum is not None else max(v for _, v in points)
+        top = top or 1.0
+        width = self.width() - 2
+        height = self.height() - 4
+        step = width / max(1, len(self._values) - 1)
+
+        path = QPainterPath()
+        for n, (i, value) in enumerate(points):
+            point = QPointF(1 + i * step, 2 + height * (1 - min(value, top) / top))
+            if n:
+                path.lineTo(point)
+            else:
+                path.moveTo(point)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.color, 1.5))
+        if len(points) == 1:
+            painter.drawEllipse(path.currentPosition(), 1.5, 1.5)
+        else:
+            painter.drawPath(path)
+        painter.end()
@@ -3,22 +3,72 @@
 SSH Tunnel Manager - SSH Terminal Widget
 """
 
+import codecs
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QPlainTextEdit
 )
 from PySide6.QtCore import Signal, QProcess, QTimer
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QTextCursor
 
 from ...core.constants import (
     SSH_PASSWORD_PROMPTS, SSH_STDERR_PASSWORD_PROMPTS, 
     SSH_CONFIRMATION_PROMPTS, SSH_ERROR_PATTERNS,
-    CONSOLE_FONT, CONSOLE_FONT_SIZE, TERMINAL_STYLE, INPUT_HIDE_DELAY
+    CONSOLE_FONT, CONSOLE_FONT_SIZE, TERMINAL_STYLE, INPUT_HIDE_DELAY,
+    TERMINAL_FLUSH_INTERVAL, TERMINAL_MAX_BLOCKS, TERMINAL_MAX_PENDING
 )
+from ...core.prompt_matcher import PromptMatcher
+
+PROMPT_NOTICES = {
+    'password': "👆 Password prompt detected - please enter your password below:",
+    'confirm': "👆 SSH confirmation required - type 'yes' or 'no':",
+    'error': "⚠️  SSH connection issue detected. Check your credentials and network connection.",
+}
+
+
+class _OutputStream:
+    """Decoding and prompt detection state for one process output stream."""
+    
+    def __init__(self, phrases):
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.matcher = PromptMatcher(phrases)
+        self.found = {}  # kind -> stream offset where its last match ended
+        self.announced = set()  # (kind, line_start) already announced
+    
+    def feed(self, data: bytes) -> str:
+        """Decode a chunk and note the phrases in it."""
+        text = self.decoder.decode(data)
+        if text:
+            self.found.update(self.matcher.feed(text))
+        return text
+    
+    def take_prompts(self) -> set:
+        """Kinds to announce since the last call.
+        
+        Password and confirmation phrases only count on the unfinished last
+        line, where ssh waits for input; verbose debug lines mentioning
+        'authentication' or 'user@host' are complete lines. Errors count
+        anywhere.
+        """
+        prompts = set()
+        line_start = self.matcher.line_start
+        for kind, end in self.found.items():
+            key = (kind, 0 if kind == 'error' else line_start)
+            if (kind == 'error' or end > line_start) and key not in self.announced:
+                self.announced.add(key)
+                prompts.add(kind)
+        self.found.clear()
+        return prompts
 
 
 class SSHTerminalWidget(QWidget):
-    """Embedded terminal widget for SSH password input."""
+    """Embedded terminal widget for SSH password input.
+    
+    Process output is buffered and drawn at most every
+    TERMINAL_FLUSH_INTERVAL ms into a view kept to TERMINAL_MAX_BLOCKS
+    lines, so verbose ssh output doesn't stall the GUI thread.
+    """
     
     password_entered = Signal(str)  # Signal when password is entered
     process_finished = Signal(int)  # Signal when SSH process finishes
@@ -26,6 +76,15 @@ class SSHTerminalWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.process = None
+        self._pending = []
+        self._pending_size = 0
+        self._new_streams()
+        
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(TERMINAL_FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush_output)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -95,11 +154,90 @@ class SSHTerminalWidget(QWidget):
             self.toggle_visibility_button.setText("👁")
     
     def append_output(self, text: str):
-        """Add text to terminal output."""
-        self.output_text.appendPlainText(text)
-        # Auto-scroll to bottom
+        """Add a line of text to terminal output."""
+        self.flush_output()
+        self._write(text + "\n", new_line=True)
+    
+    def _write(self, text: str, new_line: bool = False):
+        """Insert text at the end, following it if the view is at the bottom."""
         scrollbar = self.output_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        cursor = QTextCursor(self.output_text.document())
+        cursor.movePosition(QTextCursor.End)
+        if new_line and cursor.block().length() > 1:
+            # Process output ended mid-line
+            text = "\n" + text
+        cursor.insertText(text)
+        self._trim_output()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _trim_output(self):
+        """Drop the oldest lines beyond TERMINAL_MAX_BLOCKS.
+        
+        One range removal per flush; QPlainTextEdit's maximumBlockCount
+        removes lines one at a time, which is far slower for large bursts.
+        """
+        document = self.output_text.document()
+        extra = document.blockCount() - TERMINAL_MAX_BLOCKS
+        if extra > 0:
+            cursor = QTextCursor(document)
+            cursor.setPosition(document.findBlockByNumber(extra).position(), QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+    
+    def flush_output(self):
+        """Draw buffered process output and notices for detected prompts."""
+        self.flush_timer.stop()
+        if not self._pending:
+            return
+        text = "".join(self._pending).replace("\r", "")
+        if len(text) > TERMINAL_MAX_PENDING:
+            # More arrived in one frame than the view keeps; show the newest
+            skipped = len(text) - TERMINAL_MAX_PENDING
+            text = f"[... {skipped:,} characters of output skipped ...]\n" + text[skipped:]
+        self._pending = []
+        self._pending_size = 0
+        prompts = self._stdout.take_prompts() | self._stderr.take_prompts()
+        
+        self._write(text)
+        
+        # Make input field visible and focused when any output appears
+        # This ensures users can always type if needed
+        if text.strip() and self.input_line.isHidden():
+            self.set_input_visible(True)
+        
+        for kind in ('password', 'confirm', 'error'):
+            if kind in prompts:
+                if kind != 'error':
+                    self.set_input_visible(True)
+                self._write(PROMPT_NOTICES[kind] + "\n", new_line=True)
+    
+    def _buffer_output(self, stream: _OutputStream, data: bytes):
+        """Queue process output for the next flush."""
+        text = stream.feed(data)
+        if not text:
+            return
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size > 2 * TERMINAL_MAX_PENDING:
+            # Keep the buffer bounded during a burst; flush_output trims the rest
+            joined = "".join(self._pending)[-TERMINAL_MAX_PENDING - 1:]
+            self._pending = [joined]
+            self._pending_size = len(joined)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def _new_streams(self):
+        # Password prompts sometimes come through stdout too
+        self._stdout = _OutputStream({
+            'password': SSH_PASSWORD_PROMPTS,
+            'confirm': SSH_CONFIRMATION_PROMPTS,
+        })
+        self._stderr = _OutputStream({
+            'password': SSH_STDERR_PASSWORD_PROMPTS,
+            'confirm': SSH_CONFIRMATION_PROMPTS,
+            'error': SSH_ERROR_PATTERNS,
+        })
         
     def send_input(self):
         """Send password input to SSH process."""
@@ -132,6 +270,7 @@ class SSHTerminalWidget(QWidget):
     def start_ssh_process(self, cmd: list[str]) -> QProcess:
         """Start SSH process and handle I/O."""
         self.process = QProcess(self)
+        self._new_streams()
         self.process.setProgram(cmd[0])
         self.process.setArguments(cmd[1:])
         
@@ -147,52 +286,11 @@ class SSHTerminalWidget(QWidget):
     
     def handle_stdout(self):
         """Handle SSH process stdout."""
-        data = self.process.readAllStandardOutput().data().decode()
-        self.append_output(data)
-        
-        # Make input field visible and focused when any output appears
-        # This ensures users can always type if needed
-        if data.strip():
-            self.set_input_visible(True)
-        
-        # Sometimes password prompts come through stdout too
-        data_lower = data.lower().strip()
-        
-        if any(prompt in data_lower for prompt in SSH_PASSWORD_PROMPTS):
-            self.set_input_visible(True)
-            self.append_output("👆 Password prompt detected - please enter your password below:")
-        
-        # Check for confirmation prompts in stdout too
-        if any(prompt in data_lower for prompt in SSH_CONFIRMATION_PROMPTS):
-            self.set_input_visible(True)
-            self.append_output("👆 SSH confirmation required - type 'yes' or 'no':")
+        self._buffer_output(self._stdout, self.process.readAllStandardOutput().data())
     
     def handle_stderr(self):
-        """Handle SSH process stderr."""
-        data = self.process.readAllStandardError().data().decode()
-        self.append_output(data)
-        
-        # Make input field visible when any stderr output appears
-        # SSH password prompts often come through stderr
-        if data.strip():
-            self.set_input_visible(True)
-        
-        # Check if password is being requested
-        data_lower = data.lower().strip()
-        
-        # Check for any password-related prompts
-        if any(prompt in data_lower for prompt in SSH_STDERR_PASSWORD_PROMPTS):
-            self.set_input_visible(True)
-            self.append_output("👆 Password prompt detected - please enter your password below:")
-        
-        # Also check if SSH is asking for confirmation
-        if any(prompt in data_lower for prompt in SSH_CONFIRMATION_PROMPTS):
-            self.set_input_visible(True)
-            self.append_output("👆 SSH confirmation required - type 'yes' or 'no':")
-        
-        # Check for SSH error messages
-        if any(error in data_lower for error in SSH_ERROR_PATTERNS):
-            self.append_output("⚠️  SSH connection issue detected. Check your credentials and network connection.")
+        """Handle SSH process stderr (where ssh writes most prompts)."""
+        self._buffer_output(self._stderr, self.process.readAllStandardError().data())
     
     def handle_finished(self, exit_code: int):
         """Handle SSH process completion."""
@@ -202,12 +300,15 @@ class SSHTerminalWidget(QWidget):
     
     def stop_process(self):
         """Stop the SSH process."""
+        self.flush_output()
         if self.process:
             self.process.kill()
             self.process = None
     
     def clear_output(self):
         """Clear the terminal output."""
+        self._pending = []
+        self._pending_size = 0
         self.output_text.clear()
         self.append_output("SSH Terminal Ready")
         self.append_output("=" * 50)
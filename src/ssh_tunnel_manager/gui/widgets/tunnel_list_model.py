@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Tunnel List Model/View
+Virtualized tunnel list for large inventories
+"""
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
+    QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate,
+    QStyleOptionViewItem, QStyle, QMenu
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QSortFilterProxyModel, QModelIndex,
+    QRect, QTimer
+)
+from PySide6.QtGui import QColor, QPainter, QBrush, QCursor
+
+from ..styles.professional_theme import COLORS
+
+
+class TunnelListModel(QAbstractTableModel):
+    """Table model over tunnel configurations and live tunnel state.
+
+    Rows are computed on demand in data(), so no per-tunnel widgets or items
+    exist; the view only asks for the rows it is painting.
+    """
+
+    COLUMNS = ["Name", "Status", "Type", "Local Port", "Remote", "SSH Host", "Description"]
+    COL_NAME, COL_STATUS, COL_TYPE, COL_LOCAL_PORT, COL_REMOTE, COL_SSH_HOST, COL_DESCRIPTION = range(7)
+
+    # Custom roles
+    ConfigRole = Qt.UserRole + 1   # TunnelConfig for the row
+    StatusRole = Qt.UserRole + 2   # 'running', 'starting', 'error' or 'stopped'
+    SortRole = Qt.UserRole + 3     # Natural sort key (ints for ports)
+
+    STATUS_LABELS = {
+        'running': "Running",
+        'starting': "Starting",
+        'error': "Error",
+        'stopped': "Stopped",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: list[str] = []
+        self._rows: dict[str, int] = {}  # name -> row, for per-row status updates
+        self._configs: dict = {}
+        self._active_tunnels: dict = {}
+        self._search_text: dict[str, str] = {}
+
+    # ------------------------------------------------------------------ #
+    # Qt model interface
+    # ------------------------------------------------------------------ #
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        name = self._names[index.row()]
+        config = self._configs.get(name)
+        if config is None:
+            return None
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == self.COL_STATUS:
+                return self.STATUS_LABELS[self.tunnel_status(name)]
+            return self._display_text(name, config, column)
+        if role == self.SortRole:
+            if column == self.COL_LOCAL_PORT:
+                return config.local_port
+            if column == self.COL_STATUS:
+                return self.tunnel_status(name)
+            return self._display_text(name, config, column).lower()
+        if role == self.ConfigRole:
+            return config
+        if role == self.StatusRole:
+            return self.tunnel_status(name)
+        if role == Qt.TextAlignmentRole and column in (self.COL_TYPE, self.COL_LOCAL_PORT):
+            return int(Qt.AlignCenter)
+        if role == Qt.ToolTipRole and column == self.COL_NAME:
+            return config.get_connection_string()
+        return None
+
+    # ------------------------------------------------------------------ #
+    # Updates
+    # ------------------------------------------------------------------ #
+
+    def set_tunnels(self, configs: dict, active_tunnels: dict):
+        """Reconcile the model with the current configurations.
+
+        Only added/removed rows are inserted/removed; remaining rows get a
+        single dataChanged for the whole table.
+        """
+        self._configs = configs
+        self._active_tunnels = active_tunnels
+
+        # Remove rows for deleted tunnels (contiguous runs, bottom-up)
+        row = len(self._names) - 1
+        while row >= 0:
+            if self._names[row] in configs:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._names[row] not in configs:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            for removed in self._names[row + 1:last + 1]:
+                self._search_text.pop(removed, None)
+            del self._names[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # Append rows for new tunnels
+        known = set(self._names)
+        added = [name for name in configs if name not in known]
+        if added:
+            first = len(self._names)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._names.extend(added)
+            self.endInsertRows()
+
+        self._rows = {name: row for row, name in enumerate(self._names)}
+
+        # Configs may have been edited in place; drop cached search keys
+        self._search_text.clear()
+        if self._names:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._names) - 1, len(self.COLUMNS) - 1)
+            )
+
+    def update_status(self, names):
+        """Repaint only the status cells for the given tunnels."""
+        for name in names:
+            row = self._rows.get(name)
+            if row is not None:
+                index = self.index(row, self.COL_STATUS)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole, self.StatusRole])
+
+    def tunnel_status(self, name: str) -> str:
+        """Get the status key for a tunnel."""
+        tunnel = self._active_tunnels.get(name)
+        if tunnel is None:
+            return 'stopped'
+        if tunnel.is_running:
+            return 'running'
+        if tunnel.status == tunnel.STATUS_STARTING:
+            return 'starting'
+        if tunnel.status == tunnel.STATUS_ERROR:
+            return 'error'
+        return 'stopped'
+
+    def config_name(self, row: int) -> str:
+        """Get the tunnel name for a source row."""
+        return self._names[row] if 0 <= row < len(self._names) else ""
+
+    def search_text(self, row: int) -> str:
+        """Get the cached lower-case text searched by the filter proxy."""
+        name = self._names[row]
+        text = self._search_text.get(name)
+        if text is None:
+            config = self._configs[name]
+            text = " ".join(
+                self._display_text(name, config, column)
+                for column in range(len(self.COLUMNS)) if column != self.COL_STATUS
+            ).lower()
+            self._search_text[name] = text
+        return text
+
+    @staticmethod
+    def _display_text(name: str, config, column: int) -> str:
+        """Get the display text for a non-status column."""
+        if column == TunnelListModel.COL_NAME:
+            return name
+        if column == TunnelListModel.COL_TYPE:
+            return config.tunnel_type.upper()
+        if column == TunnelListModel.COL_LOCAL_PORT:
+            return str(config.local_port)
+        if column == TunnelListModel.COL_REMOTE:
+            if config.tunnel_type == 'dynamic':
+                return "SOCKS Proxy"
+            return f"{config.remote_host}:{config.remote_port}"
+        if column == TunnelListModel.COL_SSH_HOST:
+            return f"{config.ssh_user}@{config.ssh_host}:{config.ssh_port}"
+        if column == TunnelListModel.COL_DESCRIPTION:
+            return config.description
+        return ""
+
+
+class TunnelFilterProxyModel(QSortFilterProxyModel):
+    """Sort/filter proxy with free-text search and a status filter."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needles: list[str] = []
+        self._status_filter = ""
+        self.setSortRole(TunnelListModel.SortRole)
+        self.setDynamicSortFilter(False)
+
+    def set_search_text(self, text: str):
+        """Filter rows containing every whitespace-separated term."""
+        self._needles = text.lower().split()
+        self.invalidateFilter()
+
+    @property
+    def status_filter(self) -> str:
+        return self._status_filter
+
+    def set_status_filter(self, status: str):
+        """Only show tunnels with the given status key ('' shows all)."""
+        self._status_filter = status
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        model = self.sourceModel()
+        if self._status_filter:
+            name = model.config_name(source_row)
+            if model.tunnel_status(name) != self._status_filter:
+                return False
+        if self._needles:
+            haystack = model.search_text(source_row)
+            return all(needle in haystack for needle in self._needles)
+        return True
+
+
+class TunnelStatusDelegate(QStyledItemDelegate):
+    """Paints the status column as a colored pill."""
+
+    STATUS_COLORS = {
+        'running': COLORS['status_active'],
+        'starting': COLORS['status_pending'],
+        'error': COLORS['status_error'],
+        'stopped': COLORS['status_inactive'],
+    }
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        # Draw the selection/alternate background without the text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style:
+            style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        status = index.data(TunnelListModel.StatusRole) or 'stopped'
+        color = QColor(self.STATUS_COLORS.get(status, COLORS['status_inactive']))
+        text = index.data(Qt.DisplayRole) or ""
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        metrics = painter.fontMetrics()
+        pill_width = metrics.horizontalAdvance(text) + 24
+        pill_height = metrics.height() + 6
+        rect = QRect(
+            option.rect.x() + 6,
+            option.rect.center().y() - pill_height // 2,
+            min(pill_width, option.rect.width() - 12),
+            pill_height
+        )
+        fill = QColor(color)
+        fill.setAlpha(40)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(fill))
+        painter.drawRoundedRect(rect, pill_height / 2, pill_height / 2)
+
+        # Status dot + label
+        dot = pill_height // 3
+        painter.setBrush(QBrush(color))
+        painter.drawEllipse(rect.x() + 8, rect.center().y() - dot // 2, dot, dot)
+        painter.setPen(color)
+        painter.drawText(rect.adjusted(8 + dot + 4, 0, 0, 0), Qt.AlignVCenter | Qt.AlignLeft, text)
+        painter.restore()
+
+
+class TunnelListView(QWidget):
+    """Virtualized, searchable tunnel list for large inventories.
+
+    Uses a QTableView over TunnelListModel, so memory and paint time depend
+    on the visible rows rather than the number of tunnels.
+    """
+
+    # Signals
+    selection_changed = Signal(bool, str, bool)  # has_selection, config_name, is_active
+    start_tunnel = Signal(str)
+    stop_tunnel = Signal(str)
+    edit_tunnel = Signal(str)
+    delete_tunnel = Signal(str)
+    files_tunnel = Signal(str)
+    test_tunnel = Signal(str)
+
+    ROW_HEIGHT = 36
+    SEARCH_DELAY_MS = 150
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = TunnelListModel(self)
+        self.proxy = TunnelFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        # Debounce typing so each keystroke doesn't refilter the whole list
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Setup the list UI."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        # Search and filter row
+        filter_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search tunnels (name, host, port, description)...")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(lambda _: self._search_timer.start())
+        filter_layout.addWidget(self.search_input)
+
+        self.status_filter = QComboBox()
+        self.status_filter.addItem("All", "")
+        for key, label in TunnelListModel.STATUS_LABELS.items():
+            self.status_filter.addItem(label, key)
+        self.status_filter.currentIndexChanged.connect(
+            lambda _: self.proxy.set_status_filter(self.status_filter.currentData())
+        )
+        filter_layout.addWidget(self.status_filter)
+
+        self.count_label = QLabel("0 configured")
+        self.count_label.setObjectName("tertiary")
+        filter_layout.addWidget(self.count_label)
+        layout.addLayout(filter_layout)
+
+        # Table view
+        self.view = QTableView()
+        self.view.setModel(self.proxy)
+        self.view.setItemDelegateForColumn(TunnelListModel.COL_STATUS, TunnelStatusDelegate(self.view))
+        self.view.setAlternatingRowColors(True)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.view.setShowGrid(False)
+        self.view.setSortingEnabled(True)
+        self.view.setWordWrap(False)
+
+        # Fixed row heights keep layout O(1) regardless of row count
+        vertical_header = self.view.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.ROW_HEIGHT)
+
+        header = self.view.horizontalHeader()
+        header.setStretchLastSection(True)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.resizeSection(TunnelListModel.COL_NAME, 200)
+        header.resizeSection(TunnelListModel.COL_STATUS, 110)
+        header.resizeSection(TunnelListModel.COL_TYPE, 80)
+        header.resizeSection(TunnelListModel.COL_LOCAL_PORT, 90)
+        header.resizeSection(TunnelListModel.COL_REMOTE, 180)
+        header.resizeSection(TunnelListModel.COL_SSH_HOST, 220)
+
+        self.view.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.view.doubleClicked.connect(self._on_double_clicked)
+        self.view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.view.customContextMenuRequested.connect(self._show_context_menu)
+
+        layout.addWidget(self.view)
+
+    def update_tunnels(self, tunnels_dict: dict, active_tunnels: dict):
+        """Update the list from configurations and live tunnel state."""
+        self.model.set_tunnels(tunnels_dict, active_tunnels)
+        self.proxy.invalidate()
+        self._update_count(active_tunnels)
+
+    def _update_count(self, active_tunnels: dict):
+        active_count = len([t for t in active_tunnels.values() if t.is_running])
+        self.count_label.setText(f"{self.model.rowCount()} configured, {active_count} active")
+
+    def update_status(self, names, active_tunnels: dict):
+        """Repaint status for the given tunnels only (monitor ticks).
+
+        Unlike update_tunnels this keeps the search cache and doesn't
+        refilter, unless a status filter is set and so depends on it.
+        """
+        self.model.update_status(names)
+        if self.proxy.status_filter:
+            self.proxy.invalidateFilter()
+        self._update_count(active_tunnels)
+        self._on_selection_changed()
+
+    def get_selected_config_name(self) -> str:
+        """Get the currently selected config name."""
+        index = self.view.currentIndex()
+        if not index.isValid():
+            return ""
+        return self.model.config_name(self.proxy.mapToSource(index).row())
+
+    def _apply_search(self):
+        """Apply the debounced search text."""
+        self.proxy.set_search_text(self.search_input.text())
+
+    def _on_selection_changed(self):
+        """Handle selection changes."""
+        config_name = self.get_selected_config_name()
+        if not config_name:
+            self.selection_changed.emit(False, "", False)
+            return
+        is_active = self.model.tunnel_status(config_name) == 'running'
+        self.selection_changed.emit(True, config_name, is_active)
+
+    def _on_double_clicked(self, index: QModelIndex):
+        """Toggle a tunnel on double click."""
+        config_name = self.model.config_name(self.proxy.mapToSource(index).row())
+        if not config_name:
+            return
+        if self.model.tunnel_status(config_name) == 'running':
+            self.stop_tunnel.emit(config_name)
+        else:
+            self.start_tunnel.emit(config_name)
+
+    def _show_context_menu(self, position):
+        """Show context menu for the selected tunnel."""
+        config_name = self.get_selected_config_name()
+        if not config_name:
+            return
+
+        is_active = self.model.tunnel_status(config_name) == 'running'
+        menu = QMenu(self)
+        if is_active:
+            stop_action = menu.addAction("Stop")
+            files_action = menu.addAction("Files")
+            test_action = menu.addAction("Test")
+            actions = {stop_action: self.stop_tunnel, files_action: self.files_tunnel,
+                       test_action: self.test_tunnel}
+        else:
+            start_action = menu.addAction("Start")
+            edit_action = menu.addAction("Edit")
+            menu.addSeparator()
+            delete_action = menu.addAction("Delete")
+            actions = {start_action: self.start_tunnel, edit_action: self.edit_tunnel,
+                       delete_action: self.delete_tunnel}
+
+        action = menu.exec(QCursor.pos())
+        if action in actions:
+            actions[action].emit(config_name)
@@ -3,11 +3,12 @@
 SSH Tunnel Manager - Utils Package
 """
 
-from .connection_tester import ConnectionTester
+from .connection_tester import ConnectionTester, TunnelTestResult
 from .rtsp_viewer import RTSPViewer, RTSPTunnelHelper
 
 __all__ = [
     'ConnectionTester',
+    'TunnelTestResult',
     'RTSPViewer', 
     'RTSPTunnelHelper'
 ]
@@ -4,12 +4,33 @@ SSH Tunnel Manager - Connection Testing Utilities
 """
 
 import socket
+import time
 import urllib.request
 import urllib.error
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, List, Mapping, Optional
 
 from ..core.models import TunnelConfig
-from ..core.constants import HTTP_PORTS, HTTPS_PORTS, RTSP_PORTS
+from ..core.constants import (
+    HTTP_PORTS, HTTPS_PORTS, RTSP_PORTS,
+    CONNECTION_TEST_TIMEOUT, CONNECTION_TEST_MAX_WORKERS
+)
+
+# SOCKS5 greeting offering "no authentication", and the reply accepting it
+_SOCKS5_GREETING = b"\x05\x01\x00"
+_SOCKS5_ACCEPT = b"\x05\x00"
+
+
+@dataclass
+class TunnelTestResult:
+    """Outcome of testing one tunnel."""
+    name: str
+    success: bool
+    message: str
+    latency: Optional[float] = None  # ms to connect to the local port
+    protocol: Optional[str] = None  # HTTP, HTTPS, RTSP, SOCKS5 or TCP; None if not detected
+    error: Optional[str] = None  # why the test failed
 
 
 class ConnectionTester:
@@ -18,52 +39,135 @@ class ConnectionTester:
     @staticmethod
     def test_local_port(port: int, host: str = "localhost", timeout: int = 2) -> bool:
         """Test if a local port is accessible."""
+        return ConnectionTester._connect_time(port, host, timeout) is not None
+    
+    @staticmethod
+    def _connect_time(port: int, host: str = "localhost", timeout: float = 2) -> Optional[float]:
+        """Milliseconds taken to connect to a port, or None if it can't be reached."""
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(timeout)
+            started = time.perf_counter()
             result = sock.connect_ex((host, port))
+            elapsed = (time.perf_counter() - started) * 1000
             sock.close()
-            return result == 0
+            return elapsed if result == 0 else None
         except Exception:
-            return False
+            return None
     
     @staticmethod
-    def test_tunnel_connection(config: TunnelConfig) -> tuple[bool, str]:
+    def test_tunnel_connection(config: TunnelConfig,
+                               timeout: float = CONNECTION_TEST_TIMEOUT) -> tuple[bool, str]:
         """Test the actual tunnel connection."""
+        result = ConnectionTester.check_tunnel(config, timeout)
+        return result.success, result.message
+    
+    @staticmethod
+    def check_tunnel(config: TunnelConfig,
+                     timeout: float = CONNECTION_TEST_TIMEOUT) -> TunnelTestResult:
+        """Test a tunnel through its local port and report latency and protocol.
+        
+        For remote tunnels the local port is the target the server forwards
+        to, so the test checks that the forwarded service is up here.
+        timeout bounds each network step (the local connect and each
+        service request), not the test as a whole.
+        """
+        name = config.name
         try:
-            if not ConnectionTester.test_local_port(config.local_port):
-                return False, f"Local port {config.local_port} is not accessible"
+            latency = ConnectionTester._connect_time(config.local_port, timeout=min(2, timeout))
+            if latency is None:
+                message = f"Local port {config.local_port} is not accessible"
+                return TunnelTestResult(name, False, message, error=message)
             
             # Test based on service type
-            if config.remote_port in RTSP_PORTS:
-                success, message = ConnectionTester._test_rtsp_service(config.local_port)
+            if config.tunnel_type == 'dynamic':
+                success, message, protocol = ConnectionTester._test_socks_service(
+                    config.local_port, timeout)
+            elif config.remote_port in RTSP_PORTS:
+                success, message, protocol = ConnectionTester._test_rtsp_service(
+                    config.local_port, timeout)
             elif config.remote_port in HTTP_PORTS + HTTPS_PORTS:
-                success, message = ConnectionTester._test_http_service(config.local_port)
+                success, message, protocol = ConnectionTester._test_http_service(
+                    config.local_port, timeout)
             else:
                 # Generic port test
-                success = True
+                success, protocol = True, "TCP"
                 message = f"Port {config.local_port} is accessible"
             
-            return success, message
+            return TunnelTestResult(name, success, message, latency, protocol,
+                                    None if success else message)
+            
+        except Exception as e:
+            message = f"Connection test failed: {str(e)}"
+            return TunnelTestResult(name, False, message, error=str(e))
+    
+    @staticmethod
+    def test_all(active_tunnels: Mapping, timeout: float = CONNECTION_TEST_TIMEOUT,
+                 max_workers: int = CONNECTION_TEST_MAX_WORKERS,
+                 on_result: Optional[Callable[[TunnelTestResult], None]] = None
+                 ) -> List[TunnelTestResult]:
+        """Test every running tunnel of active_tunnels (name -> TunnelProcess) at once."""
+        configs = [tunnel.config for tunnel in list(active_tunnels.values()) if tunnel.is_running]
+        return ConnectionTester.test_configs(configs, timeout, max_workers, on_result)
+
+    @staticmethod
+    def test_configs(configs: List[TunnelConfig], timeout: float = CONNECTION_TEST_TIMEOUT,
+                     max_workers: int = CONNECTION_TEST_MAX_WORKERS,
+                     on_result: Optional[Callable[[TunnelTestResult], None]] = None
+                     ) -> List[TunnelTestResult]:
+        """Test the tunnels of configs at once, whether or not they still run.
+        
+        Tests run on a pool of up to max_workers threads, so with no more
+        tunnels than that the run takes as long as the slowest single test
+        rather than the sum of them. on_result is called (from a pool
+        thread) as each test finishes. Returns the results sorted by name.
+        """
+        if not configs:
+            return []
+        results = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(configs)),
+                                thread_name_prefix="tunnel-test") as executor:
+            futures = [executor.submit(ConnectionTester.check_tunnel, config, timeout)
+                       for config in configs]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        return sorted(results, key=lambda result: result.name)
+    
+    @staticmethod
+    def _test_socks_service(local_port: int, timeout: float = CONNECTION_TEST_TIMEOUT
+                            ) -> tuple[bool, str, Optional[str]]:
+        """Test that a dynamic tunnel answers as a SOCKS5 proxy."""
+        try:
+            with socket.create_connection(("localhost", local_port), timeout=timeout) as sock:
+                sock.sendall(_SOCKS5_GREETING)
+                reply = sock.recv(2)
+            if reply == _SOCKS5_ACCEPT:
+                return True, f"SOCKS proxy available on localhost:{local_port}", "SOCKS5"
+            return False, f"Port {local_port} did not answer as a SOCKS5 proxy", None
             
         except Exception as e:
-            return False, f"Connection test failed: {str(e)}"
+            return False, f"SOCKS test failed: {str(e)}", None
     
     @staticmethod
-    def _test_rtsp_service(local_port: int) -> tuple[bool, str]:
+    def _test_rtsp_service(local_port: int, timeout: float = CONNECTION_TEST_TIMEOUT
+                           ) -> tuple[bool, str, Optional[str]]:
         """Test RTSP service connectivity."""
         try:
             # RTSP uses TCP initially
-            if ConnectionTester.test_local_port(local_port, timeout=3):
+            if ConnectionTester.test_local_port(local_port, timeout=timeout):
                 rtsp_url = f"rtsp://localhost:{local_port}/live/0"
-                return True, f"RTSP service responding. Try: {rtsp_url}"
-            return False, "RTSP service not responding"
+                return True, f"RTSP service responding. Try: {rtsp_url}", "RTSP"
+            return False, "RTSP service not responding", None
             
         except Exception as e:
-            return False, f"RTSP test failed: {str(e)}"
+            return False, f"RTSP test failed: {str(e)}", None
     
     @staticmethod
-    def _test_http_service(local_port: int) -> tuple[bool, str]:
+    def _test_http_service(local_port: int, timeout: float = CONNECTION_TEST_TIMEOUT
+                           ) -> tuple[bool, str, Optional[str]]:
         """Test HTTP service connectivity."""
         try:
             # Try HTTP first, then HTTPS
@@ -73,20 +177,22 @@ class ConnectionTester:
                     req = urllib.request.Request(url)
                     req.add_header('User-Agent', 'SSH-Tunnel-Tester/1.0')
                     
-                    with urllib.request.urlopen(req, timeout=3) as response:
-                        return True, f"{protocol.upper()} service responding: {url}"
+                    with urllib.request.urlopen(req, timeout=timeout) as response:
+                        message = f"{protocol.upper()} service responding: {url}"
+                        return True, message, protocol.upper()
                         
                 except urllib.error.HTTPError as e:
                     # Even HTTP errors mean the service is responding
                     if e.code in [200, 301, 302, 401, 403, 404]:
-                        return True, f"{protocol.upper()} service responding (HTTP {e.code}): {url}"
+                        message = f"{protocol.upper()} service responding (HTTP {e.code}): {url}"
+                        return True, message, protocol.upper()
                 except:
                     continue
                     
-            return False, "HTTP/HTTPS service not responding"
+            return False, "HTTP/HTTPS service not responding", None
             
         except Exception as e:
-            return False, f"HTTP test failed: {str(e)}"
+            return False, f"HTTP test failed: {str(e)}", None
     
     @staticmethod
     def get_service_urls(config: TunnelConfig) -> list[str]: